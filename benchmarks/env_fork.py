@@ -0,0 +1,80 @@
+"""
+Time to run many small design scripts against a library of templates,
+importing the library for each design against forking an environment
+that has imported it once.
+
+Run from the project root: python -m benchmarks.env_fork
+"""
+import argparse
+import contextlib
+import io
+import logging
+import pathlib
+import tempfile
+import time
+
+from rdfscript.core import Uri
+from rdfscript.env import Env
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+
+def write_library(directory, templates):
+    lines = ['@prefix lib = <http://eg/lib/>', '@prefix lib',
+             'Base(x)(role = x)']
+    for i in range(templates):
+        lines.append('Part%d(x)(Base(x)\n  kind = <http://eg/kinds/%d>)' % (i, i))
+    (directory / 'lib.rdfsh').write_text('\n'.join(lines) + '\n')
+
+
+def design(n, templates):
+    lines = ['@prefix design = <http://eg/design%d/>' % n, '@prefix design']
+    for i in range(10):
+        lines.append('part%d is a lib.Part%d(%d)' % (i, (n + i) % templates, i))
+    return RDFScriptParser(filename='design').parse('\n'.join(lines) + '\n')
+
+
+def time_imports(directory, designs):
+    start = time.perf_counter()
+    for (n, forms) in enumerate(designs):
+        env = Env(paths=[directory])
+        env.eval_import(Uri('lib'))
+        env.interpret(forms)
+    return (time.perf_counter() - start) / len(designs)
+
+
+def time_forks(directory, designs):
+    prelude = Env(paths=[directory])
+    prelude.eval_import(Uri('lib'))
+
+    start = time.perf_counter()
+    for forms in designs:
+        env = prelude.fork()
+        env.interpret(forms)
+    return (time.perf_counter() - start) / len(designs)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Environment fork benchmark.")
+    parser.add_argument('-t', '--templates', type=int, default=300,
+                        help="Number of templates in the library")
+    parser.add_argument('-d', '--designs', type=int, default=50,
+                        help="Number of design scripts run")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    logging.disable(logging.CRITICAL)
+    args = benchmark_args()
+
+    with tempfile.TemporaryDirectory() as name, \
+            contextlib.redirect_stdout(io.StringIO()):
+        directory = pathlib.Path(name)
+        write_library(directory, args.templates)
+        designs = [design(n, args.templates) for n in range(args.designs)]
+
+        imports = time_imports(directory, designs)
+        forks = time_forks(directory, designs)
+
+    print("import per design: %.1fms" % (imports * 1e3))
+    print("fork per design: %.1fms" % (forks * 1e3))
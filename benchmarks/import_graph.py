@@ -0,0 +1,60 @@
+"""
+Time to build the static import graph of a generated library tree,
+compared with parsing every file in it.
+
+Run from the project root: python -m benchmarks.import_graph
+"""
+import argparse
+import pathlib
+import tempfile
+import time
+
+from rdfscript.imports import import_graph
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+from .parse_scaling import generate_script
+
+
+def generate_tree(directory, files, forms):
+    """
+    A library of files in directory, each importing the two before it,
+    and a top-level script that imports the last one.
+    """
+    root = pathlib.Path(directory)
+    for n in range(files):
+        uses = ''.join('use <lib/module%d>\n' % m for m in (n - 1, n - 2) if m >= 0)
+        path = root / 'lib' / ('module%d.rdfsh' % n)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(uses + generate_script(forms))
+
+    top = root / 'top.rdfsh'
+    top.write_text('use <lib/module%d>\n' % (files - 1))
+    return top
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Import graph benchmark.")
+    parser.add_argument('-f', '--files', type=int, default=50,
+                        help="Number of library files")
+    parser.add_argument('-n', '--forms', type=int, default=200,
+                        help="Number of generated forms in each file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    with tempfile.TemporaryDirectory() as directory:
+        top = generate_tree(directory, args.files, args.forms)
+
+        start = time.perf_counter()
+        graph = import_graph(top)
+        scanned = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for path in graph:
+            RDFScriptParser(filename=str(path)).parse(path.read_text())
+        parsed = time.perf_counter() - start
+
+    print("files: %d, import graph: %.1fms, full parse: %.1fms" %
+          (len(graph), scanned * 1000, parsed * 1000))
@@ -0,0 +1,69 @@
+"""
+Memory shared by interning symbol and URI strings in parsed names.
+
+Run from the project root: python -m benchmarks.interning
+Without interning every segment occurrence would be its own string, so
+the saving is the size of every occurrence beyond the first.
+"""
+import argparse
+import sys
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.core import (Name,
+                            Uri)
+from rdfscript.template import Expansion, Property
+
+from .parse_scaling import generate_script
+
+
+def segments(node):
+    if isinstance(node, Name):
+        for name in node.names:
+            if isinstance(name, str):
+                yield name
+            elif isinstance(name, Uri):
+                yield name.uri
+    elif isinstance(node, Expansion):
+        yield from segments(node.name)
+        yield from segments(node.template)
+        for arg in node.args:
+            yield from segments(arg.value)
+        for statement in node.body:
+            yield from segments(statement)
+    elif isinstance(node, Property):
+        yield from segments(node.name)
+        yield from segments(node.value)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Symbol interning benchmark.")
+    parser.add_argument('-n', '--forms', type=int, default=1000000,
+                        help="Number of generated expansions to parse")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    parser = RDFScriptParser(filename='benchmark',
+                             lexer='scanner',
+                             track_locations=False)
+
+    occurrences = 0
+    unshared_bytes = 0
+    distinct = {}
+    for form in parser.parse_iter(generate_script(args.forms)):
+        for segment in segments(form):
+            occurrences += 1
+            unshared_bytes += sys.getsizeof(segment)
+            distinct[id(segment)] = segment
+
+    shared_bytes = sum(sys.getsizeof(s) for s in distinct.values())
+    print("expansions:            %d" % args.forms)
+    print("segment occurrences:   %d" % occurrences)
+    print("distinct str objects:  %d" % len(distinct))
+    print("bytes without sharing: %d" % unshared_bytes)
+    print("bytes with sharing:    %d" % shared_bytes)
+    print("saved:                 %d (%.1f%%)"
+          % (unshared_bytes - shared_bytes,
+             100.0 * (unshared_bytes - shared_bytes) / unshared_bytes))
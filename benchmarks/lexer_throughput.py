@@ -0,0 +1,45 @@
+"""
+Lexer throughput in tokens per second for each lexer engine.
+
+Run from the project root: python -m benchmarks.lexer_throughput
+"""
+import argparse
+import time
+
+from rdfscript.rdfscriptparser import (LEXER_ENGINES,
+                                       make_lexer)
+
+from .parse_scaling import generate_script
+
+
+def time_lex(script, engine):
+    lexer = make_lexer(filename='benchmark', engine=engine)
+    lexer.input(script)
+
+    count = 0
+    start = time.perf_counter()
+    token = lexer.token()
+    while token is not None:
+        count += 1
+        token = lexer.token()
+    elapsed = time.perf_counter() - start
+
+    return (count, elapsed)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Lexer throughput benchmark.")
+    parser.add_argument('-n', '--forms', type=int, default=100000,
+                        help="Number of generated top-level forms to lex")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    script = generate_script(args.forms)
+
+    print("%10s %12s %12s %14s" % ('engine', 'tokens', 'seconds', 'tokens/sec'))
+    for engine in LEXER_ENGINES:
+        (count, elapsed) = time_lex(script, engine)
+        print("%10s %12d %12.3f %14.0f" % (engine, count, elapsed, count / elapsed))
@@ -0,0 +1,66 @@
+"""
+Time to add literal-heavy triples to the graph, where a few literal
+values, such as versions and roles, recur across most of the triples.
+
+Run from the project root: python -m benchmarks.literal_terms
+"""
+import argparse
+import time
+
+from rdfscript.core import (Uri,
+                            Value)
+from rdfscript.rdf_data import RDFData
+
+
+def generate_triples(n):
+    """n parts, each with a display id, a version, a length and a flag."""
+    version = Uri('http://sbols.org/v2#version')
+    display = Uri('http://sbols.org/v2#displayId')
+    length = Uri('http://eg/length')
+    circular = Uri('http://eg/circular')
+
+    triples = []
+    for i in range(n):
+        part = Uri('http://eg/part%d' % i)
+        triples += [(part, display, Value('part%d' % i)),
+                    (part, version, Value('1')),
+                    (part, length, Value(i % 100)),
+                    (part, circular, Value(i % 2 == 0))]
+    return triples
+
+
+def time_adds(triples):
+    data = RDFData()
+    start = time.perf_counter()
+    for (s, p, o) in triples:
+        data.add(s, p, o)
+    return time.perf_counter() - start
+
+
+def time_conversions(triples, rounds):
+    data = RDFData()
+    start = time.perf_counter()
+    for r in range(rounds):
+        for (s, p, o) in triples:
+            data.to_rdf(o)
+    return (time.perf_counter() - start) / (rounds * len(triples))
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Literal term benchmark.")
+    parser.add_argument('-n', '--parts', type=int, default=25000,
+                        help="Number of parts, of four triples each")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    triples = generate_triples(args.parts)
+
+    elapsed = time_adds(triples)
+    print("add: %d triples in %.2fs (%.1fus per triple)"
+          % (len(triples), elapsed, elapsed * 1e6 / len(triples)))
+
+    per_literal = time_conversions(triples, 5)
+    print("to_rdf: %.0fns per literal" % (per_literal * 1e9))
@@ -0,0 +1,49 @@
+"""
+Parse time and AST memory with and without location tracking.
+
+Run from the project root: python -m benchmarks.location_tracking
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+from .parse_scaling import generate_script
+
+
+def measure(script, track_locations):
+    parser = RDFScriptParser(filename='benchmark',
+                             track_locations=track_locations)
+
+    start = time.perf_counter()
+    forms = parser.parse(script)
+    elapsed = time.perf_counter() - start
+    del forms
+
+    gc.collect()
+    tracemalloc.start()
+    forms = parser.parse(script)
+    (retained, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (elapsed, retained)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Location tracking benchmark.")
+    parser.add_argument('-n', '--forms', type=int, default=20000,
+                        help="Number of top-level forms to parse")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    script = generate_script(args.forms)
+
+    print("%10s %12s %16s" % ('tracking', 'seconds', 'bytes per form'))
+    for tracking in [True, False]:
+        (elapsed, retained) = measure(script, tracking)
+        print("%10s %12.3f %16.1f" % (tracking, elapsed, retained / args.forms))
@@ -0,0 +1,63 @@
+"""
+Time to lex a single very large triple-quoted string, such as a
+sequence literal, with each lexer engine and with the streamed scanner.
+The time should grow linearly with the length of the literal.
+
+Run from the project root: python -m benchmarks.long_string
+"""
+import argparse
+import io
+import random
+import time
+
+from rdfscript.rdfscriptparser import (LEXER_ENGINES,
+                                       make_lexer)
+
+
+def generate_sequence(size, width=80):
+    bases = ''.join(random.choice('acgt') for i in range(size))
+    return '\n'.join(bases[i:i + width] for i in range(0, size, width))
+
+
+def generate_script(size):
+    return 'sequence = """%s"""\nafter = 1\n' % generate_sequence(size)
+
+
+def time_lex(script, engine, stream=False):
+    lexer = make_lexer(filename='benchmark', engine=engine)
+    start = time.perf_counter()
+    if stream:
+        lexer.input_stream(io.StringIO(script))
+    else:
+        lexer.input(script)
+
+    token = lexer.token()
+    while token is not None:
+        last = token
+        token = lexer.token()
+    elapsed = time.perf_counter() - start
+
+    return (last.lineno, elapsed)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Long string benchmark.")
+    parser.add_argument('-s', '--size', type=int, default=10 * 1024 * 1024,
+                        help="Number of characters in the largest literal")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    sizes = [args.size // 8, args.size // 4, args.size // 2, args.size]
+
+    print("%16s %12s %8s %12s" % ('engine', 'characters', 'lines', 'seconds'))
+    for size in sizes:
+        script = generate_script(size)
+        runs = [(engine, False) for engine in LEXER_ENGINES]
+        runs.append(('scanner', True))
+        for (engine, stream) in runs:
+            (lines, elapsed) = time_lex(script, engine, stream)
+            name = engine + (' (stream)' if stream else '')
+            print("%16s %12d %8d %12.3f" % (name, size, lines, elapsed))
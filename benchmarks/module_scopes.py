@@ -0,0 +1,79 @@
+"""
+Time to reload one library against rebuilding the environment that
+imports it, and to run a script between a snapshot and a restore.
+
+Run from the project root: python -m benchmarks.module_scopes
+"""
+import argparse
+import contextlib
+import io
+import logging
+import pathlib
+import tempfile
+import time
+
+from rdfscript.core import Uri
+from rdfscript.env import Env
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+
+def write_libraries(directory, libraries, symbols):
+    for i in range(libraries):
+        lines = ['@prefix lib%d = <http://eg/lib%d/>' % (i, i), '@prefix lib%d' % i]
+        lines += ['thing%d = <http://eg/things/%d/%d>' % (j, i, j) for j in range(symbols)]
+        (directory / ('lib%d.rdfsh' % i)).write_text('\n'.join(lines) + '\n')
+
+
+def build(directory, libraries):
+    env = Env(paths=[directory])
+    for i in range(libraries):
+        env.eval_import(Uri('lib%d' % i))
+    return env
+
+
+def time_script(env, forms, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        snapshot = env.snapshot()
+        env.interpret(forms)
+        env.restore(snapshot)
+    return (time.perf_counter() - start) / rounds
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Module scope benchmark.")
+    parser.add_argument('-l', '--libraries', type=int, default=20,
+                        help="Number of libraries imported")
+    parser.add_argument('-s', '--symbols', type=int, default=500,
+                        help="Number of symbols each library binds")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    logging.disable(logging.CRITICAL)
+    args = benchmark_args()
+
+    with tempfile.TemporaryDirectory() as name, \
+            contextlib.redirect_stdout(io.StringIO()):
+        directory = pathlib.Path(name)
+        write_libraries(directory, args.libraries, args.symbols)
+
+        start = time.perf_counter()
+        env = build(directory, args.libraries)
+        rebuild = time.perf_counter() - start
+
+        start = time.perf_counter()
+        env.eval_import(Uri('lib0'))
+        reload = time.perf_counter() - start
+
+        script = '\n'.join(['@prefix lib0'] +
+                           ['local%d = thing%d' % (j, j) for j in range(100)])
+        forms = list(RDFScriptParser(filename='design').parse(script))
+        per_run = time_script(env, forms, 20)
+        bound = len(env.bindings)
+
+    print("rebuild: %d libraries in %.0fms" % (args.libraries, rebuild * 1e3))
+    print("reload: one library in %.0fms" % (reload * 1e3))
+    print("script: %.1fms per run between snapshot and restore, %d symbols after"
+          % (per_run * 1e3, bound))
@@ -0,0 +1,73 @@
+"""
+Time to evaluate dotted names, as every property of every expansion
+does, in an environment with a default prefix and some bindings.
+
+Run from the project root: python -m benchmarks.name_resolution
+"""
+import argparse
+import time
+
+from rdfscript.core import (Name,
+                            Uri)
+from rdfscript.env import Env
+
+
+def make_env(bindings):
+    env = Env()
+    env.bind_prefix('sbol', Uri('http://sbols.org/v2#'))
+    env.bind_prefix('build', Uri('http://eg/build/'))
+    env.prefix = 'build'
+    for i in range(bindings):
+        env.assign(Uri('http://eg/build/part%d' % i), Uri('http://eg/parts/%d' % i))
+    return env
+
+
+names = [Name('sbol', 'participation'),
+         Name('sbol', 'role'),
+         Name('sbol', 'cdRole', 'SgRNA'),
+         Name('part7'),
+         Name('unbound', 'local')]
+
+
+# deeply dotted library names, resolved without the cache
+deep_names = [Name('sbol', 'cdRole', 'SgRNA'),
+              Name('sbol', 'cdRole', 'engineeredRegion', 'promoter', 'strong'),
+              Name('build', 'part7', 'sub', 'component', 'x'),
+              Name('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h')]
+
+
+def time_names(env, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        for name in names:
+            name.evaluate(env)
+    return (time.perf_counter() - start) / (rounds * len(names))
+
+
+def time_uncached(env, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        for name in deep_names:
+            name.resolve(env)
+    return (time.perf_counter() - start) / (rounds * len(deep_names))
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Name resolution benchmark.")
+    parser.add_argument('-r', '--rounds', type=int, default=20000,
+                        help="Number of times to evaluate each name")
+    parser.add_argument('-b', '--bindings', type=int, default=1000,
+                        help="Number of symbols bound in the environment")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    env = make_env(args.bindings)
+
+    per_name = time_names(env, args.rounds)
+    print("evaluate: %.0fns per name" % (per_name * 1e9))
+
+    per_name = time_uncached(env, args.rounds // 10)
+    print("resolve, uncached: %.0fns per deep name" % (per_name * 1e9))
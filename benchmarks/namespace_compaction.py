@@ -0,0 +1,78 @@
+"""
+Time to compact URIs to prefix and local part with thousands of bound
+prefixes, against a scan over every bound namespace.
+
+Run from the project root: python -m benchmarks.namespace_compaction
+"""
+import argparse
+import time
+
+from rdfscript.core import Uri
+from rdfscript.rdf_data import RDFData
+
+
+def make_data(prefixes):
+    data = RDFData(serializer='compact')
+    for i in range(prefixes):
+        data.bind_prefix('p%d' % i, Uri('http://eg.org/lib/%d/' % i))
+        data.bind_prefix('q%d' % i, Uri('http://eg.org/lib/%d/sub/' % i))
+    return data
+
+
+def make_uris(prefixes, count):
+    return [Uri('http://eg.org/lib/%d/%sthing%d' % (i % prefixes,
+                                                   'sub/' if i % 2 else '', i))
+            for i in range(count)]
+
+
+def scan_compact(data, uri):
+    best = None
+    for (prefix, namespace) in data._namespace_of.items():
+        if uri.uri.startswith(namespace) and (best is None or
+                                              len(namespace) > len(best[1])):
+            best = (prefix, namespace)
+    if best is None:
+        return None
+    return (best[0], uri.uri[len(best[1]):])
+
+
+def time_compact(compact, data, uris):
+    start = time.perf_counter()
+    for uri in uris:
+        compact(data, uri)
+    return (time.perf_counter() - start) / len(uris)
+
+
+def time_write(data, prefixes, triples):
+    uris = make_uris(prefixes, triples + 1)
+    for (s, o) in zip(uris, uris[1:]):
+        data.add(s, Uri('http://eg.org/lib/0/next'), o)
+
+    start = time.perf_counter()
+    data.serialise()
+    return time.perf_counter() - start
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Namespace compaction benchmark.")
+    parser.add_argument('-p', '--prefixes', type=int, default=2000,
+                        help="Number of namespace pairs bound")
+    parser.add_argument('-n', '--uris', type=int, default=2000,
+                        help="Number of URIs to compact, and triples to write")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    data = make_data(args.prefixes)
+    uris = make_uris(args.prefixes, args.uris)
+
+    per_uri = time_compact(RDFData.compact, data, uris)
+    print("radix: %.0fns per URI" % (per_uri * 1e9))
+
+    per_uri = time_compact(scan_compact, data, uris)
+    print("scan: %.0fns per URI" % (per_uri * 1e9))
+
+    elapsed = time_write(data, args.prefixes, args.uris)
+    print("write: %d triples in %.2fs" % (args.uris, elapsed))
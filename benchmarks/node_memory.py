@@ -0,0 +1,105 @@
+"""
+Bytes per language object, for each node class and for the forms of a
+parsed script.
+
+Run from the project root: python -m benchmarks.node_memory
+"""
+import argparse
+import gc
+import tracemalloc
+
+from rdfscript.core import (Name,
+                            Uri,
+                            Value,
+                            Self,
+                            Assignment)
+from rdfscript.pragma import (PrefixPragma,
+                              DefaultPrefixPragma,
+                              ImportPragma,
+                              ExtensionPragma)
+from rdfscript.template import (Template,
+                                Parameter,
+                                Property,
+                                Expansion,
+                                Argument)
+from rdfscript.location import (Position,
+                                Location)
+from rdfscript.passes import walk
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+from .parse_scaling import generate_script
+
+# shared, so that only the objects themselves are measured
+_uri = Uri('http://eg/')
+_name = Name('x')
+_value = Value(1)
+
+constructors = [
+    ('Name', lambda: Name('x')),
+    ('Uri', lambda: Uri('http://eg/')),
+    ('Value', lambda: Value(1)),
+    ('Self', lambda: Self()),
+    ('Assignment', lambda: Assignment(_name, _value)),
+    ('PrefixPragma', lambda: PrefixPragma('p', _uri)),
+    ('DefaultPrefixPragma', lambda: DefaultPrefixPragma('p')),
+    ('ImportPragma', lambda: ImportPragma(_name)),
+    ('ExtensionPragma', lambda: ExtensionPragma('E', [])),
+    ('Template', lambda: Template(_name, [], [])),
+    ('Parameter', lambda: Parameter('x', 0)),
+    ('Property', lambda: Property(_name, _value)),
+    ('Expansion', lambda: Expansion(_name, _name, [], [])),
+    ('Argument', lambda: Argument(_value, 0)),
+    ('Position', lambda: Position(1, 0)),
+    ('Location', lambda: Location(0, 0)),
+]
+
+
+def measure(make, count):
+    """The traced bytes allocated per object made by make."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # less the list that holds them
+    holder = 8 * count
+    return (after - before - holder) / len(objects)
+
+
+def measure_script(forms):
+    parser = RDFScriptParser(filename='benchmark')
+    script = generate_script(forms)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    parsed = parser.parse(script)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    nodes = sum(len(walk(form)) for form in parsed)
+    return (nodes, (after - before) / nodes)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Language object memory benchmark.")
+    parser.add_argument('-c', '--count', type=int, default=100000,
+                        help="Number of each object to make")
+    parser.add_argument('-n', '--forms', type=int, default=20000,
+                        help="Number of generated top-level forms to parse")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+
+    print("%20s %12s" % ('class', 'bytes/object'))
+    for (name, make) in constructors:
+        print("%20s %12.1f" % (name, measure(make, args.count)))
+
+    (nodes, per_node) = measure_script(args.forms)
+    print("parsed %d forms: %d nodes, %.1f bytes/node" %
+          (args.forms, nodes, per_node))
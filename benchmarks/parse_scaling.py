@@ -0,0 +1,55 @@
+"""
+Parse time against number of top-level forms.
+
+Run from the project root: python -m benchmarks.parse_scaling
+Time per form should stay flat as the script grows. The garbage
+collector is paused while timing unless --gc is given, since its full
+collections scale with the number of live AST nodes, not with the parser.
+"""
+import argparse
+import gc
+import time
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+
+def generate_script(n_forms):
+    lines = ['@prefix sbol = <http://sbols.org/v2#>']
+    for n in range(0, n_forms):
+        lines.append('cd%d is a sbol.ComponentDefinition(sbol.DNA)'
+                     '(sbol.role = sbol.cdRole.Promoter)' % n)
+    return '\n'.join(lines)
+
+
+def time_parse(n_forms, collect=False):
+    script = generate_script(n_forms)
+    parser = RDFScriptParser(filename='benchmark')
+
+    if not collect:
+        gc.disable()
+    start = time.perf_counter()
+    forms = parser.parse(script)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+
+    assert len(forms) == n_forms + 1
+    return elapsed
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Parser scaling benchmark.")
+    parser.add_argument('-s', '--sizes', nargs='*', type=int,
+                        default=[1000, 10000, 100000, 1000000],
+                        help="Numbers of top-level forms to parse")
+    parser.add_argument('--gc', action='store_true',
+                        help="Leave the garbage collector running while timing")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    print("%10s %12s %14s" % ('forms', 'seconds', 'us per form'))
+    for size in args.sizes:
+        elapsed = time_parse(size, collect=args.gc)
+        print("%10d %12.3f %14.2f" % (size, elapsed, elapsed / size * 1e6))
@@ -0,0 +1,67 @@
+"""
+Time for prefix lookups, and for evaluating a name-heavy script, in an
+environment that binds many prefixes.
+
+Run from the project root: python -m benchmarks.prefix_index
+"""
+import argparse
+import contextlib
+import io
+import logging
+import time
+
+from rdfscript.core import Uri
+from rdfscript.env import Env
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+
+def generate_script(prefixes, forms):
+    lines = ['@prefix p%d = <http://eg/ns%d#>' % (i, i) for i in range(prefixes)]
+    for i in range(forms):
+        lines.append('p%d.thing%d = p%d.other%d'
+                     % (i % prefixes, i, (i + 1) % prefixes, i))
+    return '\n'.join(lines) + '\n'
+
+
+def time_lookups(env, prefixes, rounds):
+    names = ['p%d' % i for i in range(prefixes)]
+    uris = [Uri('http://eg/ns%d#' % i) for i in range(prefixes)]
+
+    start = time.perf_counter()
+    for r in range(rounds):
+        for (name, uri) in zip(names, uris):
+            env.uri_for_prefix(name)
+            env.prefix_for_uri(uri)
+    return (time.perf_counter() - start) / (2 * rounds * prefixes)
+
+
+def time_script(prefixes, forms):
+    parsed = RDFScriptParser(filename='benchmark').parse(generate_script(prefixes, forms))
+    env = Env()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        env.interpret(parsed)
+    return (env, time.perf_counter() - start)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Prefix index benchmark.")
+    parser.add_argument('-p', '--prefixes', type=int, default=60,
+                        help="Number of prefixes the script binds")
+    parser.add_argument('-n', '--forms', type=int, default=5000,
+                        help="Number of assignments between prefixed names")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    logging.disable(logging.CRITICAL)
+    args = benchmark_args()
+
+    (env, elapsed) = time_script(args.prefixes, args.forms)
+    print("script: %d prefixes, %d forms in %.2fs (%.0fus per form)"
+          % (args.prefixes, args.forms, elapsed, elapsed * 1e6 / args.forms))
+
+    per_lookup = time_lookups(env, args.prefixes, 100)
+    print("lookup: %.0fns per prefix lookup" % (per_lookup * 1e9))
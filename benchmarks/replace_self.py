@@ -0,0 +1,64 @@
+"""
+Time to replace self in the triples of a large template, as an
+expansion does for every triple of the template it names.
+
+Run from the project root: python -m benchmarks.replace_self
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from rdfscript.core import (Name,
+                            Uri)
+from rdfscript.env import Env
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.template import replace_self
+
+
+def generate_template(n):
+    """A template of n properties, half of them naming self."""
+    lines = ['@prefix p = <http://eg/>', '@prefix p', 'T()(']
+    for i in range(n):
+        if i % 2 == 0:
+            lines.append('  self.part%d = self' % i)
+        else:
+            lines.append('  p.role = <http://eg/roles/%d>' % i)
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+
+def template_triples(n):
+    forms = RDFScriptParser(filename='benchmark').parse(generate_template(n))
+    env = Env()
+    with contextlib.redirect_stdout(io.StringIO()):
+        env.interpret(forms[:2])
+    return forms[2].as_triples(env)
+
+
+def time_replace(triples, replace_with, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        replace_self(triples, replace_with)
+    return (time.perf_counter() - start) / rounds
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="replace_self benchmark.")
+    parser.add_argument('-n', '--triples', type=int, default=10000,
+                        help="Number of triples in the generated template")
+    parser.add_argument('-r', '--rounds', type=int, default=20,
+                        help="Number of times to replace self")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    triples = template_triples(args.triples)
+
+    for (kind, replace_with) in [('name', Name('e', 'f')),
+                                 ('uri', Uri('http://eg/e'))]:
+        elapsed = time_replace(triples, replace_with, args.rounds)
+        print("replace self with %s: %d triples in %.2fms (%.0fns per triple)"
+              % (kind, len(triples), elapsed * 1e3, elapsed * 1e9 / len(triples)))
@@ -0,0 +1,53 @@
+"""
+Peak memory when streaming generated scripts of growing size from disk.
+
+Run from the project root: python -m benchmarks.streaming_memory
+Peak memory should stay roughly flat as the file grows, apart from the
+line-start table of a few bytes per line.
+"""
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.scanner import open_source
+
+from .parse_scaling import generate_script
+
+
+def stream_peak(path):
+    parser = RDFScriptParser(filename=path, lexer='scanner')
+
+    tracemalloc.start()
+    with open_source(path) as source:
+        count = 0
+        for form in parser.parse_iter(source):
+            count += 1
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (count, peak)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Streaming memory benchmark.")
+    parser.add_argument('-s', '--sizes', nargs='*', type=int,
+                        default=[10000, 40000, 160000],
+                        help="Numbers of top-level forms in each generated file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    print("%10s %14s %14s" % ('forms', 'file bytes', 'peak bytes'))
+    for size in args.sizes:
+        (fd, path) = tempfile.mkstemp(suffix='.rdfsh')
+        with os.fdopen(fd, 'w') as out:
+            out.write(generate_script(size))
+        try:
+            (count, peak) = stream_peak(path)
+            print("%10d %14d %14d" % (count, os.path.getsize(path), peak))
+        finally:
+            os.remove(path)
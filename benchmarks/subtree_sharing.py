@@ -0,0 +1,61 @@
+"""
+Memory, time and distinct objects for parsing a generated script with
+and without sharing equal subtrees.
+
+Run from the project root: python -m benchmarks.subtree_sharing
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from rdfscript.passes import walk
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+from .parse_scaling import generate_script
+
+
+def time_parse(script, share):
+    parser = RDFScriptParser(filename='benchmark', share_subtrees=share)
+    gc.disable()
+    start = time.perf_counter()
+    parser.parse(script)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def measure(script, share):
+    parser = RDFScriptParser(filename='benchmark', share_subtrees=share)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    forms = parser.parse(script)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    nodes = [node for form in forms for node in walk(form)]
+    distinct = len(set(id(node) for node in nodes))
+    return (after - before, len(nodes), distinct)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Subtree sharing benchmark.")
+    parser.add_argument('-n', '--forms', type=int, default=20000,
+                        help="Number of generated top-level forms to parse")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    args = benchmark_args()
+    script = generate_script(args.forms)
+
+    print("%8s %10s %10s %10s %10s" %
+          ('share', 'seconds', 'MB', 'nodes', 'distinct'))
+    for share in [False, True]:
+        elapsed = time_parse(script, share)
+        (traced, nodes, distinct) = measure(script, share)
+        print("%8s %10.2f %10.1f %10d %10d" %
+              (share, elapsed, traced / 1e6, nodes, distinct))
@@ -0,0 +1,89 @@
+"""
+Time and memory to evaluate an SBOL-like build, and the cost of
+looking Uris up in the symbol table.
+
+Run from the project root: python -m benchmarks.uri_terms
+"""
+import argparse
+import contextlib
+import gc
+import io
+import logging
+import time
+import tracemalloc
+
+from rdfscript.core import Uri
+from rdfscript.env import Env
+from rdfscript.rdfscriptparser import RDFScriptParser
+
+
+def generate_build(n):
+    lines = ['@prefix sbol = <http://sbols.org/v2#>',
+             '@prefix build = <http://eg/build/>',
+             '@prefix build',
+             'DNA = sbol.DnaRegion',
+             'Promoter = <http://identifiers.org/so/SO:0000167>',
+             'ComponentDefinition(type, role)(',
+             '  rdf.type = sbol.ComponentDefinition',
+             '  sbol.type = type',
+             '  sbol.role = role',
+             '  sbol.persistentIdentity = self',
+             '  sbol.version = "1")']
+    for i in range(n):
+        lines.append('cd%d is a ComponentDefinition(DNA, Promoter)(sbol.displayId = "cd%d")'
+                     % (i, i))
+    return '\n'.join(lines) + '\n'
+
+
+def time_build(n):
+    forms = RDFScriptParser(filename='benchmark').parse(generate_build(n))
+    env = Env()
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        env.interpret(forms)
+    elapsed = time.perf_counter() - start
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    triples = env._rdf.triples
+    distinct = len(set(id(part) for triple in triples for part in triple))
+    return (len(triples), elapsed, peak, distinct)
+
+
+def time_lookups(n, rounds):
+    env = Env()
+    iris = ['http://eg/build/part%d' % i for i in range(n)]
+    for iri in iris:
+        env.assign(Uri(iri), Uri(iri + '/value'))
+
+    keys = [Uri(iri) for iri in iris]
+    start = time.perf_counter()
+    for r in range(rounds):
+        for key in keys:
+            env.lookup(key)
+    return (time.perf_counter() - start) / (n * rounds)
+
+
+def benchmark_args():
+    parser = argparse.ArgumentParser(description="Uri term benchmark.")
+    parser.add_argument('-n', '--forms', type=int, default=5000,
+                        help="Number of expansions in the generated build")
+    parser.add_argument('-l', '--lookups', type=int, default=10000,
+                        help="Number of bound Uris to look up")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+
+    logging.disable(logging.CRITICAL)
+    args = benchmark_args()
+
+    (triples, elapsed, peak, distinct) = time_build(args.forms)
+    print("build: %d triples in %.2fs, peak %.1fMB traced, %d distinct term objects"
+          % (triples, elapsed, peak / 1e6, distinct))
+
+    per_lookup = time_lookups(args.lookups, 20)
+    print("lookup: %.0fns per Env.lookup" % (per_lookup * 1e9))
@@ -49,9 +49,10 @@ class TriplePack(object):
 
         def matcher(triple):
             (x, y, z) = triple
-            return ((x == s or not s) and
-                    (y == p or not p) and
-                    (z == o or not o))
+            # identity first, as equal Uris are usually the same object
+            return ((not s or x is s or x == s) and
+                    (not p or y is p or y == p) and
+                    (not o or z is o or z == o))
         
         return [t for t in self.triples if matcher(t)]
 
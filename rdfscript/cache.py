@@ -0,0 +1,233 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+from . import core
+from . import location
+from . import pragma
+from . import reader
+from . import scanner
+from . import template
+from . import rdfscriptparser
+
+from .rdfscriptparser import (RDFScriptParser,
+                              user_cache_dir)
+from .location import (extend_line_index,
+                       line_index,
+                       new_line_index,
+                       register_source,
+                       restoring)
+from .scanner import (CHUNK_SIZE,
+                      open_source)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_ast_modules = [reader, scanner, rdfscriptparser, core, template, pragma,
+                location]
+_ast_version = None
+
+
+def ast_version():
+    """
+    A digest of the modules that define the grammar and the language
+    objects, so a change to either invalidates every cached parse.
+    """
+    global _ast_version
+    if _ast_version is None:
+        digest = hashlib.sha256()
+        for module in _ast_modules:
+            with open(module.__file__, 'rb') as source:
+                digest.update(source.read())
+        _ast_version = digest.hexdigest()
+    return _ast_version
+
+
+class FormCache(object):
+    """
+    An on-disk cache of parsed top-level forms.
+
+    Entries are keyed by the source text, the filename recorded in the
+    forms' locations and the grammar/AST version. Each entry is a stream
+    of pickled forms, written to a temporary file and renamed into place
+    so that concurrent processes never see a partial entry. Reads refresh
+    an entry's modification time, and once the cache grows past
+    max_bytes the least recently used entries are removed.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+
+        if directory is None:
+            directory = os.path.join(user_cache_dir(), 'forms')
+
+        self._dir = directory
+        self._max_bytes = max_bytes
+        os.makedirs(self._dir, exist_ok=True)
+
+    @property
+    def directory(self):
+        return self._dir
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    def _digest(self, filename):
+        digest = hashlib.sha256()
+        digest.update(ast_version().encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(str(filename).encode('utf-8'))
+        digest.update(b'\0')
+        return digest
+
+    def key(self, text, filename=None):
+        digest = self._digest(filename)
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def file_key(self, path, filename=None):
+        """The key of the file at path, hashed without reading it whole."""
+        digest = self._digest(filename)
+        with open(path, 'rb') as contents:
+            for block in iter(lambda: contents.read(CHUNK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self._dir, key + '.forms')
+
+    def path_for(self, text, filename=None):
+        return self._entry(self.key(text, filename))
+
+    def forms(self, text, filename=None, debug_lvl=0):
+        """
+        Yield the top-level forms of text, from the cache if an entry
+        exists, otherwise by parsing it and recording the result.
+        """
+        path = self.path_for(text, filename)
+        try:
+            cached = open(path, 'rb')
+        except FileNotFoundError:
+            parser = RDFScriptParser(filename=filename, debug_lvl=debug_lvl)
+            yield from self._record(path, parser.parse_iter(text))
+        else:
+            with cached:
+                source = register_source(filename, line_index(text))
+                self._touch(path)
+                yield from _load_forms(cached, filename, source)
+
+    def file_forms(self, path, filename=None, debug_lvl=0):
+        """
+        As forms, for the file at path, which is streamed through the
+        scanner rather than read into memory.
+        """
+        entry = self._entry(self.file_key(path, filename))
+        try:
+            cached = open(entry, 'rb')
+        except FileNotFoundError:
+            parser = RDFScriptParser(filename=filename,
+                                     debug_lvl=debug_lvl,
+                                     lexer='scanner')
+            with open_source(path) as source:
+                yield from self._record(entry, parser.parse_iter(source))
+        else:
+            with cached:
+                source = register_source(filename, file_line_index(path))
+                self._touch(entry)
+                yield from _load_forms(cached, filename, source)
+
+    def _record(self, path, forms):
+        # forms are pickled before they are yielded, as evaluation
+        # mutates some language objects in place
+        (fd, tmp) = tempfile.mkstemp(dir=self._dir, suffix='.tmp')
+        out = os.fdopen(fd, 'wb')
+        complete = False
+        try:
+            for form in forms:
+                if out is not None:
+                    try:
+                        pickle.dump(form, out, pickle.HIGHEST_PROTOCOL)
+                    except (pickle.PicklingError, TypeError, AttributeError):
+                        out.close()
+                        out = None
+                yield form
+            complete = True
+        finally:
+            if out is not None:
+                out.close()
+            if complete and out is not None:
+                os.replace(tmp, path)
+                self.evict()
+            else:
+                _remove(tmp)
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def entries(self):
+        """(mtime, size, path) for every complete entry, oldest first."""
+        entries = []
+        for name in os.listdir(self._dir):
+            if not name.endswith('.forms'):
+                continue
+            path = os.path.join(self._dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return sorted(entries)
+
+    def evict(self):
+        """Remove least recently used entries until under max_bytes."""
+        entries = self.entries()
+        total = sum(size for (mtime, size, path) in entries)
+
+        for (mtime, size, path) in entries:
+            if total <= self._max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+        return total
+
+    def clear(self):
+        for (mtime, size, path) in self.entries():
+            _remove(path)
+
+
+def file_line_index(path):
+    """The line-start table of the file at path, built chunk by chunk."""
+    index = new_line_index()
+    offset = 0
+    with open_source(path) as source:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), ''):
+            extend_line_index(index, chunk, offset)
+            offset += len(chunk)
+
+    return index
+
+
+def _load_forms(stream, filename, source):
+    """
+    The forms pickled in stream, with their locations in source, a
+    fresh source registered for this load of filename.
+    """
+    while True:
+        try:
+            with restoring(filename, source):
+                form = pickle.load(stream)
+        except EOFError:
+            return
+        yield form
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,145 @@
+import pathlib
+
+from .core import Uri
+
+from .pragma import (PrefixPragma,
+                     DefaultPrefixPragma,
+                     ImportPragma,
+                     ExtensionPragma)
+
+from .template import Expansion
+
+from .error import (FailToImport,
+                    NoSuchExtension,
+                    RDFScriptError,
+                    TemplateNotFound,
+                    WrongNumberOfArguments)
+
+from .env import Env
+from .passes import (StaticScope,
+                     walk)
+
+_pragmas = (PrefixPragma, DefaultPrefixPragma, ImportPragma)
+
+
+class Checker:
+    """
+    Finds, in one quick pass over a script and the scripts it imports,
+    the problems that evaluation would only meet when it reached them:
+    imports that cannot be found, expansions of templates that are not
+    defined or that are given the wrong number of arguments, and
+    extensions that do not exist.
+
+    Nothing is evaluated and no triples are built. Names are resolved
+    with a StaticScope, and a name it cannot resolve is not reported.
+    """
+
+    def __init__(self, env):
+
+        self._env = env
+        self._scope = StaticScope(env)
+        self._problems = []
+        self._active = []
+        self._checked = set()
+
+    @property
+    def problems(self):
+        return self._problems
+
+    def check_file(self, path, filename=None, report=True):
+        """Check the script at path, and its imports, in order."""
+        resolved = pathlib.Path(path).resolve()
+        self._active.append(resolved)
+        try:
+            self.check_forms(self._env.file_forms(path, filename), report)
+        except RDFScriptError as e:
+            # the file's forms cannot be built, as for a syntax error
+            if report:
+                self._problems.append(e)
+        finally:
+            self._active.pop()
+            self._checked.add(resolved)
+
+    def check_forms(self, forms, report=True):
+        for form in forms:
+            self.check_form(form, report)
+
+    def check_form(self, form, report=True):
+        nodes = walk(form)
+        if any(isinstance(node, _pragmas) for node in nodes if node is not form):
+            self._scope.make_opaque()
+
+        if report:
+            for node in nodes:
+                if isinstance(node, Expansion):
+                    self.check_expansion(node)
+                elif isinstance(node, ExtensionPragma):
+                    self.check_extension(node)
+
+        if isinstance(form, ImportPragma):
+            self.check_import(form, report)
+        else:
+            self._scope.record(form)
+
+    def check_expansion(self, expansion):
+        uri = self._scope.resolve(expansion.template)
+        if uri is None:
+            return
+
+        if not self._scope.has_template(uri):
+            self._problems.append(TemplateNotFound(Uri(uri),
+                                                   expansion.template_location))
+            return
+
+        template = self._scope.template(uri)
+        if (template is not None and
+                len(expansion.args) != len(template.parameters)):
+            self._problems.append(WrongNumberOfArguments(Uri(uri),
+                                                         len(template.parameters),
+                                                         len(expansion.args),
+                                                         expansion.location))
+
+    def check_extension(self, extension):
+        try:
+            self._env.get_extension(extension.name)
+        except KeyError:
+            self._problems.append(NoSuchExtension(extension.name,
+                                                  extension.location))
+
+    def check_import(self, pragma, report=True):
+        target = self._scope.resolve(pragma.target)
+        if target is None:
+            self._scope.make_opaque()
+            return
+
+        importer = self._env.importer
+        path = importer.find_file(target)
+        if path is None:
+            if report:
+                self._problems.append(FailToImport(pragma.target,
+                                                   importer.path,
+                                                   pragma.location))
+            return
+
+        resolved = path.resolve()
+        if resolved in self._active:
+            # evaluation would never finish, so nothing later is known
+            self._scope.make_opaque()
+            return
+
+        # as Env.eval_import, which restores the default prefix, and a
+        # file already checked is only followed for what it defines
+        old_prefix = self._scope.default_prefix
+        self.check_file(path, target, report and resolved not in self._checked)
+        self._scope.default_prefix = old_prefix
+
+
+def check_file(path, paths=[], extensions=[]):
+    """
+    The problems found by a Checker in the script at path, searching
+    for imports as Env does with the same arguments.
+    """
+    env = Env(filename=path, paths=list(paths), extensions=extensions)
+    checker = Checker(env)
+    checker.check_file(path, path)
+    return checker.problems
@@ -1,59 +1,137 @@
 import rdflib
 import re
+import sys
+import weakref
 
 from .error import (PrefixError,
                     UnexpectedType)
+from .location import (location_id,
+                       location_of)
 
 
 class Node(object):
-    """Language object."""
+    """
+    Language object.
+
+    The location is not kept on the object as a Location: the object
+    holds its location id, one int packing the offset and source id
+    (offset << SOURCE_BITS | source id), and location_of unpacks it.
+    """
+
+    __slots__ = ('_location',)
 
     def __init__(self, location):
         """
         location is a Location object representing this language
         object's position in the source code.
         """
-        self._location = location
+        self._location = location_id(location)
+
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if slot != '__weakref__' and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        # location ids are only meaningful within one process
+        state['_location'] = self.location
+        return state
+
+    def __setstate__(self, state):
+        for (slot, value) in state.items():
+            setattr(self, slot, value)
+        self._location = location_id(self._location)
 
     @property
     def location(self):
-        return self._location
+        return location_of(self._location)
 
     @property
     def line(self):
-        return self._location.position.line
+        if self._location is None:
+            return None
+        return self.location.line
 
     @property
     def col(self):
-        return self._location.position.col
+        if self._location is None:
+            return None
+        return self.location.offset
 
     @property
     def position(self):
-        return self._location.position
+        if self._location is None:
+            return None
+        return self.location.position
 
     @property
     def file(self):
-        return self._location.filename
+        if self._location is None:
+            return None
+        return self.location.filename
+
+
+def intern(name):
+    """
+    Intern name if it is a string, so that repeated symbols and URIs
+    share one object and compare by identity first.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    else:
+        return name
 
 
 class Name(Node):
+    """
+    Language object for a dotted name.
+
+    Names are immutable: the segments are held in a tuple and the hash
+    is computed once, so names can be used as dictionary keys and set
+    members. The location takes no part in equality or the hash.
+    """
+
+    __slots__ = ('_names', '_hash', '_has_self')
 
     def __init__(self, *names, location=None):
 
         Node.__init__(self, location)
-        self._names = list(names)
+        self._names = tuple(map(intern, names))
+        self._has_self = any(isinstance(name, Self) for name in names)
+        if len(names) == 1 and self._has_self:
+            self._hash = _self_hash
+        else:
+            self._hash = hash(self._names)
+
+    def __reduce__(self):
+        return (_name, (self._names, self.location))
 
     def __eq__(self, other):
-        return ((isinstance(other, Name) and
-                 self.names == other.names) or
+        return (self is other or
+                (isinstance(other, Name) and
+                 self._hash == other._hash and
+                 self._names == other._names) or
                 (isinstance(other, Self) and
-                 self.names == [Self()]))
+                 self.is_self()))
+
+    def __hash__(self):
+        return self._hash
 
     def __str__(self):
         return ':'.join([str(name) for name in self.names])
 
     def __repr__(self):
-        return format("[NAME: %s]" % (self.names))
+        return format("[NAME: %s]" % (list(self.names),))
+
+    def is_self(self):
+        """True if this name is self alone."""
+        return (len(self._names) == 1 and
+                isinstance(self._names[0], Self))
+
+    @property
+    def has_self(self):
+        """True if self is one of the segments of this name."""
+        return self._has_self
 
     @property
     def names(self):
@@ -69,48 +147,84 @@ class Name(Node):
             return False
 
     def evaluate(self, context):
+        return context.resolutions.resolve(self, context)
 
-        uri = Uri(context.uri, location=self.location)
+    def resolve(self, context):
+        """
+        Evaluate this name, without the context's resolution cache.
 
-        for n in range(0, len(self.names)):
-            if isinstance(self.names[n], Self):
+        The URI is followed through the context's symbol index one
+        segment at a time, so the string for each prefix of the name
+        is never built; the segments are joined once, at the end.
+        """
+        symbols = context.symbols
+        pieces = [context.uri.uri]
+        position = None
+        last = len(self._names) - 1
+
+        for n in range(0, last + 1):
+            name = self._names[n]
+            if isinstance(name, Self):
                 current_self = context.current_self
-                if isinstance(current_self, Uri):
-                    if n > 0:
-                        uri.extend(context.current_self, delimiter='')
-                    else:
-                        uri = Uri(current_self, location=self.location)
-                elif isinstance(current_self, Name):
-                    rest = current_self.names + self.names[n + 1:]
+                if isinstance(current_self, Name):
+                    rest = current_self.names + self._names[n + 1:]
                     if n > 0:
-                        return Name(uri, *rest, location=self.location)
+                        return Name(Uri(''.join(pieces)), *rest,
+                                    location=self.location)
                     else:
                         return Name(*rest, location=self.location)
-            elif isinstance(self.names[n], Uri):
-                if n > 0:
-                    uri.extend(self.names[n], delimiter='')
+                elif isinstance(current_self, Uri):
+                    (segment, restart) = (current_self.uri, n == 0)
                 else:
-                    uri = Uri(self.names[n])
-            elif isinstance(self.names[n], str):
-                if n == 0 and self.is_prefixed(context):
-                    uri = self.is_prefixed(context)
+                    (segment, restart) = ('', False)
+            elif isinstance(name, Uri):
+                (segment, restart) = (name.uri, n == 0)
+            else:
+                prefix = n == 0 and self.is_prefixed(context)
+                if prefix:
+                    (segment, restart) = (prefix.uri, True)
                 else:
-                    uri.extend(Uri(self.names[n]), delimiter='')
-
-            lookup = context.lookup(uri)
+                    (segment, restart) = (name, False)
+
+            if restart:
+                pieces = [segment]
+                position = symbols.find(segment)
+            else:
+                if n == 0:
+                    position = symbols.find(pieces[0])
+                pieces.append(segment)
+                position = symbols.advance(position, segment)
+
+            lookup = symbols.value(position)
             if lookup is not None:
                 if isinstance(lookup, Uri):
-                    uri = Uri(lookup, location=self.location)
-                elif n == len(self.names) - 1:
-                    uri = lookup
+                    pieces = [lookup.uri]
+                    position = symbols.find(lookup.uri)
+                elif n == last:
+                    return lookup
+
+        return Uri(''.join(pieces))
+
 
-        return uri
+def _name(names, location):
+    """Unpickle a Name, recomputing its hash in this process."""
+    return Name(*names, location=location)
 
 
 class Uri(Node):
-    """Language object for a URI."""
+    """
+    Language object for a URI.
 
-    def __init__(self, uri, location=None):
+    Uris are immutable. Uri(iri) without a location returns the one
+    shared Uri for iri, so equal URIs are usually the same object and
+    compare and hash by identity; a Uri with a location, such as one
+    made by the parser, is its own object. The hash is computed once.
+    A shared Uri is only held weakly, so it goes once nothing uses it.
+    """
+
+    __slots__ = ('_uri', '_hash', '_term', '__weakref__')
+
+    def __new__(cls, uri, location=None):
         """
         uri can be one of:
           - string
@@ -119,17 +233,35 @@ class Uri(Node):
 
         uri is converted to a string
         """
-        Node.__init__(self, location)
-        if isinstance(uri, rdflib.URIRef):
-            self._uri = uri.toPython()
-        elif isinstance(uri, Uri):
-            self._uri = uri.uri
+        if isinstance(uri, Uri):
+            iri = uri.uri
         else:
-            self._uri = uri
+            iri = intern(str(uri))
+
+        if location is None:
+            shared = _uris.get(iri)
+            if shared is not None:
+                return shared
+
+        new = Node.__new__(cls)
+        new._location = location_id(location)
+        new._uri = iri
+        new._hash = hash(iri)
+        new._term = None
+        if location is None:
+            _uris[iri] = new
+        return new
+
+    def __init__(self, uri, location=None):
+        pass
+
+    def __reduce__(self):
+        return (Uri, (self._uri, self.location))
 
     def __eq__(self, other):
-        return (isinstance(other, Uri) and
-                self.uri == other.uri)
+        return (self is other or
+                (isinstance(other, Uri) and
+                 self._uri == other._uri))
 
     def __str__(self):
         return '<' + self.uri + '>'
@@ -138,14 +270,21 @@ class Uri(Node):
         return format("[URI: %s]" % self._uri)
 
     def __hash__(self):
-        return self.uri.__hash__()
+        return self._hash
 
     @property
     def uri(self):
         return self._uri
 
+    def rdf_term(self):
+        """The rdflib URIRef for this Uri, made the first time it is asked for."""
+        if self._term is None:
+            self._term = rdflib.URIRef(self._uri)
+        return self._term
+
     def extend(self, other, delimiter='#'):
-        self._uri = self.uri + delimiter + other.uri
+        """A Uri for this one followed by delimiter and other."""
+        return Uri(self._uri + delimiter + other.uri)
 
     def split(self):
         return re.split('#|/|:', self.uri)
@@ -154,18 +293,50 @@ class Uri(Node):
         return self
 
 
+# the shared Uri of each IRI still in use, see Uri.__new__
+_uris = weakref.WeakValueDictionary()
+
+
 class Value(Node):
-    """Language object for an RDF literal."""
+    """
+    Language object for an RDF literal.
+
+    A Value is a python value with a datatype and a language tag. The
+    datatype is a Uri, inferred from the python type when it is not
+    given; plain strings have none. Two Values are equal when their
+    lexical forms, datatypes and language tags are, and the hash over
+    those is computed once.
+    """
 
-    def __init__(self, python_literal, location=None):
+    __slots__ = ('_python_val', '_datatype', '_language', '_lexical', '_hash',
+                 '_term')
+
+    def __init__(self, python_literal, location=None,
+                 datatype=None, language=None):
 
         Node.__init__(self, location)
         self._python_val = python_literal
+        if datatype is None and language is None:
+            datatype = _datatypes.get(type(python_literal))
+        self._datatype = datatype
+        self._language = language
+        self._lexical = lexical_form(python_literal)
+        self._hash = hash((self._lexical, datatype, language))
+        self._term = None
+
+    def __reduce__(self):
+        return (Value, (self._python_val,
+                        self.location,
+                        self._datatype,
+                        self._language))
 
     def __eq__(self, other):
-        return (isinstance(other, Value) and
-                type(self.value) == type(other.value) and
-                self.value == other.value)
+        return (self is other or
+                (isinstance(other, Value) and
+                 self._hash == other._hash and
+                 self._lexical == other._lexical and
+                 self._datatype == other._datatype and
+                 self._language == other._language))
 
     def __str__(self):
         return format("%r" % self.value)
@@ -174,25 +345,90 @@ class Value(Node):
         return format("[VALUE: %s]" % self.value)
 
     def __hash__(self):
-        return self._python_val.__hash__()
+        return self._hash
 
     @property
     def value(self):
         return self._python_val
 
+    @property
+    def datatype(self):
+        return self._datatype
+
+    @property
+    def language(self):
+        return self._language
+
+    @property
+    def lexical(self):
+        return self._lexical
+
+    def rdf_term(self):
+        """The rdflib Literal for this Value, made the first time it is asked for."""
+        if self._term is None:
+            datatype = self._datatype
+            if datatype is not None:
+                datatype = datatype.rdf_term()
+            self._term = rdflib.Literal(self._python_val,
+                                        lang=self._language,
+                                        datatype=datatype)
+        return self._term
+
     def evaluate(self, context):
         return self
 
 
+def lexical_form(python_literal):
+    """The lexical form of python_literal as an RDF literal."""
+    if python_literal is True:
+        return 'true'
+    elif python_literal is False:
+        return 'false'
+    else:
+        return str(python_literal)
+
+
+_xsd = 'http://www.w3.org/2001/XMLSchema#'
+
+# the datatype of a Value made from each python type
+_datatypes = {bool: Uri(_xsd + 'boolean'),
+              int: Uri(_xsd + 'integer'),
+              float: Uri(_xsd + 'double')}
+
+
 class Self(Node):
+    """
+    Language object for self.
+
+    Self() without a location returns the one shared Self, so self is
+    usually found by identity; a Self with a location is its own
+    object but still equal to the shared one.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, location=None):
+        if location is None:
+            return _self
+
+        new = Node.__new__(cls)
+        new._location = location_id(location)
+        return new
 
     def __init__(self, location=None):
-        Node.__init__(self, location)
+        pass
+
+    def __reduce__(self):
+        return (Self, (self.location,))
 
     def __eq__(self, other):
-        return (isinstance(other, Self) or
+        return (self is other or
+                isinstance(other, Self) or
                 (isinstance(other, Name) and
-                 other.names == [Self()]))
+                 other.is_self()))
+
+    def __hash__(self):
+        return _self_hash
 
     def __str__(self):
         return "self"
@@ -204,8 +440,16 @@ class Self(Node):
         return context.current_self
 
 
+# the shared Self, see Self.__new__
+_self = Node.__new__(Self)
+_self._location = None
+_self_hash = hash('self')
+
+
 class Assignment(Node):
 
+    __slots__ = ('_name', '_value')
+
     def __init__(self, name, value, location=None):
 
         Node.__init__(self, location)
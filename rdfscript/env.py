@@ -1,8 +1,9 @@
 import pathlib
 import logging
 import pdb
+import re
 
-from .core import Uri, Value
+from .core import Name, Uri, Value
 
 from .pragma import ExtensionPragma
 
@@ -10,13 +11,18 @@ from .error import (RDFScriptError,
                     PrefixError)
 
 from .rdfscriptparser import RDFScriptParser
+from .reader import reserved_words
 
 from .importer import Importer
+from .scanner import open_source
 
 from .extensions import ExtensionManager
 from extensions.error import ExtensionError
 from extensions.triples import TriplePack
 from .rdf_data import RDFData
+from .resolution import ResolutionCache
+from .radix import RadixTree
+from .scope import Scope
 
 
 class Env(object):
@@ -25,11 +31,14 @@ class Env(object):
                  filename=None,
                  serializer=None,
                  paths=[],
-                 extensions=[]):
-
-        self._symbol_table = {}
-        self._template_table = {}
-        self._extension_table = {}
+                 extensions=[],
+                 cache=None,
+                 passes=None):
+
+        self._symbol_table = Scope()
+        self._symbol_index = RadixTree()
+        self._template_table = Scope()
+        self._extension_table = Scope()
         self._extension_manager = ExtensionManager(extras=extensions)
 
         self._rdf = RDFData(serializer=serializer)
@@ -37,12 +46,48 @@ class Env(object):
         self._uri = Uri(self._rdf._g.identifier.toPython())
         self._self = self._uri
 
+        self._cache = cache
+        self._passes = passes
+
+        self._symbol_epoch = 0
+        self._prefix_epoch = 0
+        self._resolutions = ResolutionCache()
+
         if filename:
             paths.append(pathlib.Path(filename).parent)
             self._importer = Importer(paths)
         else:
             self._importer = Importer(paths)
 
+    def fork(self):
+        """
+        A child environment, with an empty graph, that starts with the
+        symbols, templates, extensions and prefixes bound here. The
+        tables are shared until either environment changes them, so a
+        fork costs little however much has been imported.
+        """
+        child = Env.__new__(Env)
+        child._symbol_table = self._symbol_table.fork()
+        child._symbol_index = self._symbol_index.fork()
+        child._template_table = self._template_table.fork()
+        child._extension_table = self._extension_table.fork()
+        child._extension_manager = self._extension_manager
+
+        child._rdf = self._rdf.fork()
+        child._prefix = self._prefix
+        child._uri = self._uri
+        child._self = self._self
+
+        child._cache = self._cache
+        child._passes = self._passes
+
+        child._symbol_epoch = 0
+        child._prefix_epoch = 0
+        child._resolutions = ResolutionCache()
+
+        child._importer = self._importer.copy()
+        return child
+
     def __repr__(self):
         return format("%s" % self._rdf.serialise())
 
@@ -58,6 +103,11 @@ class Env(object):
     def uri(self):
         return self._uri
 
+    @property
+    def namespace(self):
+        """The namespace of unprefixed names when no prefix is the default."""
+        return Uri(self._rdf._g.identifier.toPython())
+
     @property
     def prefix(self):
         return self._prefix
@@ -74,10 +124,58 @@ class Env(object):
                 self._uri = ns
         else:
             self._prefix = prefix
-            self._uri = Uri(self._rdf._g.identifier.toPython())
+            self._uri = self.namespace
 
         return prefix
 
+    @property
+    def prefixes(self):
+        """A dictionary of every bound prefix and its Uri."""
+        return self._rdf.prefixes
+
+    @property
+    def bindings(self):
+        """The symbol table, from Uri to the value assigned to it."""
+        return self._symbol_table
+
+    @property
+    def symbols(self):
+        """
+        The symbol table as a RadixTree keyed by URI string, which
+        names are resolved through segment by segment.
+        """
+        return self._symbol_index
+
+    @property
+    def templates(self):
+        """The template table, from Uri to the template's triples."""
+        return self._template_table
+
+    @property
+    def modules(self):
+        """The modules imported, each a layer of the tables."""
+        return self._symbol_table.modules
+
+    @property
+    def importer(self):
+        return self._importer
+
+    @property
+    def passes(self):
+        return self._passes
+
+    @property
+    def epochs(self):
+        """
+        The number of times a symbol has been assigned and a prefix
+        bound, which a cached name resolution must match to be used.
+        """
+        return (self._symbol_epoch, self._prefix_epoch)
+
+    @property
+    def resolutions(self):
+        return self._resolutions
+
     def uri_for_prefix(self, prefix):
         """Return a Uri object for a Prefix object."""
         try:
@@ -91,6 +189,26 @@ class Env(object):
         except PrefixError:
             raise PrefixError(uri, None)
 
+    def compact(self, uri):
+        """
+        The prefix of the longest bound namespace containing uri, and
+        the rest of uri, or None if no bound namespace contains it.
+        """
+        return self._rdf.compact(uri)
+
+    def name_for_uri(self, uri):
+        """
+        A Name that evaluates back to uri: prefix.local under the
+        longest bound namespace, if local can be written as a symbol,
+        otherwise the Uri itself as a Name.
+        """
+        compacted = self._rdf.compact(uri)
+        if compacted is not None:
+            (prefix, local) = compacted
+            if _is_symbol(prefix) and _is_symbol(local):
+                return Name(prefix, local)
+        return Name(uri)
+
     def add_triples(self, triples):
         """Add a triple of Uri or Value language objects to the RDF graph."""
         for (s, p, o) in triples:
@@ -98,10 +216,54 @@ class Env(object):
 
     def bind_prefix(self, prefix, uri):
         self._rdf.bind_prefix(prefix, uri)
+        self._prefix_epoch += 1
         return prefix
 
     def assign(self, uri, value):
         self._symbol_table[uri] = value
+        self._symbol_index.insert(uri.uri, value)
+        self._symbol_epoch += 1
+
+    def unload(self, module):
+        """
+        Remove every symbol, template and extension that module bound,
+        uncovering any they had replaced.
+        """
+        changed = self._symbol_table.unload(module)
+        self._template_table.unload(module)
+        self._extension_table.unload(module)
+        self._reindex(changed)
+
+    def snapshot(self):
+        """
+        A token for the tables and default prefix as they are now. The
+        graph and the prefix bindings are not part of it.
+        """
+        return ((self._prefix, self._uri),
+                self._symbol_table.snapshot(),
+                self._template_table.snapshot(),
+                self._extension_table.snapshot())
+
+    def restore(self, snapshot):
+        """Undo every change to the tables made since snapshot."""
+        ((prefix, uri), symbols, templates, extensions) = snapshot
+        changed = self._symbol_table.restore(symbols)
+        self._template_table.restore(templates)
+        self._extension_table.restore(extensions)
+        self._prefix = prefix
+        self._uri = uri
+        self._reindex(changed)
+
+    def _reindex(self, uris):
+        """Bring the symbol index in line with the symbol table."""
+        for uri in uris:
+            value = self._symbol_table.get(uri)
+            if value is not None:
+                self._symbol_index.insert(uri.uri, value)
+            elif uri.uri in self._symbol_index:
+                self._symbol_index.remove(uri.uri)
+        if uris:
+            self._symbol_epoch += 1
 
     def lookup(self, uri):
         return self._symbol_table.get(uri, None)
@@ -152,7 +314,15 @@ class Env(object):
         return graph_triples
 
     def interpret(self, forms):
+        """
+        Evaluate forms, any iterable of language objects, in order.
+        A generator such as RDFScriptParser.parse_iter lets each form
+        be dropped once evaluated. If the environment has a pipeline of
+        passes, each form is rewritten by it first.
+        """
         result = None
+        if self._passes is not None:
+            forms = self._passes.run(forms, self)
         
         for form in forms:
             print("---------------------------------")
@@ -175,17 +345,47 @@ class Env(object):
     def eval_import(self, uri):
 
         filename = uri.uri
-        parser = RDFScriptParser(filename=filename)
 
-        import_text = self._importer.import_file(filename)
-        if not import_text:
+        path = self._importer.find_file(filename)
+        if path is None:
             return False
         else:
+            module = path.resolve()
             old_prefix = self.prefix
-            self.interpret(parser.parse(import_text))
+            self._reindex(self._symbol_table.enter(module))
+            self._template_table.enter(module)
+            self._extension_table.enter(module)
+            try:
+                self.interpret(self.file_forms(path, filename))
+            finally:
+                self._symbol_table.exit()
+                self._template_table.exit()
+                self._extension_table.exit()
             self.prefix = old_prefix
         return True
 
+    def file_forms(self, path, filename=None, debug_lvl=0):
+        """
+        The top-level forms of the file at path, through the form cache
+        if any. The file is memory-mapped and scanned in chunks.
+        """
+        if self._cache is not None:
+            yield from self._cache.file_forms(path, filename, debug_lvl=debug_lvl)
+        else:
+            parser = RDFScriptParser(filename=filename,
+                                     debug_lvl=debug_lvl,
+                                     lexer='scanner')
+            with open_source(path) as source:
+                yield from parser.parse_iter(source)
+
     def get_current_path(self):
 
         return [str(p) for p in self._importer.path]
+
+
+_symbol = re.compile(r'[^()}{=."\'\s\[\],0-9\-][^()}{=."\'\s\[\],]*')
+
+
+def _is_symbol(text):
+    return (_symbol.fullmatch(text) is not None and
+            text not in reserved_words)
@@ -9,6 +9,8 @@ class RDFScriptError(Exception):
         return self._location
 
     def __str__(self):
+        if self.location is None:
+            return format("\nERROR: %s\n" % self._type)
         return format("\nERROR: %s on line: %s at position: %s in file: %s\n" % (self._type, self.location.position.line,self.location.col_on_line, self.location.filename))
 
 
@@ -95,6 +97,32 @@ class TemplateNotFound(RDFScriptError):
         return RDFScriptError.__str__(self) + format("Cannot find template '%s'.\n\n" % self.template)
 
 
+class WrongNumberOfArguments(RDFScriptError):
+
+    def __init__(self, template, expected, actual, location):
+        RDFScriptError.__init__(self, location)
+        self._template = template
+        self._expected = expected
+        self._actual = actual
+        self._type = 'Wrong Number Of Arguments Error'
+
+    @property
+    def template(self):
+        return self._template
+
+    @property
+    def expected(self):
+        return self._expected
+
+    @property
+    def actual(self):
+        return self._actual
+
+    def __str__(self):
+        return RDFScriptError.__str__(self) + format("Template '%s' takes %d arguments, but %d were given.\n\n"
+                                                     % (self.template, self.expected, self.actual))
+
+
 class NoSuchExtension(RDFScriptError):
 
     def __init__(self, name, location):
@@ -16,6 +16,12 @@ class Importer:
     def extension(self):
         return '.rdfsh'
 
+    def copy(self):
+        """An Importer with the same search path, to extend separately."""
+        importer = Importer([])
+        importer._dirs = list(self._dirs)
+        return importer
+
     def add_path(self, newpath):
         self._dirs.append(self.to_absolute(pathlib.Path(newpath)))
 
@@ -24,14 +30,22 @@ class Importer:
 
     def import_file(self, filepath):
 
+        path = self.find_file(filepath)
+        if path is None:
+            return None
+        else:
+            return path.read_text()
+
+    def find_file(self, filepath):
+        """
+        The path of the first file matching filepath on the search path,
+        or None. The directory of a file found is added to the path.
+        """
         for d in self._dirs:
-            try:
-                path = (d / filepath).with_suffix('.rdfsh')
-                data = path.read_text()
+            path = (d / filepath).with_suffix(self.extension)
+            if path.is_file():
                 self.add_path(path.parent)
-                return data
-            except FileNotFoundError:
-                pass
+                return path
 
         return self.try_absolute(filepath)
 
@@ -40,11 +54,10 @@ class Importer:
 
     def try_absolute(self, filepath):
 
-        try:
-            absolute = self.to_absolute(pathlib.Path(filepath))
-            path = absolute.with_suffix(self.extension)
-            data = path.read_text()
+        absolute = self.to_absolute(pathlib.Path(filepath))
+        path = absolute.with_suffix(self.extension)
+        if path.is_file():
             self.add_path(path.parent)
-            return data
-        except FileNotFoundError:
+            return path
+        else:
             return None
@@ -0,0 +1,226 @@
+import hashlib
+import pathlib
+
+from .importer import Importer
+from .scanner import Scanner
+
+_identifiers = frozenset(['URI', 'SYMBOL', 'SELF'])
+
+
+class ImportTarget:
+    """
+    The target of one use pragma, as written in the script.
+
+    A target made only of URIs names a file directly and is static. One
+    that contains symbols or self depends on the prefixes and bindings
+    in force when it is evaluated, so it cannot be resolved without
+    running the script and is marked dynamic.
+    """
+
+    def __init__(self, segments, lineno):
+
+        self._segments = tuple(segments)
+        self._lineno = lineno
+
+    def __eq__(self, other):
+        return (isinstance(other, ImportTarget) and
+                self.segments == other.segments)
+
+    def __hash__(self):
+        return hash(self._segments)
+
+    def __repr__(self):
+        return format("[IMPORT TARGET: %s]" % self)
+
+    def __str__(self):
+        return '.'.join('<%s>' % value if kind == 'URI' else value
+                        for (kind, value) in self._segments)
+
+    @property
+    def segments(self):
+        return self._segments
+
+    @property
+    def lineno(self):
+        return self._lineno
+
+    @property
+    def dynamic(self):
+        return any(kind != 'URI' for (kind, value) in self._segments)
+
+    @property
+    def filename(self):
+        """The filename searched for on import, None if dynamic."""
+        if self.dynamic:
+            return None
+        return ''.join(value for (kind, value) in self._segments)
+
+
+def scan_imports(script):
+    """
+    The targets of the use pragmas in script, in order, found by lexing
+    it without parsing or evaluating anything. Lexing stops after the
+    last occurrence of 'use', as no pragma can begin beyond it.
+    """
+    last = script.rfind('use')
+    if last == -1:
+        return []
+
+    lexer = Scanner()
+    lexer.input(script)
+
+    targets = []
+    segments = None
+    dotted = False
+    token = _next_token(lexer)
+    while token is not None:
+        if segments is None:
+            if token.lexpos > last:
+                break
+            if token.type == 'USE':
+                segments = []
+                lineno = token.lineno
+            token = _next_token(lexer)
+        elif token.type in _identifiers and (dotted or not segments):
+            segments.append((token.type, token.value))
+            dotted = False
+            token = _next_token(lexer)
+        elif token.type == '.' and segments and not dotted:
+            dotted = True
+            token = _next_token(lexer)
+        else:
+            if segments:
+                targets.append(ImportTarget(segments, lineno))
+            segments = None
+            dotted = False
+
+    if segments:
+        targets.append(ImportTarget(segments, lineno))
+
+    return targets
+
+
+def _next_token(lexer):
+    # brackets are irrelevant here, and forgetting them means an
+    # unbalanced file never makes the lexer prompt for more input
+    lexer.open_brackets = 0
+    return lexer.token()
+
+
+class ImportNode:
+
+    def __init__(self, path, digest, imports, unresolved):
+
+        self._path = path
+        self._digest = digest
+        self._imports = imports
+        self._unresolved = unresolved
+
+    def __repr__(self):
+        return format("[IMPORT NODE: %s %s]" % (self.path, self.digest))
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def digest(self):
+        """The sha256 hex digest of the file's contents."""
+        return self._digest
+
+    @property
+    def imports(self):
+        """(target, path) for each static target that was found."""
+        return self._imports
+
+    @property
+    def unresolved(self):
+        """Targets that are dynamic or could not be found."""
+        return self._unresolved
+
+
+class ImportGraph:
+    """
+    The files a script imports, directly or transitively, keyed by
+    their resolved paths. Paths are found with the same search rules,
+    applied in the same order, as evaluating the script would use.
+    """
+
+    def __init__(self, root, nodes, order):
+
+        self._root = root
+        self._nodes = nodes
+        self._order = order
+
+    def __getitem__(self, path):
+        return self._nodes[pathlib.Path(path).resolve()]
+
+    def __contains__(self, path):
+        return pathlib.Path(path).resolve() in self._nodes
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+    @property
+    def root(self):
+        return self._root
+
+    @property
+    def nodes(self):
+        """Every node, each one after all of the files it imports."""
+        return [self._nodes[path] for path in self._order]
+
+    def dependencies(self, path):
+        """The paths imported by path, directly or transitively."""
+        start = pathlib.Path(path).resolve()
+        seen = set()
+        stack = [start]
+        while stack:
+            for (target, imported) in self._nodes[stack.pop()].imports:
+                if imported not in seen:
+                    seen.add(imported)
+                    stack.append(imported)
+
+        seen.discard(start)
+        return seen
+
+
+def import_graph(filepath, paths=[]):
+    """
+    The import graph of the script at filepath, searching for imports
+    in paths and then the script's own directory, as Env does.
+    """
+    root = pathlib.Path(filepath).resolve()
+    importer = Importer(list(paths) + [root.parent])
+    nodes = {}
+    order = []
+
+    def visit(path):
+        contents = path.read_bytes()
+        imports = []
+        unresolved = []
+        nodes[path] = ImportNode(path,
+                                 hashlib.sha256(contents).hexdigest(),
+                                 imports,
+                                 unresolved)
+
+        for target in scan_imports(contents.decode('utf-8')):
+            found = None
+            if not target.dynamic:
+                found = importer.find_file(target.filename)
+
+            if found is None:
+                unresolved.append(target)
+            else:
+                found = found.resolve()
+                imports.append((target, found))
+                if found not in nodes:
+                    visit(found)
+
+        order.append(path)
+
+    visit(root)
+    return ImportGraph(root, nodes, order)
@@ -0,0 +1,239 @@
+import array
+import bisect
+import contextlib
+import re
+import sys
+
+_sources = []
+_source_ids = {}
+
+
+def new_line_index():
+    """An empty line-start table, filled in by the lexer."""
+    return array.array('q', [0])
+
+
+def line_index(text):
+    """The offsets at which each line of text starts."""
+    return extend_line_index(new_line_index(), text)
+
+
+def extend_line_index(index, text, offset=0):
+    """Add the line starts of text, found at offset in its source."""
+    index.extend(offset + m.end() for m in re.finditer('\n', text))
+    return index
+
+
+class Source:
+
+    __slots__ = ('_filename', '_line_starts')
+
+    def __init__(self, filename, line_starts=None):
+
+        self._filename = filename
+        self._line_starts = line_starts
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @property
+    def line_starts(self):
+        return self._line_starts
+
+    def line_of(self, offset):
+        if self._line_starts is None:
+            return None
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def col_of(self, offset):
+        if self._line_starts is None:
+            return offset
+        return offset - self._line_starts[self.line_of(offset) - 1]
+
+
+def register_source(filename, line_starts=None):
+    """
+    Record a new source, one parse of filename with the given line-start
+    table, and return its id. Each parse has a source of its own, so the
+    trees of an earlier parse of the same filename keep their lines.
+    """
+    if isinstance(filename, str):
+        filename = sys.intern(filename)
+    source_id = len(_sources)
+    _sources.append(Source(filename, line_starts))
+    _source_ids[filename] = source_id
+    return source_id
+
+
+def source_id(filename):
+    """
+    The id of the latest source registered for filename, registering
+    one without text if there is none.
+    """
+    try:
+        return _source_ids[filename]
+    except KeyError:
+        return register_source(filename)
+
+
+def get_source(source_id):
+    return _sources[source_id]
+
+
+class Position:
+
+    __slots__ = ('_line', '_col')
+
+    def __init__(self, line, col):
+
+        self._line = line
+        self._col = col
+
+    def __repr__(self):
+        return format("(%s, %s)" % (self.line, self.col))
+
+    @property
+    def line(self):
+        return self._line
+
+    @property
+    def col(self):
+        return self._col
+
+
+class Location:
+    """
+    A character offset into a registered source. Line and column are
+    only worked out from the source when they are asked for.
+    """
+
+    __slots__ = ('_offset', '_source_id')
+
+    def __init__(self, offset, source_id):
+
+        self._offset = offset
+        self._source_id = source_id
+
+    def __repr__(self):
+        return format("%s in '%s'" % (self.position, self.filename))
+
+    def __reduce__(self):
+        # source ids are only meaningful within one process
+        return (_restore_location, (self._offset, self.source.filename))
+
+    def __eq__(self, other):
+        return (isinstance(other, Location) and
+                self._offset == other._offset and
+                self._source_id == other._source_id)
+
+    def __hash__(self):
+        return hash((self._offset, self._source_id))
+
+    @property
+    def offset(self):
+        return self._offset
+
+    @property
+    def source_id(self):
+        return self._source_id
+
+    @property
+    def source(self):
+        return get_source(self._source_id)
+
+    @property
+    def position(self):
+        return Position(self.line, self._offset)
+
+    @property
+    def line(self):
+        return self.source.line_of(self._offset)
+
+    @property
+    def filename(self):
+        filename = self.source.filename
+        if not filename:
+            return "REPL"
+        else:
+            return filename
+
+    @property
+    def col_on_line(self):
+        return self.source.col_of(self._offset)
+
+
+@contextlib.contextmanager
+def restoring(filename, source_id):
+    """
+    While active, unpickled locations of filename are restored into
+    source_id rather than the latest source registered for filename.
+    """
+    previous = _restoring.get(filename, _unset)
+    _restoring[filename] = source_id
+    try:
+        yield
+    finally:
+        if previous is _unset:
+            del _restoring[filename]
+        else:
+            _restoring[filename] = previous
+
+
+def _restore_location(offset, filename):
+    restored_into = _restoring.get(filename)
+    if restored_into is None:
+        restored_into = source_id(filename)
+    return Location(offset, restored_into)
+
+
+# the source each filename's locations are being unpickled into
+_restoring = {}
+_unset = object()
+
+
+# The locations of language objects, packed into one int per location
+# rather than kept as a Location per object: the character offset above
+# the low SOURCE_BITS bits, which hold the source id. Nothing is stored
+# for an id, so nothing is left behind when the objects go. A parent is
+# made soon after its first child and at the same place, such as a
+# Property and its name, so recent locations are looked up and share
+# their id object.
+SOURCE_BITS = 24
+_source_mask = (1 << SOURCE_BITS) - 1
+_recent_locations = {}
+RECENT_LOCATIONS = 64
+
+
+def location_id(location):
+    """
+    The id of location, an int packing its offset and source id. None,
+    and any other object that is not a Location, is returned unchanged,
+    except for ints, which would be taken for location ids. So is a
+    Location whose source id does not fit in SOURCE_BITS.
+    """
+    if type(location) is not Location:
+        if type(location) is int:
+            raise TypeError("a location cannot be an int")
+        return location
+
+    key = (location.offset, location.source_id)
+    found = _recent_locations.get(key)
+    if found is not None:
+        return found
+
+    if not 0 <= location.source_id <= _source_mask:
+        return location
+
+    if len(_recent_locations) >= RECENT_LOCATIONS:
+        _recent_locations.clear()
+    new = (location.offset << SOURCE_BITS) | location.source_id
+    _recent_locations[key] = new
+    return new
+
+
+def location_of(location_id):
+    """The Location packed into location_id, made on demand."""
+    if type(location_id) is not int:
+        return location_id
+    return Location(location_id >> SOURCE_BITS, location_id & _source_mask)
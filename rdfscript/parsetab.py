@@ -0,0 +1,77 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "BOOLEAN DOUBLE EXTENSION FROM INTEGER ISA PREFIX SELF STRING SYMBOL URI USEforms : forms formforms : emptyform : assignment\n            | extension\n            | template\n            | exprassignment : name '=' exprpragma : PREFIX SYMBOL '=' exprpragma : PREFIX SYMBOLpragma : USE nameextension : EXTENSION SYMBOLextension : EXTENSION SYMBOL '(' exprlist ')' template : name '(' exprlist ')' indentedinstancebodyexpansion : name ISA name '(' exprlist ')' indentedinstancebodyanon_expansion : name '(' exprlist ')' indentedinstancebodyexpr : name\n            | pragma\n            | literal\n            | expansionindentedinstancebody : '(' instancebody ')' indentedinstancebody : emptyinstancebody : bodystatementsbodystatements : bodystatements bodystatementbodystatements : emptybodystatement : property\n                     | expansion\n                     | anon_expansion\n                     | extensionproperty : name '=' exprexprlist : emptylist\n                | notemptyexprlistnotemptyexprlist : exprnotemptyexprlist : notemptyexprlist ',' exprempty :emptylist : emptyname : dotted_listdotted_list : identifierdotted_list : dotted_list '.' identifieridentifier : SYMBOL\n                  | uri\n                  | selfself : SELFuri : URIliteral : INTEGER\n               | STRING\n               | DOUBLEliteral : BOOLEAN"
+    
+_lr_action_items = {'EXTENSION':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,29,31,32,33,34,42,44,48,49,50,51,54,56,57,58,59,60,61,62,63,64,66,69,71,72,],[-34,9,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,-11,-9,-10,-16,-7,-38,-34,-8,-34,-13,-21,-12,9,-24,-34,-20,-23,-25,-26,-27,-28,-14,-29,-34,-15,]),'PREFIX':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,29,31,32,33,34,41,42,43,44,45,46,48,50,51,54,58,59,66,67,68,],[-34,15,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,15,15,-11,-9,-10,-16,-7,15,-38,15,-34,15,15,-8,-13,-21,-12,-34,-20,-14,15,15,]),'USE':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,29,31,32,33,34,41,42,43,44,45,46,48,50,51,54,58,59,66,67,68,],[-34,16,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,16,16,-11,-9,-10,-16,-7,16,-38,16,-34,16,16,-8,-13,-21,-12,-34,-20,-14,16,16,]),'INTEGER':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,29,31,32,33,34,41,42,43,44,45,46,48,50,51,54,58,59,66,67,68,],[-34,17,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,17,17,-11,-9,-10,-16,-7,17,-38,17,-34,17,17,-8,-13,-21,-12,-34,-20,-14,17,17,]),'STRING':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,29,31,32,33,34,41,42,43,44,45,46,48,50,51,54,58,59,66,67,68,],[-34,18,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,18,18,-11,-9,-10,-16,-7,18,-38,18,-34,18,18,-8,-13,-21,-12,-34,-20,-14,18,18,]),'DOUBLE':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,29,31,32,33,34,41,42,43,44,45,46,48,50,51,54,58,59,66,67,68,],[-34,19,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,19,19,-11,-9,-10,-16,-7,19,-38,19,-34,19,19,-8,-13,-21,-12,-34,-20,-14,19,19,]),'BOOLEAN':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,26,27,29,31,32,33,34,41,42,43,44,45,46,48,50,51,54,58,59,66,67,68,],[-34,20,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,20,20,-11,-9,-10,-16,-7,20,-38,20,-34,20,20,-8,-13,-21,-12,-34,-20,-14,20,20,]),'SYMBOL':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,41,42,43,44,45,46,48,49,50,51,54,56,57,58,59,60,61,62,63,64,66,67,68,69,71,72,],[-34,10,-2,-1,-3,-4,-5,-6,-16,29,-39,-17,-18,-19,-36,31,10,-44,-45,-46,-47,-37,-40,-41,-43,-42,10,10,10,-11,10,-9,-10,-16,-7,10,-38,10,-34,10,10,-8,-34,-13,-21,-12,10,-24,-34,-20,-23,-25,-26,-27,-28,-14,10,10,-29,-34,-15,]),'URI':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,41,42,43,44,45,46,48,49,50,51,54,56,57,58,59,60,61,62,63,64,66,67,68,69,71,72,],[-34,24,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,24,-44,-45,-46,-47,-37,-40,-41,-43,-42,24,24,24,-11,24,-9,-10,-16,-7,24,-38,24,-34,24,24,-8,-34,-13,-21,-12,24,-24,-34,-20,-23,-25,-26,-27,-28,-14,24,24,-29,-34,-15,]),'SELF':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,41,42,43,44,45,46,48,49,50,51,54,56,57,58,59,60,61,62,63,64,66,67,68,69,71,72,],[-34,25,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,25,-44,-45,-46,-47,-37,-40,-41,-43,-42,25,25,25,-11,25,-9,-10,-16,-7,25,-38,25,-34,25,25,-8,-34,-13,-21,-12,25,-24,-34,-20,-23,-25,-26,-27,-28,-14,25,25,-29,-34,-15,]),'$end':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,17,18,19,20,21,22,23,24,25,29,31,32,33,34,42,44,48,50,51,54,58,59,66,],[-34,0,-2,-1,-3,-4,-5,-6,-16,-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,-11,-9,-10,-16,-7,-38,-34,-8,-13,-21,-12,-34,-20,-14,]),'=':([8,10,14,21,22,23,24,25,31,42,65,],[26,-39,-36,-37,-40,-41,-43,-42,43,-38,67,]),'(':([8,10,14,21,22,23,24,25,29,40,42,44,58,65,71,],[27,-39,-36,-37,-40,-41,-43,-42,41,46,-38,49,49,68,49,]),'ISA':([8,10,14,21,22,23,24,25,33,42,65,],[28,-39,-36,-37,-40,-41,-43,-42,28,-38,28,]),'.':([10,14,21,22,23,24,25,42,],[-39,30,-37,-40,-41,-43,-42,-38,]),',':([10,11,12,13,14,17,18,19,20,21,22,23,24,25,31,32,33,37,39,42,48,51,52,58,59,66,],[-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,-9,-10,-16,45,-32,-38,-8,-21,-33,-34,-20,-14,]),')':([10,11,12,13,14,17,18,19,20,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,41,42,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,68,69,70,71,72,],[-39,-17,-18,-19,-36,-44,-45,-46,-47,-37,-40,-41,-43,-42,-34,-11,-9,-10,-16,44,-30,-31,-35,-32,-34,-38,-34,54,-8,-34,-21,-33,58,-12,59,-22,-24,-34,-20,-23,-25,-26,-27,-28,-14,-34,-29,71,-34,-15,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'forms':([0,],[1,]),'empty':([0,27,41,44,46,49,58,68,71,],[2,38,38,51,38,57,51,38,51,]),'form':([1,],[3,]),'assignment':([1,],[4,]),'extension':([1,56,],[5,64,]),'template':([1,],[6,]),'expr':([1,26,27,41,43,45,46,67,68,],[7,34,39,39,48,52,39,69,39,]),'name':([1,16,26,27,28,41,43,45,46,56,67,68,],[8,32,33,33,40,33,33,33,33,65,33,33,]),'pragma':([1,26,27,41,43,45,46,67,68,],[11,11,11,11,11,11,11,11,11,]),'literal':([1,26,27,41,43,45,46,67,68,],[12,12,12,12,12,12,12,12,12,]),'expansion':([1,26,27,41,43,45,46,56,67,68,],[13,13,13,13,13,13,13,62,13,13,]),'dotted_list':([1,16,26,27,28,41,43,45,46,56,67,68,],[14,14,14,14,14,14,14,14,14,14,14,14,]),'identifier':([1,16,26,27,28,30,41,43,45,46,56,67,68,],[21,21,21,21,21,42,21,21,21,21,21,21,21,]),'uri':([1,16,26,27,28,30,41,43,45,46,56,67,68,],[22,22,22,22,22,22,22,22,22,22,22,22,22,]),'self':([1,16,26,27,28,30,41,43,45,46,56,67,68,],[23,23,23,23,23,23,23,23,23,23,23,23,23,]),'exprlist':([27,41,46,68,],[35,47,53,70,]),'emptylist':([27,41,46,68,],[36,36,36,36,]),'notemptyexprlist':([27,41,46,68,],[37,37,37,37,]),'indentedinstancebody':([44,58,71,],[50,66,72,]),'instancebody':([49,],[55,]),'bodystatements':([49,],[56,]),'bodystatement':([56,],[60,]),'property':([56,],[61,]),'anon_expansion':([56,],[63,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> forms","S'",1,None,None,None),
+  ('forms -> forms form','forms',2,'p_forms','rdfscriptparser.py',32),
+  ('forms -> empty','forms',1,'p_empty_forms','rdfscriptparser.py',38),
+  ('form -> assignment','form',1,'p_form_types','rdfscriptparser.py',43),
+  ('form -> extension','form',1,'p_form_types','rdfscriptparser.py',44),
+  ('form -> template','form',1,'p_form_types','rdfscriptparser.py',45),
+  ('form -> expr','form',1,'p_form_types','rdfscriptparser.py',46),
+  ('assignment -> name = expr','assignment',3,'p_assignment','rdfscriptparser.py',52),
+  ('pragma -> PREFIX SYMBOL = expr','pragma',4,'p_pragma_prefix','rdfscriptparser.py',58),
+  ('pragma -> PREFIX SYMBOL','pragma',2,'p_defaultprefix_pragma','rdfscriptparser.py',64),
+  ('pragma -> USE name','pragma',2,'p_pragma_import','rdfscriptparser.py',70),
+  ('extension -> EXTENSION SYMBOL','extension',2,'p_extension_no_args','rdfscriptparser.py',75),
+  ('extension -> EXTENSION SYMBOL ( exprlist )','extension',5,'p_extension_args','rdfscriptparser.py',80),
+  ('template -> name ( exprlist ) indentedinstancebody','template',5,'p_template','rdfscriptparser.py',86),
+  ('expansion -> name ISA name ( exprlist ) indentedinstancebody','expansion',7,'p_expansion','rdfscriptparser.py',90),
+  ('anon_expansion -> name ( exprlist ) indentedinstancebody','anon_expansion',5,'p_anon_expansion','rdfscriptparser.py',94),
+  ('expr -> name','expr',1,'p_expr','rdfscriptparser.py',103),
+  ('expr -> pragma','expr',1,'p_expr','rdfscriptparser.py',104),
+  ('expr -> literal','expr',1,'p_expr','rdfscriptparser.py',105),
+  ('expr -> expansion','expr',1,'p_expr','rdfscriptparser.py',106),
+  ('indentedinstancebody -> ( instancebody )','indentedinstancebody',3,'p_indentedinstancebody','rdfscriptparser.py',111),
+  ('indentedinstancebody -> empty','indentedinstancebody',1,'p_empty_indentedinstancebody','rdfscriptparser.py',116),
+  ('instancebody -> bodystatements','instancebody',1,'p_instancebody','rdfscriptparser.py',121),
+  ('bodystatements -> bodystatements bodystatement','bodystatements',2,'p_bodystatements','rdfscriptparser.py',128),
+  ('bodystatements -> empty','bodystatements',1,'p_empty_bodystatements','rdfscriptparser.py',134),
+  ('bodystatement -> property','bodystatement',1,'p_bodystatement','rdfscriptparser.py',139),
+  ('bodystatement -> expansion','bodystatement',1,'p_bodystatement','rdfscriptparser.py',140),
+  ('bodystatement -> anon_expansion','bodystatement',1,'p_bodystatement','rdfscriptparser.py',141),
+  ('bodystatement -> extension','bodystatement',1,'p_bodystatement','rdfscriptparser.py',142),
+  ('property -> name = expr','property',3,'p_property','rdfscriptparser.py',147),
+  ('exprlist -> emptylist','exprlist',1,'p_exprlist','rdfscriptparser.py',155),
+  ('exprlist -> notemptyexprlist','exprlist',1,'p_exprlist','rdfscriptparser.py',156),
+  ('notemptyexprlist -> expr','notemptyexprlist',1,'p_not_empty_exprlist_1','rdfscriptparser.py',161),
+  ('notemptyexprlist -> notemptyexprlist , expr','notemptyexprlist',3,'p_not_empty_exprlist_n','rdfscriptparser.py',166),
+  ('empty -> <empty>','empty',0,'p_empty','rdfscriptparser.py',172),
+  ('emptylist -> empty','emptylist',1,'p_emptylist','rdfscriptparser.py',177),
+  ('name -> dotted_list','name',1,'p_dotted_name','rdfscriptparser.py',184),
+  ('dotted_list -> identifier','dotted_list',1,'p_dotted_list_1','rdfscriptparser.py',190),
+  ('dotted_list -> dotted_list . identifier','dotted_list',3,'p_dotted_list_n','rdfscriptparser.py',195),
+  ('identifier -> SYMBOL','identifier',1,'p_identifier','rdfscriptparser.py',201),
+  ('identifier -> uri','identifier',1,'p_identifier','rdfscriptparser.py',202),
+  ('identifier -> self','identifier',1,'p_identifier','rdfscriptparser.py',203),
+  ('self -> SELF','self',1,'p_self','rdfscriptparser.py',208),
+  ('uri -> URI','uri',1,'p_uri','rdfscriptparser.py',213),
+  ('literal -> INTEGER','literal',1,'p_literal','rdfscriptparser.py',220),
+  ('literal -> STRING','literal',1,'p_literal','rdfscriptparser.py',221),
+  ('literal -> DOUBLE','literal',1,'p_literal','rdfscriptparser.py',222),
+  ('literal -> BOOLEAN','literal',1,'p_literal_boolean','rdfscriptparser.py',227),
+]
@@ -0,0 +1,385 @@
+from .core import (Name,
+                   Uri,
+                   Self,
+                   Assignment)
+
+from .pragma import (PrefixPragma,
+                     DefaultPrefixPragma,
+                     ImportPragma,
+                     ExtensionPragma)
+
+from .template import (Template,
+                       Property,
+                       Expansion)
+
+_pragmas = (PrefixPragma, DefaultPrefixPragma, ImportPragma)
+
+
+class StaticScope:
+    """
+    What is known, without evaluating anything, about the environment
+    in which the next top-level form will be evaluated.
+
+    The scope starts from a snapshot of an Env, if one is given, and
+    follows the prefix pragmas, assignments and templates of each form
+    recorded. Anything it cannot follow, such as an import, makes the
+    scope opaque, after which no name is resolved.
+    """
+
+    def __init__(self, env=None):
+
+        self._opaque = False
+        self._closed = True
+        self._prefixes = {}
+        self._bound = set()
+        self._templates = {}
+        self._default = None
+        self._default_prefix = None
+        # the namespace of unprefixed names when no prefix is default
+        self._namespace = None
+
+        if env is not None:
+            self._prefixes = {prefix: uri.uri
+                              for (prefix, uri) in env.prefixes.items()}
+            self._bound = set(uri.uri for uri in env.bindings)
+            self._templates = {uri.uri: None for uri in env.templates}
+            self._default = env.uri.uri
+            self._default_prefix = env.prefix
+            self._namespace = env.namespace.uri
+
+    @property
+    def opaque(self):
+        return self._opaque
+
+    def make_opaque(self):
+        self._opaque = True
+
+    def prefix(self, prefix):
+        """The namespace bound to prefix, or None if not known."""
+        return self._prefixes.get(prefix, None)
+
+    @property
+    def default_prefix(self):
+        return self._default_prefix
+
+    @default_prefix.setter
+    def default_prefix(self, prefix):
+        # as Env.prefix, which goes back to the graph's namespace when
+        # given None
+        if prefix is not None:
+            self._default = self._prefixes.get(prefix, None)
+        else:
+            self._default = self._namespace
+        self._default_prefix = prefix
+
+    def has_template(self, uri):
+        """True if a template is known to be defined at uri."""
+        return not self._opaque and uri in self._templates
+
+    def template(self, uri):
+        """The Template defined at uri, or None if not known."""
+        if self._opaque:
+            return None
+        return self._templates.get(uri, None)
+
+    def template_is_empty(self, uri):
+        """True if the template at uri is known to have an empty body."""
+        template = self.template(uri)
+        return template is not None and len(template.body) == 0
+
+    def resolve(self, name):
+        """
+        The URI, as a string, that name would evaluate to here, or None
+        if that cannot be known statically. This follows Name.evaluate,
+        and gives up wherever a binding could change the result.
+        """
+        if self._opaque:
+            return None
+        elif isinstance(name, Uri):
+            return name.uri
+        elif not isinstance(name, Name):
+            return None
+
+        names = name.names
+        uri = self._default
+        for n in range(0, len(names)):
+            segment = names[n]
+            if isinstance(segment, Self):
+                return None
+            elif isinstance(segment, Uri) and n == 0:
+                uri = segment.uri
+            elif n == 0 and len(names) > 1 and segment in self._prefixes:
+                uri = self._prefixes[segment]
+            elif n == 0 and len(names) > 1 and not self._closed:
+                return None
+            elif uri is not None:
+                uri = uri + (segment.uri if isinstance(segment, Uri) else segment)
+
+            if uri is None or uri in self._bound:
+                return None
+
+        return uri
+
+    def record(self, form):
+        """Update the scope with the effects of evaluating form."""
+        if isinstance(form, Assignment):
+            self._assign(self.resolve(form.name))
+        elif isinstance(form, PrefixPragma):
+            self._bind(form.prefix, self.resolve(form.uri))
+        elif isinstance(form, DefaultPrefixPragma):
+            self.default_prefix = form.prefix
+        elif isinstance(form, ImportPragma):
+            self._opaque = True
+        elif isinstance(form, Template):
+            uri = self.resolve(form.name)
+            if uri is None:
+                self._opaque = True
+            else:
+                self._templates[uri] = form
+
+    def _assign(self, uri):
+        if uri is None:
+            self._opaque = True
+        else:
+            self._bound.add(uri)
+
+    def _bind(self, prefix, uri):
+        # mirrors rdflib: a prefix in use keeps its namespace and the
+        # new one is bound to a generated prefix, while a namespace in
+        # use is moved from its old prefix to the new one
+        if uri is None:
+            self._prefixes = {}
+            self._closed = False
+            return
+
+        known = self._closed or prefix in self._prefixes
+        current = self._prefixes.pop(prefix, None)
+        for (other, namespace) in list(self._prefixes.items()):
+            if namespace == uri:
+                del self._prefixes[other]
+
+        if known and current is None:
+            self._prefixes[prefix] = uri
+        else:
+            self._closed = False
+            if current is not None:
+                self._prefixes[prefix] = current
+
+
+def transform(node, visit):
+    """
+    Rebuild node from the bottom up, replacing each language object
+    with the result of calling visit on it. Objects whose children are
+    unchanged are not rebuilt.
+    """
+    if isinstance(node, Assignment):
+        name = transform(node.name, visit)
+        value = transform(node.value, visit)
+        if name is not node.name or value is not node.value:
+            node = Assignment(name, value, node.location)
+
+    elif isinstance(node, PrefixPragma):
+        uri = transform(node.uri, visit)
+        if uri is not node.uri:
+            node = PrefixPragma(node.prefix, uri, node.location)
+
+    elif isinstance(node, ImportPragma):
+        target = transform(node.target, visit)
+        if target is not node.target:
+            node = ImportPragma(target, node.location)
+
+    elif isinstance(node, ExtensionPragma):
+        args = transform_all(node.args, visit)
+        if args is not node.args:
+            node = ExtensionPragma(node.name, args, node.location)
+
+    elif isinstance(node, Template):
+        name = transform(node.name, visit)
+        body = transform_all(node.body, visit)
+        if name is not node.name or body is not node.body:
+            node = Template(name,
+                            [parameter.as_name() for parameter in node.parameters],
+                            body,
+                            location=node.location)
+
+    elif isinstance(node, Expansion):
+        name = transform(node.name, visit)
+        template = transform(node.template, visit)
+        args = [arg.value for arg in node.args]
+        new_args = transform_all(args, visit)
+        body = transform_all(node.body, visit)
+        extensions = transform_all(node.extensions, visit)
+        if (name is not node.name or
+                template is not node.template or
+                new_args is not args or
+                body is not node.body or
+                extensions is not node.extensions):
+            node = Expansion(name,
+                             template,
+                             new_args,
+                             body + extensions,
+                             node.location)
+
+    elif isinstance(node, Property):
+        name = transform(node.name, visit)
+        value = transform(node.value, visit)
+        if name is not node.name or value is not node.value:
+            node = Property(name, value, node.location)
+
+    if node is None:
+        return None
+    return visit(node)
+
+
+def transform_all(nodes, visit):
+    """As transform, for a list of nodes; the same list if unchanged."""
+    new_nodes = [transform(node, visit) for node in nodes]
+    if all(new is old for (new, old) in zip(new_nodes, nodes)):
+        return nodes
+    return new_nodes
+
+
+def walk(node):
+    """Every language object in the tree rooted at node."""
+    found = []
+    transform(node, lambda n: found.append(n) or n)
+    return found
+
+
+class Pass:
+    """
+    A rewrite of the language objects in each top-level form, made
+    before the form is evaluated. The result of evaluating a rewritten
+    form must be the same as that of the original.
+
+    Subclasses implement rewrite_node, which is given each object in
+    the form, children first, and returns it or its replacement. They
+    add the number of objects they replace or remove to rewritten.
+    """
+
+    name = 'pass'
+
+    def __init__(self):
+        self.rewritten = 0
+
+    def rewrite(self, form, scope):
+        return transform(form, lambda node: self.rewrite_node(node, scope))
+
+    def rewrite_node(self, node, scope):
+        return node
+
+
+class FoldUriNames(Pass):
+    """Replace names made only of URIs, such as <a>, with a Uri."""
+
+    name = 'fold-uri-names'
+
+    def rewrite_node(self, node, scope):
+        if (isinstance(node, Name) and
+                all(isinstance(name, Uri) for name in node.names)):
+            uri = scope.resolve(node)
+            if uri is not None:
+                self.rewritten += 1
+                return Uri(uri, location=node.location)
+
+        return node
+
+
+class ResolvePrefixedNames(Pass):
+    """
+    Replace names such as prefix.local with a Uri, where the prefix
+    pragmas seen so far make the namespace of prefix certain.
+    """
+
+    name = 'resolve-prefixed-names'
+
+    def rewrite_node(self, node, scope):
+        if (isinstance(node, Name) and
+                len(node.names) > 1 and
+                isinstance(node.names[0], str) and
+                scope.prefix(node.names[0]) is not None):
+            uri = scope.resolve(node)
+            if uri is not None:
+                self.rewritten += 1
+                return Uri(uri, location=node.location)
+
+        return node
+
+
+class DropEmptyExpansions(Pass):
+    """
+    Remove from template and expansion bodies the expansions of
+    templates with empty bodies, which produce no triples, when they
+    have no body or extensions of their own.
+    """
+
+    name = 'drop-empty-expansions'
+
+    def rewrite_node(self, node, scope):
+        if isinstance(node, (Template, Expansion)):
+            body = [statement for statement in node.body
+                    if not self.is_empty(statement, scope)]
+            if len(body) < len(node.body):
+                self.rewritten += len(node.body) - len(body)
+                if isinstance(node, Template):
+                    return Template(node.name,
+                                    [p.as_name() for p in node.parameters],
+                                    body,
+                                    location=node.location)
+                else:
+                    return Expansion(node.name,
+                                     node.template,
+                                     [arg.value for arg in node.args],
+                                     body + node.extensions,
+                                     node.location)
+
+        return node
+
+    def is_empty(self, statement, scope):
+        return (isinstance(statement, Expansion) and
+                len(statement.body) == 0 and
+                len(statement.extensions) == 0 and
+                scope.template_is_empty(scope.resolve(statement.template)))
+
+
+def default_passes():
+    return [FoldUriNames(), ResolvePrefixedNames(), DropEmptyExpansions()]
+
+
+class PassPipeline:
+    """
+    An ordered list of passes, applied to each form of a stream before
+    it is evaluated, and the scope they share.
+    """
+
+    def __init__(self, passes=None):
+
+        if passes is None:
+            passes = default_passes()
+        self._passes = list(passes)
+
+    @property
+    def passes(self):
+        return self._passes
+
+    def run(self, forms, env=None):
+        """
+        Yield each of forms rewritten by every pass in turn. A scope is
+        started from env, the environment the forms will be evaluated
+        in, when the first form is requested.
+        """
+        scope = StaticScope(env)
+        for form in forms:
+            if any(isinstance(node, _pragmas) for node in walk(form)
+                   if node is not form):
+                scope.make_opaque()
+
+            for each in self._passes:
+                form = each.rewrite(form, scope)
+
+            scope.record(form)
+            yield form
+
+    def report(self):
+        """(name, rewritten) for each pass, in order."""
+        return [(each.name, each.rewritten) for each in self._passes]
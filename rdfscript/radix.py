@@ -0,0 +1,221 @@
+class RadixTree:
+    """
+    A map from strings to values, stored as a radix tree: each edge is
+    labelled with a run of characters, and the key of a node is the
+    labels on the path to it.
+
+    Besides get, a key can be looked up piece by piece: find gives the
+    position reached by a string, and advance moves a position on by
+    another. A dotted name is looked up that way, one segment at a
+    time, without building the string for each prefix of the name.
+
+    A fork shares every node with the tree it came from, and either
+    copies a node before changing it, so neither sees the other's
+    changes.
+    """
+
+    def __init__(self):
+
+        # the nodes this tree may change in place are marked with owner
+        self._owner = object()
+        self._root = _Node(self._owner)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def __iter__(self):
+        """Every (key, value) in the tree, in no particular order."""
+        stack = [('', self._root)]
+        while stack:
+            (key, node) = stack.pop()
+            if node.bound:
+                yield (key, node.value)
+            for (label, child) in node.edges.values():
+                stack.append((key + label, child))
+
+    def fork(self):
+        """A copy of the tree, made without copying any node."""
+        tree = RadixTree()
+        tree._root = self._root
+        tree._size = self._size
+        # the nodes are shared now, so this tree must copy them too
+        self._owner = object()
+        return tree
+
+    def insert(self, key, value):
+        node = self._owned_root()
+        i = 0
+        while i < len(key):
+            edge = node.edges.get(key[i])
+            if edge is None:
+                child = _Node(self._owner)
+                node.edges[key[i]] = (key[i:], child)
+                node = child
+                break
+
+            (label, child) = edge
+            common = _common_length(label, key, i)
+            if common < len(label):
+                # split the edge where the key leaves it
+                middle = _Node(self._owner)
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[key[i]] = (label[:common], middle)
+                child = middle
+            elif child.owner is not self._owner:
+                child = child.copy(self._owner)
+                node.edges[key[i]] = (label, child)
+            node = child
+            i += common
+
+        if not node.bound:
+            self._size += 1
+        node.bound = True
+        node.value = value
+
+    def get(self, key, default=None):
+        position = self.advance(self.start, key)
+        return self.value(position, default)
+
+    def remove(self, key):
+        """Remove key, leaving the shape of the tree as it is."""
+        position = self.advance(self.start, key)
+        if position is None or position[1] is not None or not position[0].bound:
+            raise KeyError(key)
+
+        node = self._owned_root()
+        i = 0
+        while i < len(key):
+            (label, child) = node.edges[key[i]]
+            if child.owner is not self._owner:
+                child = child.copy(self._owner)
+                node.edges[key[i]] = (label, child)
+            node = child
+            i += len(label)
+
+        node.bound = False
+        node.value = None
+        self._size -= 1
+
+    @property
+    def start(self):
+        """The position of the empty string."""
+        return (self._root, None, 0)
+
+    def find(self, key):
+        """
+        The position reached by key, or None if no key begins with it.
+        Removed keys keep their path, so may still be found.
+        """
+        return self.advance(self.start, key)
+
+    def advance(self, position, piece):
+        """
+        The position reached by following piece from position, or None
+        if no key continues that way.
+        """
+        if position is None:
+            return None
+
+        (node, edge, offset) = position
+        i = 0
+        while i < len(piece):
+            if edge is None:
+                edge = node.edges.get(piece[i])
+                if edge is None:
+                    return None
+                offset = 0
+
+            label = edge[0]
+            common = _common_length(label, piece, i, offset)
+            if common == 0:
+                return None
+            i += common
+            offset += common
+            if offset == len(label):
+                node = edge[1]
+                edge = None
+                offset = 0
+            elif i < len(piece):
+                return None
+
+        return (node, edge, offset)
+
+    def value(self, position, default=None):
+        """The value of the key that ends at position, or default."""
+        if position is None or position[1] is not None:
+            return default
+        node = position[0]
+        if not node.bound:
+            return default
+        return node.value
+
+    def longest_prefix(self, key):
+        """
+        The longest key in the tree that key begins with, and its
+        value, or (None, None) if there is none.
+        """
+        node = self._root
+        found = (None, None)
+        if node.bound:
+            found = ('', node.value)
+
+        i = 0
+        while i < len(key):
+            edge = node.edges.get(key[i])
+            if edge is None:
+                break
+            (label, child) = edge
+            if not key.startswith(label, i):
+                break
+            i += len(label)
+            node = child
+            if node.bound:
+                found = (key[:i], node.value)
+
+        return found
+
+    def _owned_root(self):
+        if self._root.owner is not self._owner:
+            self._root = self._root.copy(self._owner)
+        return self._root
+
+
+class _Node:
+
+    __slots__ = ('edges', 'bound', 'value', 'owner')
+
+    def __init__(self, owner):
+
+        # each edge is keyed by its first character: (label, child)
+        self.edges = {}
+        self.bound = False
+        self.value = None
+        self.owner = owner
+
+    def copy(self, owner):
+        node = _Node(owner)
+        node.edges = dict(self.edges)
+        node.bound = self.bound
+        node.value = self.value
+        return node
+
+
+def _common_length(label, key, start, offset=0):
+    """
+    How many characters of label, from offset, match key from start.
+    """
+    n = min(len(label) - offset, len(key) - start)
+    if key.startswith(label[offset:offset + n], start):
+        return n
+
+    common = 0
+    while common < n and label[offset + common] == key[start + common]:
+        common += 1
+    return common
+
+
+_missing = object()
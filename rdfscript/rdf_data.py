@@ -1,11 +1,16 @@
 import rdflib
 import pdb
+import re
 
 from .core import Uri, Value
 from .error import InternalError, PrefixError
+from .radix import RadixTree
 from pysbolgraph.SBOL2Serialize import serialize_sboll2
 from pysbolgraph.SBOL2Graph import SBOL2Graph
 
+# the number of terms RDFData keeps before it starts again
+RECENT_TERMS = 4096
+
 
 class RDFData(object):
     """
@@ -18,26 +23,74 @@ class RDFData(object):
 
         self._g = rdflib.Graph()
         self._serializer = serializer
+        # the terms of recently added values, see to_rdf
+        self._recent_terms = {}
+        # the prefix index: each bound prefix's namespace, and each bound
+        # namespace's prefix, kept in step with the graph by bind_prefix
+        self._namespace_of = {}
+        self._prefix_of = {}
+        # and every bound namespace again, for longest-match compaction
+        self._namespace_tree = RadixTree()
+        for (prefix, namespace) in self._g.namespaces():
+            self._namespace_of[prefix] = str(namespace)
+            self._prefix_of[str(namespace)] = prefix
+            self._namespace_tree.insert(str(namespace), prefix)
+
+    def fork(self):
+        """
+        An RDFData with an empty graph of the same identifier, so the
+        same namespace for unprefixed names, and the same prefixes bound
+        as this one has now.
+        """
+        data = RDFData.__new__(RDFData)
+        data._g = rdflib.Graph(identifier=self._g.identifier,
+                               bind_namespaces='none')
+        data._serializer = self._serializer
+        data._recent_terms = {}
+
+        store = data._g.namespace_manager.store
+        for (prefix, namespace) in self._namespace_of.items():
+            store.bind(prefix, rdflib.URIRef(namespace))
+        data._namespace_of = dict(self._namespace_of)
+        data._prefix_of = dict(self._prefix_of)
+        data._namespace_tree = self._namespace_tree.fork()
+        return data
 
     @property
     def namespace(self):
         return self.from_rdf(self._g.identifier)
 
     def to_rdf(self, language_object):
-        if isinstance(language_object, Uri):
-            return rdflib.URIRef(language_object.uri)
-        elif isinstance(language_object, Value):
-            return rdflib.Literal(language_object.value)
-        else:
+        """
+        The rdflib term for a Uri or Value. Each Uri and Value keeps its
+        own term, and the terms of the last few thousand values are kept
+        here too, so a value that recurs across many triples is usually
+        converted once without holding every value ever added.
+        """
+        if not isinstance(language_object, (Uri, Value)):
             pdb.set_trace()
             raise InternalError(language_object,
                                 language_object.location)
 
+        term = self._recent_terms.get(language_object)
+        if term is None:
+            term = language_object.rdf_term()
+            if len(self._recent_terms) >= RECENT_TERMS:
+                self._recent_terms.clear()
+            self._recent_terms[language_object] = term
+        return term
+
     def from_rdf(self, rdf_object):
         if isinstance(rdf_object, rdflib.URIRef):
             return Uri(rdf_object.toPython(), None)
         elif isinstance(rdf_object, rdflib.Literal):
-            return Value(rdf_object.toPython(), None)
+            value = rdf_object.toPython()
+            if isinstance(value, rdflib.Literal):
+                value = str(rdf_object)
+            datatype = rdf_object.datatype
+            if datatype is not None:
+                datatype = Uri(datatype.toPython())
+            return Value(value, None, datatype, rdf_object.language)
         elif isinstance(rdf_object, rdflib.Namespace):
             return self.from_rdf(rdflib.URIRef(rdf_object))
         elif isinstance(rdf_object, rdflib.BNode):
@@ -79,33 +132,93 @@ class RDFData(object):
     def bind_prefix(self, prefix, uri):
         u = self.to_rdf(uri)
         self._g.bind(prefix, u)
+        self._index_binding(str(u))
         return prefix
 
-    def uri_for_prefix(self, prefix):
+    def _index_binding(self, namespace):
+        """
+        Bring the prefix index up to date after namespace was bound.
+        rdflib may have bound it under another prefix than the one
+        asked for, or moved it from the prefix it had, so the prefix it
+        ended up with is read back from the graph's store.
+        """
+        bound = self._g.namespace_manager.store.prefix(rdflib.URIRef(namespace))
+        if bound is None:
+            return
+
+        old_prefix = self._prefix_of.get(namespace)
+        if old_prefix is not None and old_prefix != bound:
+            del self._namespace_of[old_prefix]
+        old_namespace = self._namespace_of.get(bound)
+        if old_namespace is not None and old_namespace != namespace:
+            del self._prefix_of[old_namespace]
+            self._namespace_tree.remove(old_namespace)
+
+        self._namespace_of[bound] = namespace
+        self._prefix_of[namespace] = bound
+        self._namespace_tree.insert(namespace, bound)
 
-        namespaces = self._g.namespaces()
-        matching = [n for (p, n) in namespaces if p == prefix]
+    @property
+    def prefixes(self):
+        """A dictionary of every bound prefix and its Uri."""
+        return {prefix: Uri(namespace)
+                for (prefix, namespace) in self._namespace_of.items()}
+
+    def uri_for_prefix(self, prefix):
 
-        if len(matching) == 1:
-            return self.from_rdf(rdflib.Namespace(matching[0]))
-        elif len(matching) == 0:
+        namespace = self._namespace_of.get(prefix)
+        if namespace is None:
             raise PrefixError(None, None)
-        else:
-            raise InternalError(prefix)
 
-    def prefix_for_uri(self, uri):
+        return Uri(namespace)
 
-        u = self.to_rdf(uri)
-        namespaces = self._g.namespaces()
-        matching = [p for (p, n) in namespaces if n == u]
+    def prefix_for_uri(self, uri):
 
-        if len(matching) == 1:
-            return matching[0]
-        elif len(matching) == 0:
+        prefix = self._prefix_of.get(uri.uri)
+        if prefix is None:
             raise PrefixError(uri, uri.location)
 
+        return prefix
+
+    def compact(self, uri):
+        """
+        The prefix of the longest bound namespace that uri is in, and
+        the rest of uri after it, or None if uri is in no namespace.
+        """
+        (namespace, prefix) = self._namespace_tree.longest_prefix(uri.uri)
+        if namespace is None:
+            return None
+        return (prefix, uri.uri[len(namespace):])
+
+    def write_compact(self):
+        """
+        The graph as Turtle, one triple per line, with each URI written
+        as prefix:local under its longest bound namespace where that
+        makes a valid prefixed name.
+        """
+        used = set()
+
+        def term(rdf_term):
+            if isinstance(rdf_term, rdflib.URIRef):
+                compacted = self.compact(Uri(str(rdf_term)))
+                if compacted is not None:
+                    (prefix, local) = compacted
+                    if (_turtle_prefix.fullmatch(prefix) and
+                            _turtle_local.fullmatch(local)):
+                        used.add(prefix)
+                        return prefix + ':' + local
+            return rdf_term.n3()
+
+        lines = [' '.join([term(s), term(p), term(o)]) + ' .'
+                 for (s, p, o) in self._g.triples((None, None, None))]
+        header = ['@prefix %s: <%s> .' % (prefix, self._namespace_of[prefix])
+                  for prefix in sorted(used)]
+        return '\n'.join(header + [''] + lines) + '\n'
+
     def serialise(self):
-        if self._serializer == 'rdfxml':
+        if self._serializer == 'compact':
+            return self.write_compact()
+        elif self._serializer == 'rdfxml':
             return self._g.serialize(format='xml').decode("utf-8")
         elif self._serializer == 'nt':
             return self._g.serialize(format='nt').decode("utf-8")
@@ -117,3 +230,8 @@ class RDFData(object):
             pysbolG = SBOL2Graph()
             pysbolG.g = self._g
             return serialize_sboll2(pysbolG).decode("utf-8")
+
+
+# conservative forms of Turtle's PN_PREFIX and PN_LOCAL
+_turtle_prefix = re.compile(r'([A-Za-z][A-Za-z0-9_\-]*)?')
+_turtle_local = re.compile(r'[A-Za-z0-9_]([A-Za-z0-9_\-]*)')
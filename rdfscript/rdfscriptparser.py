@@ -1,7 +1,13 @@
 import ply.yacc as yacc
 import ply.lex as lex
 import logging
+import copy
+import os
+import queue
+import threading
 from . import reader
+from .scanner import (Scanner,
+                      CHUNK_SIZE)
 
 from .reader import tokens
 
@@ -22,11 +28,27 @@ from .template import (Template,
 
 from .error import RDFScriptSyntax
 
+from .sharing import (SubtreeTable,
+                      unshared)
+
+from .location import (Position,
+                       Location,
+                       new_line_index,
+                       register_source,
+                       source_id)
+
 
 # script level
+# lists are left-recursive and built in place, so each element costs
+# O(1) and the parser stack does not grow with the length of the list
 def p_forms(p):
-    '''forms : form forms'''
-    p[0] = [p[1]] + p[2]
+    '''forms : forms form'''
+    sink = getattr(p.parser, 'form_sink', None)
+    if sink is not None:
+        sink(p[2])
+    else:
+        p[1].append(p[2])
+    p[0] = p[1]
 
 
 def p_empty_forms(p):
@@ -79,15 +101,15 @@ def p_extension_args(p):
 
 def p_template(p):
     '''template : name '(' exprlist ')' indentedinstancebody'''
-    p[0] = Template(p[1], p[3], p[5], location=location(p))
+    p[0] = Template(own(p, 1), p[3], p[5], location=location(p))
 
 def p_expansion(p):
     '''expansion : name ISA name '(' exprlist ')' indentedinstancebody'''
-    p[0] = Expansion(p[1], p[3], p[5], p[7], location(p))
+    p[0] = Expansion(p[1], own(p, 3), p[5], p[7], location(p))
 
 def p_anon_expansion(p):
     '''anon_expansion : name '(' exprlist ')' indentedinstancebody'''
-    p[0] = Expansion(None, p[1], p[3], p[5], location(p))
+    p[0] = Expansion(None, own(p, 1), p[3], p[5], location(p))
 
 # def p_triple(p):
 #     '''triple : name name expr'''
@@ -120,8 +142,9 @@ def p_instancebody(p):
 
 
 def p_bodystatements(p):
-    '''bodystatements : bodystatement bodystatements'''
-    p[0] = [p[1]] + p[2]
+    '''bodystatements : bodystatements bodystatement'''
+    p[1].append(p[2])
+    p[0] = p[1]
 
 
 def p_empty_bodystatements(p):
@@ -140,7 +163,10 @@ def p_bodystatement(p):
 def p_property(p):
     '''property : name '=' expr'''
 #                | name '=' expansion'''
-    p[0] = Property(p[1], p[3], location=location(p))
+    if isinstance(p[3], Expansion):
+        p[0] = Property(p[1], p[3], location=location(p))
+    else:
+        p[0] = located(p, Property, p[1], p[3])
 
 # lists
 
@@ -153,12 +179,13 @@ def p_exprlist(p):
 
 def p_not_empty_exprlist_1(p):
     '''notemptyexprlist : expr'''
-    p[0] = [p[1]]
+    p[0] = [own(p, 1)]
 
 
 def p_not_empty_exprlist_n(p):
-    '''notemptyexprlist : expr ',' notemptyexprlist'''
-    p[0] = [p[1]] + p[3]
+    '''notemptyexprlist : notemptyexprlist ',' expr'''
+    p[1].append(own(p, 3))
+    p[0] = p[1]
 
 
 def p_empty(p):
@@ -175,8 +202,7 @@ def p_emptylist(p):
 
 def p_dotted_name(p):
     '''name : dotted_list'''
-    l = location(p)
-    p[0] = Name(*p[1], location=l)
+    p[0] = located(p, Name, *p[1])
 
 
 def p_dotted_list_1(p):
@@ -185,8 +211,9 @@ def p_dotted_list_1(p):
 
 
 def p_dotted_list_n(p):
-    '''dotted_list : identifier '.' dotted_list'''
-    p[0] = [p[1]] + p[3]
+    '''dotted_list : dotted_list '.' identifier'''
+    p[1].append(p[3])
+    p[0] = p[1]
 
 
 def p_identifier(p):
@@ -198,12 +225,12 @@ def p_identifier(p):
 
 def p_self(p):
     '''self : SELF'''
-    p[0] = Self(location(p))
+    p[0] = Self()
 
 
 def p_uri(p):
     '''uri : URI'''
-    p[0] = Uri(p[1], location=location(p))
+    p[0] = located(p, Uri, p[1])
 
 # literal objects
 
@@ -212,15 +239,12 @@ def p_literal(p):
     '''literal : INTEGER
                | STRING
                | DOUBLE'''
-    p[0] = Value(p[1], location(p))
+    p[0] = located(p, Value, p[1])
 
 
 def p_literal_boolean(p):
     '''literal : BOOLEAN'''
-    if p[1] == 'true':
-        p[0] = Value(True, location(p))
-    else:
-        p[0] = Value(False, location(p))
+    p[0] = located(p, Value, p[1] == 'true')
 
 # SYNTAX ERROR
 
@@ -229,98 +253,238 @@ def p_error(p):
     if not p:
         pass
     else:
-        location = Location(Position(p.lineno, p.lexpos), p.lexer.filename)
+        lexed_from = p.lexer.source_id
+        if lexed_from is None:
+            lexed_from = source_id(p.lexer.filename)
+        location = Location(p.lexpos, lexed_from)
         raise RDFScriptSyntax(p, location)
 
 
 def location(p):
-    pos = Position(p.lineno(0), p.lexpos(0))
-    return Location(pos, p.parser.filename)
+    if not p.parser.track_locations:
+        return None
+    return Location(p.lexpos(0), p.parser.source_id)
 
 
-def make_parser(filename=None):
-    parser = yacc.yacc()
-    parser.filename = filename
-    return parser
+def located(p, cls, *args):
+    """
+    A cls(*args) at the location of p. When the parser shares subtrees
+    this is the shared equal object instead, which has no location.
+    """
+    subtrees = p.parser.subtrees
+    if subtrees is None:
+        return cls(*args, location=location(p))
+    return subtrees.share(cls(*args))
 
 
-def make_lexer(filename=None):
-    lexer = lex.lex(module=reader)
-    lexer.open_brackets = 0
-    lexer.filename = filename
-    return lexer
+def own(p, n):
+    """
+    p[n], or when it is a shared object, an equal one of its own at the
+    location of p[n]. Template names, parameters and arguments are kept
+    as their own objects, as errors in them report where they are.
+    """
+    subtrees = p.parser.subtrees
+    if subtrees is None or p[n] not in subtrees or not p.parser.track_locations:
+        return p[n]
+    return unshared(p[n], Location(p.lexpos(n), p.parser.source_id))
 
 
-class RDFScriptParser:
+def user_cache_dir():
+    """The per-user directory in which rdfscript keeps generated data."""
+    base = os.environ.get('XDG_CACHE_HOME',
+                          os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'rdfscript')
 
-    def __init__(self, debug_lvl=0, filename=None):
 
-        self.scanner = make_lexer(filename)
-        self.debug = debug_lvl != 0
-        self.dbg_logger = None
-        if debug_lvl == 2:
-            self.dbg_logger = logging.getLogger()
+def _table_options():
+    """
+    Where the LALR tables live: alongside this module when the package
+    directory is writable (the shipped parsetab.py), otherwise pickled
+    into the user cache directory. Never the current directory.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    if os.access(package_dir, os.W_OK):
+        return {'tabmodule': 'parsetab', 'outputdir': package_dir}
 
-        self.parser = make_parser(filename)
+    cache_dir = user_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    return {'picklefile': os.path.join(cache_dir, 'parsetab.pickle')}
 
-    def parse(self, script):
 
-        return self.parser.parse(script,
-                                 lexer=self.scanner,
-                                 tracking=True,
-                                 debug=self.dbg_logger)
+_master_parser = None
+_master_lexer = None
 
 
-class Position:
+def master_parser():
+    """The process-wide parser, built (or loaded from tables) once."""
+    global _master_parser
+    if _master_parser is None:
+        _master_parser = yacc.yacc(debug=False, **_table_options())
+    return _master_parser
 
-    def __init__(self, line, col):
 
-        self._line = line
-        self._col = col
+def master_lexer():
+    """The process-wide lexer, built once from the reader module."""
+    global _master_lexer
+    if _master_lexer is None:
+        _master_lexer = lex.lex(module=reader)
+    return _master_lexer
 
-    def __repr__(self):
-        return format("(%s, %s)" % (self.line, self.col))
 
-    @property
-    def line(self):
-        return self._line
+def make_parser(filename=None):
+    parser = copy.copy(master_parser())
+    parser.filename = filename
+    parser.source_id = source_id(filename)
+    parser.track_locations = True
+    parser.form_sink = None
+    parser.subtrees = None
+    return parser
 
-    @property
-    def col(self):
-        return self._col
 
+LEXER_ENGINES = ['ply', 'scanner']
 
-class Location:
 
-    def __init__(self, position, filename=None):
+def make_lexer(filename=None, engine='ply'):
+    if engine == 'ply':
+        lexer = master_lexer().clone()
+    elif engine == 'scanner':
+        lexer = Scanner()
+    else:
+        raise ValueError("Unknown lexer engine '%s'" % engine)
+
+    lexer.lineno = 1
+    lexer.open_brackets = 0
+    lexer.filename = filename
+    lexer.line_starts = new_line_index()
+    lexer.source_id = None
+    return lexer
 
-        self._position = position
 
-        if not filename:
-            self._filename = "REPL"
-        else:
-            self._filename = filename
+def feed(lexer, script):
+    """Give script, a string or a stream, to lexer as its input."""
+    if isinstance(script, str):
+        lexer.input(script)
+    elif isinstance(lexer, Scanner):
+        lexer.input_stream(script)
+    else:
+        lexer.input(''.join(iter(lambda: script.read(CHUNK_SIZE), '')))
 
-    def __repr__(self):
-        return format("%s in '%s'" % (self.position, self.filename))
 
-    @property
-    def position(self):
-        return self._position
+class RDFScriptParser:
 
-    @property
-    def filename(self):
-        return self._filename
+    def __init__(self,
+                 debug_lvl=0,
+                 filename=None,
+                 track_locations=True,
+                 lexer='ply',
+                 share_subtrees=False):
 
-    @property
-    def col_on_line(self):
-        with open(self.filename) as infile:
-            characters = 0
-            for lineno, line in enumerate(infile, 1):
-                if lineno == self.position.line:
-                    return self.position.col - characters
-                characters += sum(len(word) for word in line)
-            return self.position.col
+        self.lexer_engine = lexer
+        self.scanner = make_lexer(filename, engine=lexer)
+        self.debug = debug_lvl != 0
+        self.dbg_logger = None
+        if debug_lvl == 2:
+            self.dbg_logger = logging.getLogger()
 
+        self.parser = make_parser(filename)
+        self.track_locations = track_locations
+        self.parser.track_locations = track_locations
+        self.subtrees = SubtreeTable() if share_subtrees else None
+        self.parser.subtrees = self.subtrees
+
+    def register(self, script):
+        """
+        Start a fresh line-start table for script, which the scanner
+        fills in as it lexes, and record it as a new source, which the
+        locations of this parse refer to.
+        """
+        self.scanner.line_starts = new_line_index()
+        self.parser.source_id = register_source(self.parser.filename,
+                                                self.scanner.line_starts)
+        self.scanner.source_id = self.parser.source_id
 
+    def parse(self, script):
+        """
+        Parse script, either a string or a stream with a read(n) method
+        such as the one returned by scanner.open_source. Streams are
+        scanned chunk by chunk when using the 'scanner' lexer.
+        """
+        self.register(script)
+        feed(self.scanner, script)
+        return self.parser.parse(None,
+                                 lexer=self.scanner,
+                                 tracking=self.track_locations,
+                                 debug=self.dbg_logger)
 
+    def parse_iter(self, script):
+        """
+        Yield each top-level form of script as soon as the parser
+        reduces it, so that a form can be evaluated and dropped before
+        the next one is parsed.
+
+        The parse runs in a worker thread that hands forms over through
+        a small bounded queue; syntax errors are re-raised here.
+        """
+        self.register(script)
+        parser = make_parser(self.parser.filename)
+        parser.source_id = self.parser.source_id
+        parser.track_locations = self.track_locations
+        parser.subtrees = self.subtrees
+        lexer = make_lexer(self.scanner.filename, engine=self.lexer_engine)
+        lexer.line_starts = self.scanner.line_starts
+        lexer.source_id = self.scanner.source_id
+        feed(lexer, script)
+        handover = queue.Queue(maxsize=FORM_BUFFER)
+        cancelled = threading.Event()
+
+        def put(item):
+            while not cancelled.is_set():
+                try:
+                    handover.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+            raise _ParseCancelled()
+
+        def produce():
+            try:
+                parser.parse(None,
+                             lexer=lexer,
+                             tracking=self.track_locations,
+                             debug=self.dbg_logger)
+                put((_END, None))
+            except _ParseCancelled:
+                pass
+            except Exception as e:
+                try:
+                    put((_ERROR, e))
+                except _ParseCancelled:
+                    pass
+
+        parser.form_sink = lambda form: put((_FORM, form))
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                (kind, item) = handover.get()
+                if kind is _FORM:
+                    yield item
+                elif kind is _ERROR:
+                    raise item
+                else:
+                    return
+        finally:
+            cancelled.set()
+            worker.join()
+
+
+FORM_BUFFER = 16
+
+_FORM = 'form'
+_ERROR = 'error'
+_END = 'end'
+
+
+class _ParseCancelled(Exception):
+    pass
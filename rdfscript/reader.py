@@ -1,6 +1,8 @@
 import ply.lex as leex
 import sys
 
+from .location import extend_line_index
+
 tokens = (
      "SYMBOL",
      "BOOLEAN",
@@ -67,7 +69,30 @@ def t_ISA(t):
      t.value = 'is a'
      return t
 
-#Multiline strings can be defined by either triple quotes or () around all quotes with string ending on each line |\(((?:")[\S\s]*?(?:"))*\)
+#Multiline strings are enclosed in triple quotes. Only the opening quotes
+#are matched by the regex, the closing ones are found with a linear search.
+def t_LONGSTRING(t):
+     r'"""'
+     lexer = t.lexer
+     start = lexer.lexpos
+     end = lexer.lexdata.find('"""', start)
+     if end == -1:
+          print("Unterminated string starting at line %d" % t.lineno)
+          return None
+
+     t.type = 'STRING'
+     t.value = lexer.lexdata[start:end]
+     lexer.lexpos = end + 3
+     count_lines(lexer, t.value, start)
+     return t
+
+def count_lines(lexer, text, offset):
+     """Account for the newlines in text, found at offset in the input."""
+     lexer.lineno += text.count('\n')
+     line_starts = getattr(lexer, 'line_starts', None)
+     if line_starts is not None:
+          extend_line_index(line_starts, text, offset)
+
 def t_STRING(t):
     r'(?:").*?(?:")' #\"(\\.|[^"\\])*\"
     t.value = t.value[1:-1]
@@ -75,7 +100,7 @@ def t_STRING(t):
 
 def t_URI(t):
     r'<[^<>]*>'
-    t.value = t.value[1:-1]
+    t.value = sys.intern(t.value[1:-1])
     return t
 
 def t_COMMENT(t):
@@ -84,6 +109,7 @@ def t_COMMENT(t):
 
 def t_SYMBOL(t):
      r'[^\(\)}{=."\'\s\[\],0-9\-]+[^()}{=."\'\s\[\],]*'
+     t.value = sys.intern(t.value)
      t.type = reserved_words.get(t.value, 'SYMBOL')
      return t
 
@@ -99,7 +125,11 @@ def t_INTEGER(t):
 
 def t_newline(t):
      r'[ ]*\n+'
-     t.lexer.lineno += len(t.value)
+     t.lexer.lineno += t.value.count('\n')
+     line_starts = getattr(t.lexer, 'line_starts', None)
+     if line_starts is not None:
+          start = t.lexpos + t.value.index('\n') + 1
+          line_starts.extend(range(start, t.lexpos + len(t.value) + 1))
 
 def t_WS(t):
      r'\s'
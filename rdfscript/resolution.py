@@ -0,0 +1,56 @@
+from .core import Name
+
+# the number of results kept before the cache starts again
+MAX_RESOLUTIONS = 1 << 16
+
+
+class ResolutionCache:
+    """
+    The results of evaluating names in one environment.
+
+    A result is kept under the name, the environment's default
+    namespace and, for names that contain self, the current self. It
+    stands for as long as no symbol is assigned and no prefix is bound,
+    which the environment counts in its symbol and prefix epochs.
+    Results that are themselves names, such as self.x inside a
+    template, are not kept.
+    """
+
+    def __init__(self, max_size=MAX_RESOLUTIONS):
+
+        self._results = {}
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def resolve(self, name, env):
+        """The result of evaluating name in env."""
+        key = (name, env.uri, env.current_self if name.has_self else None)
+        epochs = env.epochs
+
+        found = self._results.get(key)
+        if found is not None and found[0] == epochs:
+            self._hits += 1
+            return found[1]
+
+        self._misses += 1
+        result = name.resolve(env)
+        if not isinstance(result, Name):
+            if len(self._results) >= self._max_size:
+                self._results.clear()
+            self._results[key] = (epochs, result)
+        return result
+
+    def clear(self):
+        self._results.clear()
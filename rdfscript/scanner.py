@@ -0,0 +1,284 @@
+import codecs
+import mmap
+import os
+import re
+import sys
+
+from ply.lex import LexToken
+
+from . import reader
+
+# characters that can never begin a symbol, besides whitespace
+_not_symbol_start = frozenset('()}{=."\'[],-0123456789')
+
+# literals that can begin a symbol (':' and '*') are scanned as symbols
+_literals = frozenset(reader.literals) & _not_symbol_start - frozenset('()')
+
+_symbol_tail = re.compile(r'[^()}{=."\'\s\[\],]*')
+_isa = re.compile(r'is\s+a')
+_isa_prefix = re.compile(r'i(?:s\s*)?')
+_uri_end = re.compile(r'[<>]')
+_double = re.compile(r'\d+\.\d+')
+_integer = re.compile(r'[-]?\d+')
+_number_prefix = re.compile(r'[-]?\d*\.?\d*')
+_spaces = re.compile(r'[ ]*')
+_newlines = re.compile(r'\n+')
+
+CHUNK_SIZE = 1024 * 1024
+
+# returned by Scanner._scan when a token may continue past the window
+_NEED_MORE = object()
+
+
+class Scanner(object):
+    """
+    A single-pass scanner for RDFScript, a drop-in alternative to the
+    PLY lexer built from the reader module.
+
+    The next token is chosen by dispatching on its first character and
+    scanning forward once, instead of trying every rule's regular
+    expression in turn. It produces exactly the token types, values,
+    line numbers and positions that the reader rules do, and calls the
+    reader's t_eof and t_error in the same circumstances.
+
+    Input is either a string, given to input(), or a stream with a
+    read(n) method, given to input_stream(). A stream is scanned
+    through a window that only holds the unconsumed text, so memory
+    does not grow with the size of the input. lexdata and lexpos are
+    relative to the window; token positions are absolute.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+
+        self.lexdata = None
+        self.lexlen = 0
+        self.lexpos = 0
+        self.lineno = 1
+        self.open_brackets = 0
+        self.filename = None
+        self.line_starts = None
+        self.chunk_size = chunk_size
+        self._offset = 0
+        self._stream = None
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexlen = len(data)
+        self.lexpos = 0
+        self._offset = 0
+        self._stream = None
+
+    def input_stream(self, stream):
+        self.input('')
+        self._stream = stream
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def clone(self):
+        c = Scanner()
+        c.__dict__.update(self.__dict__)
+        return c
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+    def _token(self, type, value, lexpos):
+        tok = LexToken()
+        tok.type = type
+        tok.value = value
+        tok.lineno = self.lineno
+        tok.lexpos = self._offset + lexpos
+        tok.lexer = self
+        return tok
+
+    def _refill(self):
+        """
+        Drop the consumed part of the window and read more. The read
+        grows with the window, so a token longer than one chunk is
+        rescanned only a logarithmic number of times.
+        """
+        rest = self.lexdata[self.lexpos:]
+        more = self._stream.read(max(self.chunk_size, len(rest)))
+        if not more:
+            self._stream = None
+
+        self._offset += self.lexpos
+        self.lexdata = rest + more
+        self.lexlen = len(self.lexdata)
+        self.lexpos = 0
+
+    def token(self):
+        tok = self._scan()
+        while tok is _NEED_MORE:
+            self._refill()
+            tok = self._scan()
+
+        return tok
+
+    def _scan(self):
+        data = self.lexdata
+        end = self.lexlen
+        pos = self.lexpos
+        more = self._stream is not None
+
+        while pos < end:
+            c = data[pos]
+
+            if c == '\t':
+                pos += 1
+            elif c == '(':
+                self.lexpos = pos + 1
+                self.open_brackets += 1
+                return self._token('(', c, pos)
+            elif c == ')':
+                self.lexpos = pos + 1
+                self.open_brackets -= 1
+                return self._token(')', c, pos)
+            elif c == ' ' or c == '#':
+                after = _spaces.match(data, pos).end()
+                if after < end and data[after] == '#':
+                    newline = data.find('\n', after)
+                    if newline == -1 and more:
+                        break
+                    pos = end if newline == -1 else newline
+                elif after < end and data[after] == '\n':
+                    pos = self._newlines(data, after)
+                else:
+                    pos = after
+            elif c == '\n':
+                pos = self._newlines(data, pos)
+            elif c == '"' and data.startswith('"""', pos):
+                close = data.find('"""', pos + 3)
+                if close == -1 and more:
+                    break
+                elif close == -1:
+                    print("Unterminated string starting at line %d" % self.lineno)
+                    pos += 3
+                else:
+                    self.lexpos = close + 3
+                    tok = self._token('STRING', data[pos + 3:close], pos)
+                    reader.count_lines(self, tok.value, self._offset + pos + 3)
+                    return tok
+            elif c == '"':
+                if more and data.startswith('""', pos) and pos + 2 == end:
+                    break
+                close = data.find('"', pos + 1)
+                newline = data.find('\n', pos + 1, end if close == -1 else close)
+                if close != -1 and newline == -1:
+                    self.lexpos = close + 1
+                    return self._token('STRING', data[pos + 1:close], pos)
+                elif newline == -1 and more:
+                    break
+                pos = self._error(pos)
+            elif c in _literals:
+                self.lexpos = pos + 1
+                return self._token(c, c, pos)
+            elif c not in _not_symbol_start and not c.isspace():
+                if c == 'i':
+                    m = _isa.match(data, pos)
+                    if m:
+                        self.lexpos = m.end()
+                        return self._token('ISA', 'is a', pos)
+                    elif more and _isa_prefix.fullmatch(data, pos):
+                        break
+                elif c == '<':
+                    m = _uri_end.search(data, pos + 1)
+                    if m and m.group() == '>':
+                        self.lexpos = m.end()
+                        value = sys.intern(data[pos + 1:m.start()])
+                        return self._token('URI', value, pos)
+                    elif not m and more:
+                        break
+
+                tail = _symbol_tail.match(data, pos + 1).end()
+                if tail == end and more:
+                    break
+                value = sys.intern(data[pos:tail])
+                self.lexpos = tail
+                return self._token(reader.reserved_words.get(value, 'SYMBOL'),
+                                   value,
+                                   pos)
+            elif c.isspace():
+                pos += 1
+            else:
+                if more and _number_prefix.match(data, pos).end() == end:
+                    break
+                m = _double.match(data, pos)
+                if m:
+                    self.lexpos = m.end()
+                    return self._token('DOUBLE', float(m.group()), pos)
+                m = _integer.match(data, pos)
+                if m:
+                    self.lexpos = m.end()
+                    return self._token('INTEGER', int(m.group()), pos)
+                pos = self._error(pos)
+
+        self.lexpos = pos
+        if more:
+            return _NEED_MORE
+
+        tok = self._token('eof', '', pos)
+        return reader.t_eof(tok)
+
+    def _newlines(self, data, first):
+        last = _newlines.match(data, first).end()
+        self.lineno += last - first
+        if self.line_starts is not None:
+            self.line_starts.extend(range(self._offset + first + 1,
+                                          self._offset + last + 1))
+        return last
+
+    def _error(self, pos):
+        self.lexpos = pos
+        reader.t_error(self._token('error', self.lexdata[pos], pos))
+        return self.lexpos
+
+
+class MappedText(object):
+    """
+    Text read from a memory-mapped file, decoded incrementally so that
+    only the requested chunk is ever held as a string.
+    """
+
+    def __init__(self, path, encoding='utf-8'):
+
+        self._file = open(path, 'rb')
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._map = None
+        if self._size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def read(self, n):
+        text = ''
+        while not text and self._pos < self._size:
+            chunk = self._map[self._pos:self._pos + n]
+            self._pos += len(chunk)
+            text = self._decoder.decode(chunk, final=self._pos >= self._size)
+
+        return text
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def open_source(path, encoding='utf-8'):
+    """Open the file at path for streaming into a Scanner."""
+    return MappedText(path, encoding=encoding)
@@ -0,0 +1,234 @@
+from collections.abc import MutableMapping
+
+
+class Scope(MutableMapping):
+    """
+    A table of bindings kept in layers, one owned by the script being
+    run and one by each module it imports.
+
+    Writes go to the layer of the module being loaded, and a key is
+    bound to the value it was last given in any layer still loaded.
+    Lookups go through a flattened table of those values, so cost the
+    same however many modules are loaded. A module's layer can be
+    unloaded, or replaced by loading the module again, and snapshot
+    and restore undo everything written in between.
+
+    A fork starts out with every binding of the Scope it came from,
+    beneath all of its own layers, and shares them until either side
+    writes.
+    """
+
+    def __init__(self):
+
+        # the main layer, owned by the script itself, is keyed by None
+        self._layers = {None: {}}
+        self._loading = [None]
+        self._flat = {}
+        # the layers that bound each key, the last to bind it last
+        self._writers = {}
+
+        # the bindings forked from, and whether a fork shares _flat
+        self._base = {}
+        self._shared = False
+
+        # while a snapshot is open, how to undo each change
+        self._journal = []
+        self._snapshots = []
+
+    def __getitem__(self, key):
+        value = self._flat.get(key, _missing)
+        if value is _missing:
+            return self._base[key]
+        return value
+
+    def __setitem__(self, key, value):
+        self._put(self._loading[-1], key, value)
+
+    def __delitem__(self, key):
+        """Unbind key in the layer being loaded, uncovering any other."""
+        if key not in self._layers[self._loading[-1]]:
+            raise KeyError(key)
+        self._put(self._loading[-1], key, _missing)
+
+    def __contains__(self, key):
+        return key in self._flat or key in self._base
+
+    def __iter__(self):
+        yield from self._flat
+        for key in self._base:
+            if key not in self._flat:
+                yield key
+
+    def __len__(self):
+        return len(self._base) + sum(1 for key in self._flat
+                                     if key not in self._base)
+
+    def get(self, key, default=None):
+        value = self._flat.get(key, _missing)
+        if value is _missing:
+            return self._base.get(key, default)
+        return value
+
+    @property
+    def modules(self):
+        """The modules with a layer, in the order they were loaded."""
+        return [module for module in self._layers if module is not None]
+
+    @property
+    def loading(self):
+        """The module whose layer is written to, None for the script."""
+        return self._loading[-1]
+
+    def layer(self, module=None):
+        """The bindings made by module alone."""
+        return dict(self._layers[module])
+
+    def enter(self, module):
+        """
+        Write to a fresh layer for module until exit is called,
+        replacing any layer it already has. The keys whose values
+        change are returned.
+        """
+        changed = []
+        if module in self._layers and module not in self._loading:
+            changed = self.unload(module)
+        if module not in self._layers:
+            self._make(module)
+        self._loading.append(module)
+        return changed
+
+    def exit(self):
+        """Go back to writing to the layer of the importing module."""
+        if len(self._loading) == 1:
+            raise ValueError("no module is being loaded")
+        self._loading.pop()
+
+    def unload(self, module):
+        """Remove module's layer. The keys whose values change are returned."""
+        if module is None or module not in self._layers:
+            raise KeyError(module)
+        if module in self._loading:
+            raise ValueError("%s is still being loaded" % module)
+
+        changed = list(self._layers[module])
+        for key in changed:
+            self._put(module, key, _missing)
+        self._drop(module)
+        return changed
+
+    def fork(self):
+        """
+        A Scope with the bindings this one has now and no layers of
+        its own. Neither sees what the other binds afterwards.
+        """
+        scope = Scope()
+        if not self._flat:
+            scope._base = self._base
+        elif not self._base:
+            scope._base = self._flat
+            self._shared = True
+        else:
+            scope._base = dict(self._base)
+            scope._base.update(self._flat)
+        return scope
+
+    def snapshot(self):
+        """
+        A token for the bindings as they are now, which restore goes
+        back to. Taking one costs nothing, but every change until it is
+        restored or released is journaled.
+        """
+        token = (len(self._journal), tuple(self._loading))
+        self._snapshots.append(token)
+        return token
+
+    def restore(self, token):
+        """
+        Undo every change made since token was taken, along with any
+        later snapshots. The keys whose values change are returned.
+        """
+        index = self._snapshots.index(token)
+        (length, loading) = token
+
+        changed = set()
+        while len(self._journal) > length:
+            entry = self._journal.pop()
+            if entry[0] == 'put':
+                (_, module, key, value, writers) = entry
+                layer = self._layers[module]
+                if value is _missing:
+                    del layer[key]
+                else:
+                    layer[key] = value
+                if writers:
+                    self._writers[key] = list(writers)
+                else:
+                    self._writers.pop(key, None)
+                self._uncover(key)
+                changed.add(key)
+            elif entry[0] == 'make':
+                del self._layers[entry[1]]
+            else:
+                self._layers[entry[1]] = {}
+
+        self._loading = list(loading)
+        del self._snapshots[index:]
+        self._trim()
+        return changed
+
+    def release(self, token):
+        """Give up token, and any snapshot taken after it."""
+        index = self._snapshots.index(token)
+        del self._snapshots[index:]
+        self._trim()
+
+    def _trim(self):
+        if not self._snapshots:
+            self._journal = []
+
+    def _put(self, module, key, value):
+        """Bind key to value in module's layer, or unbind if _missing."""
+        layer = self._layers[module]
+        writers = self._writers.get(key)
+        if self._snapshots:
+            self._journal.append(('put', module, key, layer.get(key, _missing),
+                                  tuple(writers) if writers else ()))
+
+        if value is _missing:
+            del layer[key]
+            writers.remove(module)
+        else:
+            layer[key] = value
+            if writers is None:
+                self._writers[key] = [module]
+            elif writers[-1] != module:
+                if module in writers:
+                    writers.remove(module)
+                writers.append(module)
+        self._uncover(key)
+
+    def _uncover(self, key):
+        """Bring the flattened value of key in line with the layers."""
+        if self._shared:
+            self._flat = dict(self._flat)
+            self._shared = False
+
+        writers = self._writers.get(key)
+        if writers:
+            self._flat[key] = self._layers[writers[-1]][key]
+        else:
+            self._writers.pop(key, None)
+            self._flat.pop(key, None)
+
+    def _make(self, module):
+        if self._snapshots:
+            self._journal.append(('make', module))
+        self._layers[module] = {}
+
+    def _drop(self, module):
+        if self._snapshots:
+            self._journal.append(('drop', module))
+        del self._layers[module]
+
+
+_missing = object()
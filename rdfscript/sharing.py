@@ -0,0 +1,71 @@
+from .core import (Name,
+                   Uri,
+                   Value)
+from .template import Property
+
+
+class SubtreeTable:
+    """
+    A hash-consing table of immutable language objects.
+
+    share(node) returns the one object equal to node, so that repeated
+    subexpressions of a script, such as sbol.role = sbol.cdRole.Promoter,
+    are a single tree. Shared objects have no location, so the parser
+    only shares objects whose location no error reports: template
+    names, parameters and arguments are kept as objects of their own.
+    """
+
+    def __init__(self):
+
+        self._nodes = {}
+        self._occurrences = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        return self._nodes.get(node) is node
+
+    @property
+    def occurrences(self):
+        """The number of objects given to share."""
+        return self._occurrences
+
+    def share(self, node):
+        """
+        The shared object equal to node, which becomes the shared object
+        if there is none yet.
+        """
+        if not shareable(node):
+            raise TypeError("cannot share %r" % node)
+
+        self._occurrences += 1
+        return self._nodes.setdefault(node, node)
+
+
+def unshared(node, location):
+    """
+    A Name, Uri or Value equal to node that is an object of its own at
+    location, for an occurrence whose location errors must report.
+    """
+    if isinstance(node, Name):
+        return Name(*node.names, location=location)
+    elif isinstance(node, Uri):
+        return Uri(node.uri, location)
+    elif isinstance(node, Value):
+        return Value(node.value, location, node.datatype, node.language)
+    raise TypeError("cannot unshare %r" % node)
+
+
+def shareable(node):
+    """
+    True if node is an immutable tree that can be shared: a Name, Uri
+    or Value, or a Property whose name and value are.
+    """
+    if isinstance(node, Property):
+        return (isinstance(node.name, _leaves) and
+                isinstance(node.value, _leaves))
+    return isinstance(node, _leaves)
+
+
+_leaves = (Name, Uri, Value)
@@ -9,6 +9,8 @@ from .pragma import (ExtensionPragma)
 
 class Template(Node):
 
+    __slots__ = ('_name', '_parameters', '_extensions', '_body')
+
     def __init__(self, name, parameters, body, location=None):
 
         Node.__init__(self, location)
@@ -123,6 +125,8 @@ class Template(Node):
 
 class Parameter(Node):
 
+    __slots__ = ('_param_name', '_position')
+
     def __init__(self, name_string, position, location=None):
 
         super().__init__(location)
@@ -162,6 +166,8 @@ class Parameter(Node):
 
 class Property(Node):
 
+    __slots__ = ('_name', '_value')
+
     def __init__(self, name, value, location=None):
 
         Node.__init__(self, location)
@@ -173,6 +179,9 @@ class Property(Node):
                 self.name == other.name and
                 self.value == other.value)
 
+    def __hash__(self):
+        return hash((self._name, self._value))
+
     def __str__(self):
         return format("%s = %s\n" % (self.name, self.value))
 
@@ -212,6 +221,8 @@ class Property(Node):
 
 class Expansion(Node):
 
+    __slots__ = ('_template', '_name', '_args', '_extensions', '_body')
+
     def __init__(self, name, template, args, body, location=None):
 
         super().__init__(location)
@@ -252,6 +263,17 @@ class Expansion(Node):
     def template(self):
         return self._template
 
+    @property
+    def template_location(self):
+        """
+        The location of the template name, or of this expansion when the
+        name is a shared object without one.
+        """
+        location = self._template.location
+        if location is None:
+            return self.location
+        return location
+
     @property
     def args(self):
         return self._args
@@ -260,6 +282,10 @@ class Expansion(Node):
     def body(self):
         return self._body
 
+    @property
+    def extensions(self):
+        return self._extensions
+
     def get_extensions(self, env):
         template_uri = self.template.evaluate(env)
 
@@ -283,7 +309,7 @@ class Expansion(Node):
             triples = [marshal(self.args, triple) for triple in triples]
         except KeyError:
             raise TemplateNotFound(self.template.evaluate(
-                context), self.template.location)
+                context), self.template_location)
 
         if self.name is not None:
             triples = replace_self(triples, self.name)
@@ -320,6 +346,8 @@ class Expansion(Node):
 
 class Argument(Node):
 
+    __slots__ = ('_value', '_position')
+
     def __init__(self, value_expr, position, location=None):
 
         super().__init__(location)
@@ -415,31 +443,35 @@ def check_param_is_name(param):
 
 
 def replace_self(triples, replace_with):
-    result = []
-    for triple in triples:
-        (s, p, o) = triple
-        if isinstance(s, Name):
-            s = replace_self_in_name(s, replace_with)
-        if isinstance(p, Name):
-            p = replace_self_in_name(p, replace_with)
-        if isinstance(o, Name):
-            o = replace_self_in_name(o, replace_with)
+    # a name object is often shared by many triples, such as the
+    # subject of every property in a template, so replace each once
+    replaced = {}
 
-        result.append((s, p, o))
+    def replace(name):
+        if not isinstance(name, Name):
+            return name
+        new = replaced.get(id(name))
+        if new is None:
+            new = replace_self_in_name(name, replace_with)
+            replaced[id(name)] = new
+        return new
 
-    return result
+    return [(replace(s), replace(p), replace(o)) for (s, p, o) in triples]
 
 
 def replace_self_in_name(old_name, _with):
     names = old_name.names
+    if not any(isinstance(name, Self) for name in names):
+        return old_name
+
     new_names = []
     for name in names:
-        if name == Self() and isinstance(_with, Name):
+        if not isinstance(name, Self):
+            new_names.append(name)
+        elif isinstance(_with, Name):
             new_names += _with.names
-        elif name == Self():
-            new_names.append(_with)
         else:
-            new_names.append(name)
+            new_names.append(_with)
 
     return Name(*new_names, location=old_name.location)
 
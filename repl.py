@@ -42,6 +42,7 @@ class REPL:
         if not s:
             self.read()
 
+        self.parser.register(s)
         self.reader.input(s)
 
     def evaluate(self):
@@ -2,8 +2,12 @@ import sys
 import argparse
 import logging
 
-from rdfscript.rdfscriptparser import RDFScriptParser
 from rdfscript.env import Env
+from rdfscript.cache import (FormCache,
+                             DEFAULT_MAX_BYTES)
+from rdfscript.imports import import_graph
+from rdfscript.check import check_file
+from rdfscript.passes import PassPipeline
 from repl import REPL
 
 
@@ -12,32 +16,53 @@ def parse_from_file(filepath,
                     optpaths=[],
                     out=None,
                     extensions=[],
-                    debug_lvl=1):
-
-    parser = RDFScriptParser(filename=filepath, debug_lvl=debug_lvl)
-
-    with open(filepath, 'r') as in_file:
-        data = in_file.read()
+                    debug_lvl=1,
+                    cache=None,
+                    passes=None):
 
     env = Env(filename=filepath,
               serializer=serializer,
               paths=optpaths,
-              extensions=extensions)
-    print("---------------------------------- Started Parsing Data -------------------------------------")
-    forms = parser.parse(data)
-    print("Created List of language Objects: \n")
-    for form in forms:
-        print(form)
-    print("---------------------------------- Finished Parsing Data -------------------------------------")
+              extensions=extensions,
+              cache=cache,
+              passes=passes)
     print("---------------------------------- Started Interpret Data -------------------------------------")
-    env.interpret(forms)
+    env.interpret(env.file_forms(filepath, filepath, debug_lvl=debug_lvl))
     print("---------------------------------- Finished Interpret Data -------------------------------------")
+    if passes is not None:
+        for (name, rewritten) in passes.report():
+            print("%s: %d rewritten" % (name, rewritten))
     if not out:
         print(env)
     else:
         with open(out, 'w') as o:
             o.write(str(env))
 
+def print_imports(filepath, optpaths=[], out=None):
+
+    graph = import_graph(filepath, paths=optpaths)
+    lines = []
+    for node in graph.nodes:
+        lines.append("%s %s" % (node.digest, node.path))
+        for (target, path) in node.imports:
+            lines.append("    %s -> %s" % (target, path))
+        for target in node.unresolved:
+            lines.append("    %s (unresolved, line %d)" % (target, target.lineno))
+
+    if not out:
+        print('\n'.join(lines))
+    else:
+        with open(out, 'w') as o:
+            o.write('\n'.join(lines) + '\n')
+
+def check_from_file(filepath, optpaths=[], extensions=[]):
+
+    problems = check_file(filepath, paths=optpaths, extensions=extensions)
+    for problem in problems:
+        print(str(problem))
+    print("%d problems found in %s and its imports" % (len(problems), filepath))
+    return problems
+
 def rdf_repl(serializer='nt',
              out=None,
              optpaths=[],
@@ -62,7 +87,7 @@ def rdfscript_args():
     parser = argparse.ArgumentParser(description="RDFScript interpreter and REPL.")
 
     parser.add_argument('-s', '--serializer', default='nt',
-                        choices=['rdfxml', 'n3', 'turtle', 'sbolxml', 'nt'],
+                        choices=['rdfxml', 'n3', 'turtle', 'sbolxml', 'nt', 'compact'],
                         help="The format into which the graph is serialised")
     parser.add_argument('-p', '--path',
                         help="Additions to the path in which to search for imports",
@@ -79,6 +104,17 @@ def rdfscript_args():
                         choices=[0, 1, 2],
                         help="Controls the amount of debug information generated. 0 is low/none.")
 
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Do not use or update the cache of parsed files")
+    parser.add_argument('-O', '--optimise', action='store_true',
+                        help="Rewrite each form with the optimisation passes before evaluating it")
+    parser.add_argument('--check', action='store_true',
+                        help="Check filename and its imports for problems, without evaluating them")
+    parser.add_argument('--imports', action='store_true',
+                        help="Print the files imported by filename, without evaluating it")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES,
+                        help="Maximum size in bytes of the cache of parsed files")
+
     return  parser.parse_args()
 
 if __name__ == "__main__":
@@ -87,13 +123,26 @@ if __name__ == "__main__":
     args = rdfscript_args()
     extensions = [(ext[0], ext[1]) for ext in args.extensions]
 
-    if args.filename is not None:
+    if args.filename is not None and args.check:
+        problems = check_from_file(args.filename,
+                                   optpaths=args.path,
+                                   extensions=extensions)
+        sys.exit(1 if problems else 0)
+    elif args.filename is not None and args.imports:
+        print_imports(args.filename, optpaths=args.path, out=args.output)
+    elif args.filename is not None:
+        cache = None
+        if not args.no_cache:
+            cache = FormCache(max_bytes=args.cache_size)
+
         parse_from_file(args.filename,
                         serializer=args.serializer,
                         out=args.output,
                         optpaths=args.path,
                         extensions=extensions,
-                        debug_lvl=args.debug_lvl)
+                        debug_lvl=args.debug_lvl,
+                        cache=cache,
+                        passes=PassPipeline() if args.optimise else None)
     else:
         rdf_repl(serializer=args.serializer,
                  out=args.output,
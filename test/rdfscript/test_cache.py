@@ -0,0 +1,114 @@
+import unittest
+import os
+import tempfile
+import shutil
+
+from rdfscript import scanner
+from rdfscript.cache import FormCache, _ast_modules
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.env import Env
+from rdfscript.core import Uri, Value
+
+
+class FormCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache = FormCache(directory=self.dir)
+        self.parser = RDFScriptParser(filename='cached.rdfsh')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_miss_then_hit(self):
+
+        with open("examples/templates.rdfsh") as in_file:
+            text = in_file.read()
+
+        expected = self.parser.parse(text)
+
+        self.assertFalse(os.path.exists(self.cache.path_for(text, 'cached.rdfsh')))
+        self.assertEqual(list(self.cache.forms(text, 'cached.rdfsh')), expected)
+        self.assertTrue(os.path.exists(self.cache.path_for(text, 'cached.rdfsh')))
+        self.assertEqual(list(self.cache.forms(text, 'cached.rdfsh')), expected)
+
+    def test_hit_keeps_location(self):
+
+        list(self.cache.forms('\nx = 1', 'cached.rdfsh'))
+        form = list(self.cache.forms('\nx = 1', 'cached.rdfsh'))[0]
+
+        self.assertEqual(form.file, 'cached.rdfsh')
+        self.assertEqual(form.line, 2)
+
+    def test_key_depends_on_text_and_filename(self):
+
+        key = self.cache.key('x = 1', 'a.rdfsh')
+
+        self.assertEqual(key, self.cache.key('x = 1', 'a.rdfsh'))
+        self.assertNotEqual(key, self.cache.key('x = 2', 'a.rdfsh'))
+        self.assertNotEqual(key, self.cache.key('x = 1', 'b.rdfsh'))
+
+    def test_abandoned_parse_not_cached(self):
+
+        forms = self.cache.forms('a b c', 'cached.rdfsh')
+        next(forms)
+        forms.close()
+
+        self.assertEqual(self.cache.entries(), [])
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_eviction(self):
+
+        cache = FormCache(directory=self.dir, max_bytes=0)
+        list(cache.forms('x = 1', 'cached.rdfsh'))
+
+        self.assertEqual(cache.entries(), [])
+
+    def test_lru_eviction_order(self):
+
+        list(self.cache.forms('x = 1', 'cached.rdfsh'))
+        list(self.cache.forms('y = 2', 'cached.rdfsh'))
+        old = self.cache.path_for('x = 1', 'cached.rdfsh')
+        new = self.cache.path_for('y = 2', 'cached.rdfsh')
+        os.utime(old, (0, 0))
+
+        size = os.path.getsize(new)
+        cache = FormCache(directory=self.dir, max_bytes=size)
+        cache.evict()
+
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+
+    def test_hit_has_own_source(self):
+
+        text = '\n\nx = 1\n\n\nz = 2'
+        parsed = list(self.cache.forms(text, 'same.rdfsh'))
+
+        loading = self.cache.forms(text, 'same.rdfsh')
+        first = next(loading)
+        # a parse under the same filename while the hit is being loaded
+        RDFScriptParser(filename='same.rdfsh').parse('y = 2')
+        second = next(loading)
+
+        self.assertNotEqual(first.location.source_id,
+                            parsed[0].location.source_id)
+        self.assertEqual(second.location.source_id, first.location.source_id)
+        self.assertEqual([first.line, second.line], [3, 6])
+
+    def test_version_covers_scanner(self):
+
+        # files are parsed through the scanner, so a change to it must
+        # invalidate their cached parses
+        self.assertIn(scanner, _ast_modules)
+
+    def test_env_uses_cache(self):
+
+        path = os.path.join(self.dir, 'cached.rdfsh')
+        with open(path, 'w') as out_file:
+            out_file.write('x = 1')
+
+        env = Env(cache=self.cache)
+        env.interpret(env.file_forms(path, 'cached.rdfsh'))
+
+        self.assertEqual(len(self.cache.entries()), 1)
+        self.assertEqual(env.lookup(Uri(env.uri.uri + 'x')), Value(1))
@@ -0,0 +1,148 @@
+import unittest
+import pathlib
+import tempfile
+
+from rdfscript.check import check_file
+from rdfscript.core import Uri
+from rdfscript.error import (FailToImport,
+                             NoSuchExtension,
+                             RDFScriptSyntax,
+                             TemplateNotFound,
+                             UnexpectedType,
+                             WrongNumberOfArguments)
+
+
+class CheckTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, name, text):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return str(path)
+
+    def test_example_files(self):
+
+        for path in ['examples/import.rdfsh',
+                     'examples/templates.rdfsh',
+                     'test/test_files/top.rdfsh']:
+            with self.subTest(path=path):
+                self.assertEqual(check_file(path), [])
+
+    def test_template_not_found(self):
+
+        path = self.write('top.rdfsh',
+                          '@prefix p = <http://eg/>\n@prefix p\n' +
+                          'T(a)(x = a)\n' +
+                          'e is a T(1)\n' +
+                          'f is a U(1)\n' +
+                          'V()(g is a Missing())\n' +
+                          'Later()')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems],
+                         [TemplateNotFound, TemplateNotFound])
+        self.assertEqual(problems[0].template, Uri('http://eg/U'))
+        self.assertEqual(problems[0].location.line, 5)
+        self.assertEqual(problems[1].template, Uri('http://eg/Missing'))
+
+    def test_wrong_number_of_arguments(self):
+
+        path = self.write('top.rdfsh',
+                          'T(a, b)(x = a y = b)\n' +
+                          'e is a T(1)\n' +
+                          'f is a T(1, 2, 3)\n' +
+                          'g is a T(1, 2)(h is a T())')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems],
+                         [WrongNumberOfArguments] * 3)
+        self.assertEqual([(p.expected, p.actual) for p in problems],
+                         [(2, 1), (2, 3), (2, 0)])
+
+    def test_unknown_extension(self):
+
+        path = self.write('top.rdfsh',
+                          'T()(@extension AtLeastOne(x)\n' +
+                          '    @extension Nonsense(x))\n' +
+                          'e is a T()(@extension Other())')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems], [NoSuchExtension] * 2)
+        self.assertEqual([p.name for p in problems], ['Nonsense', 'Other'])
+
+    def test_imports(self):
+
+        self.write('lib/templates.rdfsh', 'T(a)(x = a)\ne is a T()')
+        path = self.write('top.rdfsh',
+                          'use <lib/templates>\n' +
+                          'use <missing>\n' +
+                          'f is a T(1)\n' +
+                          'use <lib/templates>')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems],
+                         [WrongNumberOfArguments, FailToImport])
+        self.assertEqual(problems[0].location.filename, 'lib/templates')
+
+    def test_import_restores_namespace(self):
+
+        self.write('lib.rdfsh', '@prefix ex = <http://ex.org/>\n@prefix ex\n')
+        path = self.write('top.rdfsh',
+                          'Y()(<http://a> = <http://b>)\n' +
+                          'use <lib>\n' +
+                          '<http://thing> is a Y()\n')
+
+        self.assertEqual(check_file(path), [])
+
+    def test_syntax_error(self):
+
+        self.write('broken.rdfsh', 'x = = 1')
+        path = self.write('top.rdfsh', 'use <broken>\ne is a T()')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems],
+                         [RDFScriptSyntax, TemplateNotFound])
+
+    def test_parse_error(self):
+
+        path = self.write('top.rdfsh', 't(<a>)(x = 1)\nq is a nope()\n')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems], [UnexpectedType])
+        self.assertEqual(problems[0].location.line, 1)
+
+    def test_parse_error_in_import(self):
+
+        self.write('bad.rdfsh', 't(<a>)(x = 1)')
+        path = self.write('top.rdfsh', 'use <bad>\ne is a T()')
+
+        problems = check_file(path)
+
+        self.assertEqual([type(p) for p in problems],
+                         [UnexpectedType, TemplateNotFound])
+        self.assertEqual(problems[0].location.filename, 'bad')
+
+    def test_import_cycle(self):
+
+        self.write('a.rdfsh', 'use <b>')
+        self.write('b.rdfsh', 'use <a>\nT()')
+        path = self.write('top.rdfsh', 'use <a>\ne is a T()')
+
+        self.assertEqual(check_file(path), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import pickle
 
 from rdfscript.core import Name, Uri, Self, Value
 
@@ -19,10 +20,10 @@ class CoreNameTest(unittest.TestCase):
     def test_name_names(self):
 
         name = Name('first', 'second', 'third')
-        self.assertEqual(name.names, ['first', 'second', 'third'])
+        self.assertEqual(name.names, ('first', 'second', 'third'))
 
         name = Name(Uri('http://test.eg'), Uri('#fragment'))
-        self.assertEqual(name.names, [Uri('http://test.eg'), Uri('#fragment')])
+        self.assertEqual(name.names, (Uri('http://test.eg'), Uri('#fragment')))
 
     def test_name_equal(self):
 
@@ -164,6 +165,42 @@ class CoreNameTest(unittest.TestCase):
         self.assertEqual(Self(), Name(Self()))
         self.assertNotEqual(Name(Self(), 'x'), Self())
 
+    def test_name_segments_concatenate(self):
+
+        self.env.assign(Name('ab').evaluate(self.env), Value(1))
+        self.env.assign(Name('x').evaluate(self.env), Uri('http://eg/'))
+
+        self.assertEqual(Name('a', 'b').evaluate(self.env), Value(1))
+        self.assertEqual(Name('x', 'y', 'z').resolve(self.env), Uri('http://eg/yz'))
+        self.assertEqual(Name('x', 'y').resolve(self.env), Uri('http://eg/y'))
+
+    def test_name_hash(self):
+
+        name1 = Name('first', Uri('http://eg/'), Self())
+        name2 = Name('first', Uri('http://eg/'), Self(), location=True)
+
+        self.assertEqual(hash(name1), hash(name2))
+        self.assertEqual(hash(Name(Self())), hash(Self()))
+        self.assertEqual(len({name1, name2, Name('first')}), 2)
+        self.assertIn(Self(), {Name(Self()): 1})
+
+    def test_name_immutable(self):
+
+        name = Name('first', 'second')
+
+        with self.assertRaises(TypeError):
+            name.names[0] = 'other'
+
+    def test_name_pickle_rehashes(self):
+
+        name = Name('first', Self(), location=True)
+        restored = pickle.loads(pickle.dumps(name))
+
+        self.assertEqual(restored, name)
+        self.assertEqual(hash(restored), hash(name))
+        self.assertIs(restored.names[1], Self())
+        self.assertEqual(restored.location, True)
+
     def test_name_self_in_context(self):
 
         name = Name(Self(), 'name')
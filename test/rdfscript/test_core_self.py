@@ -22,3 +22,10 @@ class TestCoreSelf(unittest.TestCase):
         self.assertEqual(s, n)
         self.assertEqual(n, s)
         self.assertEqual(n, n)
+
+    def test_shared(self):
+
+        self.assertIs(Self(), Self())
+        self.assertIsNot(Self(location=True), Self())
+        self.assertEqual(Self(location=True), Self())
+        self.assertIs(Name(Self()).names[0], Self())
@@ -0,0 +1,78 @@
+import unittest
+import copy
+import pickle
+
+from rdfscript.core import (Name,
+                            Uri,
+                            Value,
+                            Self,
+                            Assignment)
+from rdfscript.pragma import (PrefixPragma,
+                              DefaultPrefixPragma,
+                              ImportPragma,
+                              ExtensionPragma)
+from rdfscript.template import (Template,
+                                Parameter,
+                                Property,
+                                Expansion,
+                                Argument)
+from rdfscript.location import (Position,
+                                Location,
+                                register_source)
+
+
+class CoreSlotsTest(unittest.TestCase):
+
+    def setUp(self):
+        source = register_source('slots', None)
+        self.location = Location(3, source)
+        self.objects = [Name('x', Uri('y'), location=self.location),
+                        Uri('http://eg/', location=self.location),
+                        Value(1, location=self.location),
+                        Self(location=self.location),
+                        Assignment(Name('x'), Value(1), self.location),
+                        PrefixPragma('p', Uri('http://eg/'), self.location),
+                        DefaultPrefixPragma('p', self.location),
+                        ImportPragma(Name(Uri('x')), self.location),
+                        ExtensionPragma('E', [Value(1)], self.location),
+                        Template(Name('t'),
+                                 [Name('a')],
+                                 [Property(Name('x'), Name('a'))],
+                                 location=self.location),
+                        Parameter('a', 0, self.location),
+                        Property(Name('x'), Value(1), self.location),
+                        Expansion(Name('e'),
+                                  Name('t'),
+                                  [Value(1)],
+                                  [ExtensionPragma('E', [])],
+                                  self.location),
+                        Argument(Value(1), 0, self.location)]
+
+    def tearDown(self):
+        None
+
+    def test_no_instance_dict(self):
+
+        for obj in self.objects + [Position(1, 2), self.location]:
+            with self.subTest(type=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_no_new_attributes(self):
+
+        with self.assertRaises(AttributeError):
+            Value(1).extra = True
+
+    def test_pickle_and_copy(self):
+
+        for obj in self.objects:
+            with self.subTest(type=type(obj).__name__):
+                restored = pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+                copied = copy.copy(obj)
+                self.assertEqual(restored.location.offset, 3)
+                self.assertEqual(copied.location, obj.location)
+                self.assertEqual(restored, obj)
+                self.assertEqual(copied, obj)
+
+
+if __name__ == '__main__':
+    unittest.main()
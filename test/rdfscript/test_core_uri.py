@@ -1,7 +1,11 @@
 import unittest
+import gc
+import pickle
 
 import rdflib
-from rdfscript.core import Name, Uri, Self, Value
+from rdfscript import core
+from rdfscript.core import Uri
+from rdfscript.location import Location, source_id
 
 class CoreUriTest(unittest.TestCase):
 
@@ -44,3 +48,57 @@ class CoreUriTest(unittest.TestCase):
         self.assertNotEqual(uri4, uri1)
         self.assertNotEqual(uri4, uri2)
         self.assertNotEqual(uri4, uri3)
+
+    def test_shared(self):
+
+        first = Uri(''.join(['http://eg/', 'shared']))
+        second = Uri(rdflib.URIRef('http://eg/shared'))
+
+        self.assertIs(first, second)
+        self.assertIs(Uri(first), first)
+
+    def test_unused_not_kept(self):
+
+        uri = Uri('http://eg/unused')
+        self.assertIn('http://eg/unused', core._uris)
+
+        del uri
+        gc.collect()
+        self.assertNotIn('http://eg/unused', core._uris)
+
+    def test_location_not_shared(self):
+
+        location = Location(1, source_id('uri'))
+        located = Uri('http://eg/located', location=location)
+
+        self.assertIsNot(located, Uri('http://eg/located'))
+        self.assertEqual(located, Uri('http://eg/located'))
+        self.assertEqual(located.location, location)
+        self.assertIs(Uri(located), Uri('http://eg/located'))
+
+    def test_extend_is_immutable(self):
+
+        uri = Uri('http://eg/')
+        extended = uri.extend(Uri('x'))
+
+        self.assertEqual(uri.uri, 'http://eg/')
+        self.assertEqual(extended, Uri('http://eg/#x'))
+        self.assertIs(uri.extend(Uri('x'), delimiter=''), Uri('http://eg/x'))
+
+    def test_hash(self):
+
+        uri = Uri('http://eg/hash', location=Location(1, source_id('uri')))
+
+        self.assertEqual(hash(uri), hash('http://eg/hash'))
+        self.assertEqual({Uri('http://eg/hash'): 1}[uri], 1)
+
+    def test_pickle(self):
+
+        shared = Uri('http://eg/pickled')
+        location = Location(2, source_id('uri'))
+        located = Uri('http://eg/pickled', location=location)
+
+        self.assertIs(pickle.loads(pickle.dumps(shared)), shared)
+        restored = pickle.loads(pickle.dumps(located))
+        self.assertIsNot(restored, shared)
+        self.assertEqual(restored.location, location)
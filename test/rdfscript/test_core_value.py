@@ -1,6 +1,8 @@
 import unittest
 
-from rdfscript.core import Value
+from rdfscript.core import Value, Uri
+
+xsd = 'http://www.w3.org/2001/XMLSchema#'
 
 class TestCoreValue(unittest.TestCase):
 
@@ -43,3 +45,33 @@ class TestCoreValue(unittest.TestCase):
         self.assertEqual(value1, value2)
         self.assertNotEqual(value1, value3)
         self.assertNotEqual(value3, value4)
+
+    def test_value_datatype(self):
+
+        self.assertEqual(Value(1).datatype, Uri(xsd + 'integer'))
+        self.assertEqual(Value(1.0).datatype, Uri(xsd + 'double'))
+        self.assertEqual(Value(True).datatype, Uri(xsd + 'boolean'))
+        self.assertEqual(Value("string").datatype, None)
+        self.assertEqual(Value("string", language='en').datatype, None)
+
+    def test_value_lexical(self):
+
+        self.assertEqual(Value(1).lexical, '1')
+        self.assertEqual(Value(True).lexical, 'true')
+        self.assertEqual(Value("string").lexical, 'string')
+
+    def test_value_hash(self):
+
+        values = {Value(1), Value(True), Value(1.0), Value("1")}
+        self.assertEqual(len(values), 4)
+
+        self.assertEqual(hash(Value(1)), hash(Value(1, location=True)))
+        self.assertIn(Value(True), values)
+
+    def test_value_typed_equal(self):
+
+        self.assertEqual(Value("1", datatype=Uri(xsd + 'integer')), Value(1))
+        self.assertNotEqual(Value(1), Value(True))
+        self.assertNotEqual(Value("chat", language='en'),
+                            Value("chat", language='fr'))
+        self.assertNotEqual(Value("chat", language='en'), Value("chat"))
@@ -1,4 +1,6 @@
 import unittest
+import pathlib
+import tempfile
 
 from rdfscript.rdfscriptparser import RDFScriptParser
 from rdfscript.env import Env
@@ -25,6 +27,110 @@ class EnvTest(unittest.TestCase):
 
         self.assertTrue('prefix' in [p for (p, n) in self.env._rdf._g.namespaces()])
 
+    def test_name_for_uri(self):
+
+        self.env.bind_prefix('eg', Uri('http://eg/'))
+        self.env.bind_prefix('deep', Uri('http://eg/deep/'))
+
+        for uri in [Uri('http://eg/deep/x'),
+                    Uri('http://eg/y'),
+                    Uri('http://eg/deep/'),
+                    Uri('http://eg/1x'),
+                    Uri('http://eg/self'),
+                    Uri('http://unbound/z')]:
+            name = self.env.name_for_uri(uri)
+            self.assertEqual(name.evaluate(self.env), uri)
+
+        self.assertEqual(self.env.name_for_uri(Uri('http://eg/deep/x')),
+                         Name('deep', 'x'))
+        self.assertEqual(self.env.name_for_uri(Uri('http://eg/1x')),
+                         Name(Uri('http://eg/1x')))
+
+    def test_import_layers(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            lib = pathlib.Path(directory) / 'lib.rdfsh'
+            lib.write_text('@prefix eg = <http://eg/>\n@prefix eg\nx = 1\ny = 2\n')
+            env = Env(paths=[pathlib.Path(directory)])
+            env.bind_prefix('eg', Uri('http://eg/'))
+
+            self.assertTrue(env.eval_import(Uri('lib')))
+            self.assertEqual(env.modules, [lib.resolve()])
+            self.assertEqual(env.lookup(Uri('http://eg/x')), Value(1))
+            self.assertEqual(Name(Uri('http://eg/'), 'y').evaluate(env), Value(2))
+
+            lib.write_text('@prefix eg = <http://eg/>\n@prefix eg\ny = 3\n')
+            self.assertTrue(env.eval_import(Uri('lib')))
+            self.assertIsNone(env.lookup(Uri('http://eg/x')))
+            self.assertEqual(Name(Uri('http://eg/'), 'y').evaluate(env), Value(3))
+
+            env.unload(lib.resolve())
+            self.assertEqual(env.modules, [])
+            self.assertIsNone(env.lookup(Uri('http://eg/y')))
+            self.assertEqual(Name(Uri('http://eg/'), 'y').evaluate(env),
+                             Uri('http://eg/y'))
+            self.assertNotIn('http://eg/y', env.symbols)
+
+    def test_fork(self):
+
+        self.env.bind_prefix('eg', Uri('http://eg/'))
+        self.env.prefix = 'eg'
+        self.env.assign(Uri('http://eg/x'), Value(1))
+        self.env.assign_template(Uri('http://eg/t'), [])
+        self.env.add_triples([(Uri('http://eg/s'), Uri('http://eg/p'), Value(2))])
+
+        child = self.env.fork()
+        self.assertEqual(child._rdf.triples, [])
+        self.assertEqual(child.prefix, 'eg')
+        self.assertEqual(child.prefixes, self.env.prefixes)
+        self.assertEqual(Name('x').evaluate(child), Value(1))
+        self.assertEqual(child.lookup_template(Uri('http://eg/t')), [])
+
+        child.assign(Uri('http://eg/y'), Value(3))
+        child.bind_prefix('other', Uri('http://other/'))
+        self.env.assign(Uri('http://eg/z'), Value(4))
+
+        self.assertEqual(Name('y').evaluate(child), Value(3))
+        self.assertEqual(Name('z').evaluate(child), Uri('http://eg/z'))
+        self.assertEqual(Name('y').evaluate(self.env), Uri('http://eg/y'))
+        self.assertEqual(Name('z').evaluate(self.env), Value(4))
+        self.assertNotIn('other', self.env.prefixes)
+        self.assertEqual(len(self.env._rdf.triples), 1)
+
+    def test_fork_without_prefix(self):
+
+        script = 'T(a)(<http://p> = a)\nv = <http://v>\n'
+        self.env.interpret(self.parser.parse(script))
+
+        child = self.env.fork()
+        self.assertEqual(child.uri, self.env.uri)
+        self.assertEqual(Name('v').evaluate(child), Uri('http://v'))
+
+        design = '<http://d> is a T(1)\n'
+        child.interpret(self.parser.parse(design))
+        self.assertEqual(len(self.env._rdf.triples), 0)
+
+        self.env.interpret(self.parser.parse(design))
+        self.assertEqual(child._rdf.triples, self.env._rdf.triples)
+        self.assertEqual(len(child._rdf.triples), 1)
+
+    def test_snapshot_restore(self):
+
+        self.env.bind_prefix('eg', Uri('http://eg/'))
+        self.env.assign(Uri('http://eg/x'), Value(0))
+        snapshot = self.env.snapshot()
+
+        self.env.prefix = 'eg'
+        self.env.assign(Uri('http://eg/x'), Value(1))
+        self.env.assign(Uri('http://eg/y'), Value(2))
+        self.assertEqual(Name('y').evaluate(self.env), Value(2))
+
+        self.env.restore(snapshot)
+        self.assertIsNone(self.env.prefix)
+        self.assertEqual(self.env.lookup(Uri('http://eg/x')), Value(0))
+        self.assertEqual(Name(Uri('http://eg/'), 'y').evaluate(self.env),
+                         Uri('http://eg/y'))
+
     def test_get_and_set_default_prefix(self):
 
         prefix = 'x'
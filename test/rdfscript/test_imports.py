@@ -0,0 +1,120 @@
+import unittest
+import hashlib
+import pathlib
+import tempfile
+
+from rdfscript.imports import (ImportTarget,
+                               scan_imports,
+                               import_graph)
+
+
+class ScanImportsTest(unittest.TestCase):
+
+    def setUp(self):
+        None
+
+    def tearDown(self):
+        None
+
+    def test_no_imports(self):
+
+        self.assertEqual(scan_imports('x = 1\n"use" # use <y>\n'), [])
+
+    def test_uri_targets(self):
+
+        targets = scan_imports('@use <a>\nx = 1\nuse <b/c>.<.rdfsh>')
+
+        self.assertEqual([t.filename for t in targets], ['a', 'b/c.rdfsh'])
+        self.assertEqual([t.lineno for t in targets], [1, 3])
+        self.assertFalse(any(t.dynamic for t in targets))
+
+    def test_dynamic_targets(self):
+
+        targets = scan_imports('use names\nuse p.<x> use self')
+
+        self.assertEqual([str(t) for t in targets], ['names', 'p.<x>', 'self'])
+        self.assertTrue(all(t.dynamic for t in targets))
+        self.assertIsNone(targets[0].filename)
+
+    def test_target_ends_at_next_form(self):
+
+        targets = scan_imports('use <a> <b>.c = 1\nuse <d>.')
+
+        self.assertEqual(targets, [ImportTarget([('URI', 'a')], 1),
+                                   ImportTarget([('URI', 'd')], 2)])
+
+    def test_unbalanced_brackets(self):
+
+        self.assertEqual([t.filename for t in scan_imports('t(\nuse <a>')],
+                         ['a'])
+
+
+class ImportGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, name, text):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return path.resolve()
+
+    def test_test_files(self):
+
+        graph = import_graph('test/test_files/top.rdfsh')
+
+        top = pathlib.Path('test/test_files/top.rdfsh').resolve()
+        this = pathlib.Path('test/test_files/thislevel.rdfsh').resolve()
+        down = pathlib.Path('test/test_files/down/thislevel.rdfsh').resolve()
+
+        self.assertEqual(graph.root, top)
+        self.assertEqual(list(graph), [this, down, top])
+        self.assertEqual([path for (t, path) in graph[top].imports],
+                         [this, down])
+        self.assertEqual(graph.dependencies(top), {this, down})
+        self.assertEqual(graph[this].digest,
+                         hashlib.sha256(this.read_bytes()).hexdigest())
+
+    def test_search_path(self):
+
+        top = self.write('top.rdfsh', 'use <lib>\nuse <missing>\nuse name')
+        lib = self.write('libs/lib.rdfsh', 'use <helper>')
+        helper = self.write('libs/helper.rdfsh', 'x = 1')
+
+        graph = import_graph(top, paths=[self.root / 'libs'])
+
+        self.assertEqual(list(graph), [helper, lib, top])
+        self.assertEqual([str(t) for t in graph[top].unresolved],
+                         ['<missing>', 'name'])
+        self.assertEqual(graph.dependencies(lib), {helper})
+
+    def test_found_beside_importer(self):
+
+        top = self.write('top.rdfsh', 'use <sub/lib>')
+        lib = self.write('sub/lib.rdfsh', 'use <helper>')
+        helper = self.write('sub/helper.rdfsh', '')
+
+        graph = import_graph(top)
+
+        self.assertIn(helper, graph)
+        self.assertEqual(graph.dependencies(top), {lib, helper})
+
+    def test_cycle(self):
+
+        a = self.write('a.rdfsh', 'use <b>')
+        b = self.write('b.rdfsh', 'use <a>')
+
+        graph = import_graph(a)
+
+        self.assertEqual(list(graph), [b, a])
+        self.assertEqual(graph.dependencies(a), {b})
+        self.assertEqual(graph.dependencies(b), {a})
+
+
+if __name__ == '__main__':
+    unittest.main()
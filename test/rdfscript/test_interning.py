@@ -0,0 +1,48 @@
+import unittest
+
+from rdfscript.rdfscriptparser import (RDFScriptParser,
+                                       LEXER_ENGINES)
+from rdfscript.core import (Name,
+                            Uri)
+
+
+class InterningTest(unittest.TestCase):
+
+    def setUp(self):
+        None
+
+    def tearDown(self):
+        None
+
+    def test_repeated_symbols_shared(self):
+
+        for engine in LEXER_ENGINES:
+            with self.subTest(engine=engine):
+                parser = RDFScriptParser(lexer=engine)
+                forms = parser.parse('sbol.role\nsbol.role')
+
+                self.assertIs(forms[0].names[0], forms[1].names[0])
+                self.assertIs(forms[0].names[1], forms[1].names[1])
+
+    def test_repeated_uris_shared(self):
+
+        for engine in LEXER_ENGINES:
+            with self.subTest(engine=engine):
+                parser = RDFScriptParser(lexer=engine)
+                forms = parser.parse('<http://eg/a>\n<http://eg/a>')
+
+                self.assertIs(forms[0].names[0].uri, forms[1].names[0].uri)
+
+    def test_name_segments_interned(self):
+
+        first = Name(''.join(['pa', 'rt']))
+        second = Name(''.join(['p', 'art']))
+
+        self.assertIs(first.names[0], second.names[0])
+        self.assertEqual(first, second)
+
+    def test_extended_uri_interned(self):
+
+        first = Uri('http://eg/').extend(Uri('x'), delimiter='')
+
+        self.assertIs(first.uri, Uri('http://eg/x').uri)
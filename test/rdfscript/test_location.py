@@ -0,0 +1,161 @@
+import unittest
+import pickle
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.location import (Location,
+                                SOURCE_BITS,
+                                line_index,
+                                location_id,
+                                location_of,
+                                register_source,
+                                source_id)
+from rdfscript.core import Name
+from rdfscript.error import (RDFScriptSyntax,
+                             PrefixError)
+
+
+class LocationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = RDFScriptParser(filename='location.rdfsh')
+
+    def tearDown(self):
+        None
+
+    def test_line_and_column(self):
+
+        forms = self.parser.parse('a\n  b\n\n    c')
+
+        self.assertEqual([f.line for f in forms], [1, 2, 4])
+        self.assertEqual([f.location.col_on_line for f in forms], [0, 2, 4])
+        self.assertEqual([f.col for f in forms], [0, 4, 11])
+        self.assertEqual(forms[2].file, 'location.rdfsh')
+
+    def test_syntax_error_location(self):
+
+        with self.assertRaises(RDFScriptSyntax) as cm:
+            self.parser.parse('a\nb = = c')
+
+        self.assertEqual(cm.exception.location.line, 2)
+        self.assertEqual(cm.exception.location.col_on_line, 4)
+        self.assertIn('on line: 2 at position: 4', str(cm.exception))
+
+    def test_repl_filename(self):
+
+        location = Location(0, register_source(None, line_index('x')))
+
+        self.assertEqual(location.filename, 'REPL')
+        self.assertEqual(location.line, 1)
+
+    def test_register_again_new_source(self):
+
+        first = register_source('again.rdfsh', line_index('a'))
+        second = register_source('again.rdfsh', line_index('a\nb'))
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(source_id('again.rdfsh'), second)
+        self.assertEqual(Location(2, second).line, 2)
+        self.assertEqual(Location(0, first).line, 1)
+
+    def test_earlier_parse_keeps_lines(self):
+
+        first = RDFScriptParser().parse('\n\n\n\nx = 1')
+        RDFScriptParser().parse('y = 2')
+
+        self.assertEqual(first[0].line, 5)
+
+    def test_pickle_by_filename(self):
+
+        register_source('pickled.rdfsh', line_index('a\nb'))
+        location = Location(2, source_id('pickled.rdfsh'))
+
+        restored = pickle.loads(pickle.dumps(location))
+
+        self.assertEqual(restored.filename, 'pickled.rdfsh')
+        self.assertEqual(restored.line, 2)
+
+    def test_no_tracking(self):
+
+        parser = RDFScriptParser(filename='untracked.rdfsh',
+                                 track_locations=False)
+        forms = parser.parse('a = b\nt()(x = 1)')
+
+        self.assertIsNone(forms[0].location)
+        self.assertIsNone(forms[0].name.location)
+        self.assertIsNone(forms[1].body[0].value.location)
+        self.assertIsNone(forms[0].line)
+        self.assertEqual(forms, self.parser.parse('a = b\nt()(x = 1)'))
+
+    def test_no_tracking_iter(self):
+
+        parser = RDFScriptParser(track_locations=False)
+        forms = list(parser.parse_iter('a\nb'))
+
+        self.assertEqual([f.location for f in forms], [None, None])
+
+    def test_line_index(self):
+
+        self.assertEqual(list(line_index('a\n\nbc\n')), [0, 2, 3, 6])
+
+    def test_lexer_builds_line_index(self):
+
+        self.parser.parse('a  \n\n  b\n')
+        source = self.parser.parser.source_id
+
+        self.assertEqual(list(self.parser.scanner.line_starts),
+                         list(line_index('a  \n\n  b\n')))
+        self.assertEqual(Location(8, source).line, 3)
+
+    def test_many_errors_no_file(self):
+
+        forms = self.parser.parse('\n'.join(['x%d' % n for n in range(0, 2000)]))
+
+        self.assertEqual(forms[1999].line, 2000)
+        self.assertEqual(forms[1999].location.col_on_line, 0)
+
+    def test_location_ids(self):
+
+        source = source_id('columns.rdfsh')
+        stored = location_id(Location(5, source))
+
+        self.assertIsInstance(stored, int)
+        self.assertEqual(location_of(stored), Location(5, source))
+        self.assertIs(location_id(Location(5, source)), stored)
+        self.assertIsNone(location_id(None))
+        self.assertIsNone(location_of(None))
+
+        with self.assertRaises(TypeError):
+            location_id(5)
+
+    def test_location_ids_packed(self):
+
+        source = source_id('packed.rdfsh')
+        for offset in [0, 1, 2 ** 40]:
+            location = Location(offset, source)
+            self.assertEqual(location_of(location_id(location)), location)
+
+        unpackable = Location(3, 1 << SOURCE_BITS)
+        self.assertIs(location_id(unpackable), unpackable)
+
+    def test_node_location_view(self):
+
+        location = Location(3, source_id('columns.rdfsh'))
+        name = Name('x', location=location)
+
+        self.assertIsNot(name.location, location)
+        self.assertEqual(name.location, location)
+        self.assertEqual(name.col, 3)
+        self.assertEqual(name.file, 'columns.rdfsh')
+
+        restored = pickle.loads(pickle.dumps(name))
+        self.assertEqual(restored.location, location)
+
+    def test_parent_shares_location_id(self):
+
+        forms = self.parser.parse('x = 1')
+
+        self.assertIs(forms[0]._location, forms[0].name._location)
+
+    def test_error_without_location(self):
+
+        self.assertIn('Prefix Error', str(PrefixError('p', None)))
@@ -0,0 +1,75 @@
+import unittest
+import os
+
+from rdfscript.rdfscriptparser import (RDFScriptParser,
+                                       make_lexer,
+                                       make_parser,
+                                       master_lexer,
+                                       master_parser)
+
+
+class ParserFactoryTest(unittest.TestCase):
+
+    def setUp(self):
+        None
+
+    def tearDown(self):
+        None
+
+    def test_parsers_share_tables(self):
+
+        first = make_parser('first.rdfsh')
+        second = make_parser('second.rdfsh')
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.action, second.action)
+        self.assertIs(first.goto, second.goto)
+        self.assertIs(master_parser(), master_parser())
+
+    def test_parser_clone_filename(self):
+
+        first = make_parser('first.rdfsh')
+        second = make_parser('second.rdfsh')
+
+        self.assertEqual(first.filename, 'first.rdfsh')
+        self.assertEqual(second.filename, 'second.rdfsh')
+
+    def test_lexers_share_master(self):
+
+        first = make_lexer('first.rdfsh')
+        second = make_lexer('second.rdfsh')
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.lexre, master_lexer().lexre)
+
+    def test_lexer_clone_state(self):
+
+        first = make_lexer('first.rdfsh')
+        first.open_brackets = 3
+        first.lineno = 10
+
+        second = make_lexer('second.rdfsh')
+
+        self.assertEqual(second.open_brackets, 0)
+        self.assertEqual(second.lineno, 1)
+        self.assertEqual(second.filename, 'second.rdfsh')
+        self.assertEqual(first.filename, 'first.rdfsh')
+
+    def test_locations_use_own_filename(self):
+
+        first = RDFScriptParser(filename='first.rdfsh')
+        second = RDFScriptParser(filename='second.rdfsh')
+
+        a = first.parse('a')[0]
+        b = second.parse('\nb')[0]
+
+        self.assertEqual(a.file, 'first.rdfsh')
+        self.assertEqual(b.file, 'second.rdfsh')
+        self.assertEqual(b.line, 2)
+
+    def test_no_tables_in_cwd(self):
+
+        RDFScriptParser(filename='any.rdfsh').parse('x = 1')
+
+        self.assertFalse(os.path.exists('parser.out'))
+        self.assertFalse(os.path.exists('parsetab.py'))
@@ -0,0 +1,53 @@
+import unittest
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.env import Env
+from rdfscript.core import (Name,
+                            Uri,
+                            Value)
+from rdfscript.error import RDFScriptSyntax
+
+
+class ParserIterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = RDFScriptParser()
+
+    def tearDown(self):
+        None
+
+    def test_parse_iter_matches_parse(self):
+
+        with open("examples/templates.rdfsh") as in_file:
+            text = in_file.read()
+
+        self.assertEqual(list(self.parser.parse_iter(text)),
+                         self.parser.parse(text))
+
+    def test_parse_iter_empty(self):
+
+        self.assertEqual(list(self.parser.parse_iter('')), [])
+
+    def test_parse_iter_yields_before_error(self):
+
+        forms = self.parser.parse_iter('a\nb\n= = =')
+
+        self.assertEqual(next(forms), Name('a'))
+        with self.assertRaises(RDFScriptSyntax):
+            list(forms)
+
+    def test_parse_iter_abandoned(self):
+
+        script = '\n'.join(['x%d' % n for n in range(0, 1000)])
+        forms = self.parser.parse_iter(script)
+
+        self.assertEqual(next(forms), Name('x0'))
+        forms.close()
+
+    def test_interpret_generator(self):
+
+        env = Env()
+        forms = self.parser.parse_iter('x = 1\ny = x\ny')
+
+        self.assertEqual(env.interpret(forms), Value(1))
+        self.assertEqual(env.lookup(Uri(env.uri.uri + 'y')), Value(1))
@@ -0,0 +1,48 @@
+import unittest
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.core import (Name,
+                            Value)
+from rdfscript.template import Property
+
+
+class ParserListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = RDFScriptParser()
+
+    def tearDown(self):
+        None
+
+    def test_many_forms_in_order(self):
+
+        script = '\n'.join(['x%d' % n for n in range(0, 5000)])
+        forms = self.parser.parse(script)
+
+        self.assertEqual(len(forms), 5000)
+        self.assertEqual(forms[0], Name('x0'))
+        self.assertEqual(forms[-1], Name('x4999'))
+
+    def test_many_body_statements_in_order(self):
+
+        body = ' '.join(['p%d = %d' % (n, n) for n in range(0, 1000)])
+        forms = self.parser.parse('t()(' + body + ')')
+
+        self.assertEqual(len(forms[0].body), 1000)
+        self.assertEqual(forms[0].body[0], Property(Name('p0'), Value(0)))
+        self.assertEqual(forms[0].body[-1], Property(Name('p999'), Value(999)))
+
+    def test_long_exprlist_in_order(self):
+
+        args = ', '.join(['%d' % n for n in range(0, 1000)])
+        forms = self.parser.parse('e is a t(' + args + ')')
+
+        self.assertEqual([arg.value for arg in forms[0].args],
+                         [Value(n) for n in range(0, 1000)])
+
+    def test_deeply_dotted_name_in_order(self):
+
+        names = ['n%d' % n for n in range(0, 1000)]
+        forms = self.parser.parse('.'.join(names))
+
+        self.assertEqual(forms[0], Name(*names))
@@ -0,0 +1,192 @@
+import unittest
+import contextlib
+import io
+import logging
+
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.env import Env
+from rdfscript.core import (Name,
+                            Uri)
+from rdfscript.template import Expansion
+from rdfscript.passes import (PassPipeline,
+                              ResolvePrefixedNames,
+                              DropEmptyExpansions)
+
+
+class PassesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = RDFScriptParser()
+
+    def tearDown(self):
+        None
+
+    def rewrite(self, script, passes=None, env=None):
+        pipeline = PassPipeline(passes)
+        forms = list(pipeline.run(self.parser.parse(script), env))
+        return (forms, dict(pipeline.report()))
+
+    def test_fold_uri_names(self):
+
+        (forms, report) = self.rewrite('<http://a/>\n<http://a/>.<b>')
+
+        self.assertEqual(forms, [Uri('http://a/'), Uri('http://a/b')])
+        self.assertEqual(report['fold-uri-names'], 2)
+
+    def test_fold_keeps_location(self):
+
+        (forms, report) = self.rewrite('x\n<http://a/>')
+
+        self.assertEqual(forms[1].line, 2)
+
+    def test_fold_not_bound_uri(self):
+
+        (forms, report) = self.rewrite('<http://a/> = <http://b/>\n<http://a/>.<c>')
+
+        self.assertEqual(forms[0].name, Uri('http://a/'))
+        self.assertEqual(forms[1], Name(Uri('http://a/'), Uri('c')))
+        self.assertEqual(report['fold-uri-names'], 2)
+
+    def test_resolve_prefixed_names(self):
+
+        (forms, report) = self.rewrite('@prefix p = <http://eg/>\np.x.<y>\nq.x\np')
+
+        self.assertEqual(forms[1], Uri('http://eg/xy'))
+        self.assertEqual(forms[2], Name('q', 'x'))
+        self.assertEqual(forms[3], Name('p'))
+        self.assertEqual(report['resolve-prefixed-names'], 1)
+
+    def test_resolve_builtin_prefix(self):
+
+        (forms, report) = self.rewrite('rdf.type', [ResolvePrefixedNames()])
+        self.assertEqual(forms, [Name('rdf', 'type')])
+
+        (forms, report) = self.rewrite('rdf.type', env=Env())
+        self.assertEqual(forms,
+                         [Uri('http://www.w3.org/1999/02/22-rdf-syntax-ns#type')])
+
+    def test_prefix_rebound(self):
+
+        script = '@prefix p = <http://a/>\n@prefix p = <http://b/>\np.x\nq.x'
+        (forms, report) = self.rewrite(script)
+
+        self.assertEqual(forms[2], Uri('http://a/x'))
+        self.assertEqual(forms[3], Name('q', 'x'))
+
+    def test_namespace_moved(self):
+
+        script = '@prefix p = <http://a/>\n@prefix q = <http://a/>\np.x\nq.x'
+        (forms, report) = self.rewrite(script)
+
+        self.assertEqual(forms[2], Name('p', 'x'))
+        self.assertEqual(forms[3], Uri('http://a/x'))
+
+    def test_assigned_names_not_resolved(self):
+
+        script = '@prefix p = <http://a/>\np.x = <http://b/>\np.x.y'
+        (forms, report) = self.rewrite(script)
+
+        self.assertEqual(forms[1].name, Uri('http://a/x'))
+        self.assertEqual(forms[2], Name('p', 'x', 'y'))
+
+    def test_import_is_opaque(self):
+
+        script = '@prefix p = <http://a/>\nuse <x>\np.x'
+        (forms, report) = self.rewrite(script)
+
+        self.assertEqual(forms[2], Name('p', 'x'))
+
+    def test_nested_pragma_is_opaque(self):
+
+        script = 'x = @prefix p = <http://a/>\np.x'
+        forms = list(PassPipeline().run(self.parser.parse(script)))
+
+        self.assertEqual(forms[1], Name('p', 'x'))
+
+    def test_drop_empty_expansions(self):
+
+        script = ('Empty()\n' +
+                  'T()(Empty() x = 1)\n' +
+                  'e is a T()(Empty() Other() y = 2)')
+        (forms, report) = self.rewrite(script, env=Env())
+
+        self.assertEqual(len(forms[1].body), 1)
+        self.assertEqual(len(forms[2].body), 2)
+        self.assertIsInstance(forms[2].body[0], Expansion)
+        self.assertEqual(report['drop-empty-expansions'], 2)
+
+    def test_keep_expansions_with_bodies(self):
+
+        script = 'Empty()\nT()(Empty()(x = 1))\nEmpty()(x = 1)\nU()(Empty())'
+        (forms, report) = self.rewrite(script, [DropEmptyExpansions()], Env())
+
+        self.assertEqual(len(forms[1].body), 1)
+        self.assertEqual(len(forms[3].body), 1)
+        self.assertEqual(report['drop-empty-expansions'], 0)
+
+    def test_unchanged_forms_not_rebuilt(self):
+
+        forms = self.parser.parse('T(a)(x = a)\ne is a T(1)')
+        rewritten = list(PassPipeline().run(forms))
+
+        self.assertIs(rewritten[0], forms[0])
+        self.assertIs(rewritten[1], forms[1])
+
+
+class PassesEvaluationTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def triples(self, path, passes):
+        env = Env(filename=path, paths=[], passes=passes)
+        with contextlib.redirect_stdout(io.StringIO()):
+            env.interpret(env.file_forms(path, path))
+
+        # the graph of each environment has its own identifier
+        return set(tuple(str(part).replace(env.uri.uri, 'env:')
+                         for part in triple)
+                   for triple in env._rdf._g)
+
+    def test_same_graphs(self):
+
+        files = ['examples/advanced.rdfsh',
+                 'examples/import.rdfsh',
+                 'examples/names.rdfsh',
+                 'examples/prefix.rdfsh',
+                 'examples/templates.rdfsh',
+                 'test/test_files/top.rdfsh']
+
+        pipeline = PassPipeline()
+        for path in files:
+            with self.subTest(path=path):
+                self.assertEqual(self.triples(path, pipeline),
+                                 self.triples(path, None))
+
+        self.assertTrue(all(rewritten > 0 for (name, rewritten)
+                            in pipeline.report()[:2]))
+
+    def test_same_graph_with_empty_templates(self):
+
+        script = ('@prefix p = <http://eg/>\n@prefix p\n' +
+                  'Empty()\nT(v)(p.x = v Empty())\n' +
+                  'e is a T(1)(Empty() p.y = <http://eg/z>)')
+
+        graphs = []
+        pipeline = PassPipeline()
+        for passes in [None, pipeline]:
+            env = Env(passes=passes)
+            with contextlib.redirect_stdout(io.StringIO()):
+                env.interpret(RDFScriptParser().parse(script))
+            graphs.append(set(env._rdf._g))
+
+        self.assertEqual(graphs[0], graphs[1])
+        self.assertEqual(len(graphs[0]), 2)
+        self.assertEqual(dict(pipeline.report())['drop-empty-expansions'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
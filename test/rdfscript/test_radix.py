@@ -0,0 +1,100 @@
+import unittest
+
+from rdfscript.radix import RadixTree
+
+
+class RadixTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = RadixTree()
+        for key in ['http://eg/a', 'http://eg/ab', 'http://eg/abc', 'http://other/']:
+            self.tree.insert(key, key.upper())
+
+    def tearDown(self):
+        None
+
+    def test_get(self):
+
+        self.assertEqual(self.tree.get('http://eg/ab'), 'HTTP://EG/AB')
+        self.assertIsNone(self.tree.get('http://eg/'))
+        self.assertIsNone(self.tree.get('http://eg/abcd'))
+        self.assertEqual(self.tree.get('missing', 1), 1)
+        self.assertIn('http://other/', self.tree)
+        self.assertEqual(len(self.tree), 4)
+
+    def test_insert_splits_edges(self):
+
+        self.tree.insert('http://e', 1)
+        self.tree.insert('', 2)
+
+        self.assertEqual(self.tree.get('http://e'), 1)
+        self.assertEqual(self.tree.get(''), 2)
+        self.assertEqual(self.tree.get('http://eg/abc'), 'HTTP://EG/ABC')
+        self.assertEqual(len(self.tree), 6)
+
+    def test_replace(self):
+
+        self.tree.insert('http://eg/a', 1)
+
+        self.assertEqual(self.tree.get('http://eg/a'), 1)
+        self.assertEqual(len(self.tree), 4)
+
+    def test_advance(self):
+
+        position = self.tree.find('http://eg/')
+        self.assertIsNone(self.tree.value(position))
+
+        position = self.tree.advance(position, 'a')
+        self.assertEqual(self.tree.value(position), 'HTTP://EG/A')
+
+        position = self.tree.advance(position, 'bc')
+        self.assertEqual(self.tree.value(position), 'HTTP://EG/ABC')
+
+        self.assertIsNone(self.tree.advance(position, 'd'))
+        self.assertIsNone(self.tree.advance(None, 'd'))
+        self.assertIsNone(self.tree.find('http://x'))
+
+    def test_remove(self):
+
+        self.tree.remove('http://eg/ab')
+
+        self.assertIsNone(self.tree.get('http://eg/ab'))
+        self.assertEqual(self.tree.get('http://eg/abc'), 'HTTP://EG/ABC')
+        self.assertEqual(len(self.tree), 3)
+        with self.assertRaises(KeyError):
+            self.tree.remove('http://eg/ab')
+
+    def test_iter(self):
+
+        self.assertEqual(dict(self.tree),
+                         {key: key.upper() for key in
+                          ['http://eg/a', 'http://eg/ab', 'http://eg/abc', 'http://other/']})
+
+    def test_longest_prefix(self):
+
+        self.assertEqual(self.tree.longest_prefix('http://eg/abcdef'),
+                         ('http://eg/abc', 'HTTP://EG/ABC'))
+        self.assertEqual(self.tree.longest_prefix('http://eg/a#x'),
+                         ('http://eg/a', 'HTTP://EG/A'))
+        self.assertEqual(self.tree.longest_prefix('http://eg/'), (None, None))
+
+    def test_fork(self):
+
+        fork = self.tree.fork()
+        fork.insert('http://eg/abd', 1)
+        fork.remove('http://eg/a')
+        self.tree.insert('http://eg/', 2)
+
+        self.assertEqual(fork.get('http://eg/abd'), 1)
+        self.assertIsNone(fork.get('http://eg/a'))
+        self.assertIsNone(fork.get('http://eg/'))
+        self.assertEqual(len(fork), 4)
+
+        self.assertIsNone(self.tree.get('http://eg/abd'))
+        self.assertEqual(self.tree.get('http://eg/a'), 'HTTP://EG/A')
+        self.assertEqual(self.tree.get('http://eg/'), 2)
+        self.assertEqual(len(self.tree), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ import unittest
 import rdflib
 
 from rdfscript.core import Uri, Value
-from rdfscript.rdf_data import RDFData
+from rdfscript.rdf_data import RDFData, RECENT_TERMS
 
 class RDFDataTest(unittest.TestCase):
 
@@ -35,6 +35,28 @@ class RDFDataTest(unittest.TestCase):
         self.assertEqual(rdflib.Literal("String"), data.to_rdf(Value("String", None)))
         self.assertEqual(rdflib.Literal(True), data.to_rdf(Value(True, None)))
         self.assertEqual(rdflib.Literal(0.12345), data.to_rdf(Value(0.12345, None)))
+        self.assertEqual(rdflib.Literal("chat", lang='fr'),
+                         data.to_rdf(Value("chat", language='fr')))
+        self.assertEqual(rdflib.Literal("1", datatype=rdflib.XSD.integer),
+                         data.to_rdf(Value("1", datatype=Uri(rdflib.XSD.integer))))
+
+    def test_to_rdf_cached(self):
+
+        data = RDFData()
+        value = Value("1")
+        literal = data.to_rdf(value)
+
+        self.assertIs(data.to_rdf(value), literal)
+        self.assertEqual(data.to_rdf(Value("1")), literal)
+        self.assertNotEqual(data.to_rdf(Value(1)), literal)
+
+    def test_recent_terms_bounded(self):
+
+        data = RDFData()
+        for i in range(RECENT_TERMS + 10):
+            data.to_rdf(Value('sequence %d' % i))
+
+        self.assertLessEqual(len(data._recent_terms), RECENT_TERMS)
 
     def test_from_rdf(self):
 
@@ -44,6 +66,20 @@ class RDFDataTest(unittest.TestCase):
         self.assertEqual(Value(42, None), data.from_rdf(rdflib.Literal(42)))
         self.assertEqual(Value(False, None), data.from_rdf(rdflib.Literal(False)))
         self.assertEqual(Value("String", None), data.from_rdf(rdflib.Literal("String")))
+        self.assertEqual(Value("chat", language='fr'),
+                         data.from_rdf(rdflib.Literal("chat", lang='fr')))
+
+    def test_literal_round_trip(self):
+
+        data = RDFData()
+        literals = [rdflib.Literal(1),
+                    rdflib.Literal("1"),
+                    rdflib.Literal("chat", lang='fr'),
+                    rdflib.Literal("x", datatype=rdflib.URIRef('http://eg/type'))]
+
+        for literal in literals:
+            with self.subTest(literal=literal):
+                self.assertEqual(data.to_rdf(data.from_rdf(literal)), literal)
 
     def test_add(self):
 
@@ -70,6 +106,27 @@ class RDFDataTest(unittest.TestCase):
         prefixes = list(data._g.namespaces())
         self.assertTrue(('test_prefix', rdflib.URIRef('http://prefix.org/#')) in prefixes)
 
+    def test_prefix_index_follows_graph(self):
+
+        data = RDFData()
+        binds = [('a', 'http://eg/a#'),
+                 ('b', 'http://eg/b#'),
+                 ('a', 'http://eg/other#'),
+                 ('c', 'http://eg/a#'),
+                 ('a', 'http://eg/a#'),
+                 ('owl', 'http://eg/owl#'),
+                 ('rdfs2', 'http://www.w3.org/2000/01/rdf-schema#'),
+                 ('b', 'http://eg/b#')]
+
+        for (prefix, namespace) in binds:
+            data.bind_prefix(prefix, Uri(namespace))
+
+            bound = {p: Uri(str(n)) for (p, n) in data._g.namespaces()}
+            self.assertEqual(data.prefixes, bound)
+            for (p, uri) in bound.items():
+                self.assertEqual(data.uri_for_prefix(p), uri)
+                self.assertEqual(data.prefix_for_uri(uri), p)
+
     def test_uri_for_prefix(self):
 
         data = RDFData()
@@ -86,5 +143,63 @@ class RDFDataTest(unittest.TestCase):
 
         self.assertEqual(data.prefix_for_uri(Uri('http://prefix.org/#', None)), 'test_prefix')
 
+    def test_compact(self):
+
+        data = RDFData()
+        data.bind_prefix('eg', Uri('http://eg/'))
+        data.bind_prefix('deep', Uri('http://eg/deep/'))
+
+        self.assertEqual(data.compact(Uri('http://eg/deep/x')), ('deep', 'x'))
+        self.assertEqual(data.compact(Uri('http://eg/deeper')), ('eg', 'deeper'))
+        self.assertEqual(data.compact(Uri('http://eg/')), ('eg', ''))
+        self.assertIsNone(data.compact(Uri('http://unbound/x')))
+
+    def test_compact_follows_rebinding(self):
+
+        data = RDFData()
+        data.bind_prefix('eg', Uri('http://eg/'))
+        data.bind_prefix('deep', Uri('http://eg/deep/'))
+        data.bind_prefix('deep', Uri('http://eg/elsewhere/'))
+
+        self.assertEqual(data.compact(Uri('http://eg/deep/x')),
+                         (data.prefix_for_uri(Uri('http://eg/deep/')), 'x'))
+
+        data.bind_prefix('moved', Uri('http://eg/'))
+        self.assertEqual(data.compact(Uri('http://eg/y')), ('moved', 'y'))
+
+    def test_fork(self):
+
+        data = RDFData()
+        data.bind_prefix('eg', Uri('http://eg/'))
+        data.bind_prefix('owl', Uri('http://eg/owl#'))
+        data.add(Uri('http://eg/s'), Uri('http://eg/p'), Value(1))
+
+        fork = data.fork()
+        self.assertEqual(len(fork._g), 0)
+        self.assertEqual(fork.prefixes, data.prefixes)
+        self.assertEqual(set(fork._g.namespaces()), set(data._g.namespaces()))
+
+        fork.bind_prefix('deep', Uri('http://eg/deep/'))
+        self.assertEqual(fork.compact(Uri('http://eg/deep/x')), ('deep', 'x'))
+        self.assertEqual(data.compact(Uri('http://eg/deep/x')), ('eg', 'deep/x'))
+
+    def test_write_compact(self):
+
+        data = RDFData(serializer='compact')
+        data.bind_prefix('eg', Uri('http://eg/'))
+        data.add(Uri('http://eg/s'), Uri('http://eg/p'), Value('o'))
+        data.add(Uri('http://eg/s'), Uri('http://eg/p'), Uri('http://other/o'))
+        data.add(Uri('http://eg/s'), Uri('http://eg/p'), Uri('http://eg/no/good'))
+
+        text = data.serialise()
+
+        self.assertIn('@prefix eg: <http://eg/> .', text)
+        self.assertIn('eg:s eg:p "o" .', text)
+        self.assertIn('eg:s eg:p <http://other/o> .', text)
+        self.assertIn('eg:s eg:p <http://eg/no/good> .', text)
+
+        graph = rdflib.Graph().parse(data=text, format='turtle')
+        self.assertEqual(set(graph), set(data._g))
+
 
 
@@ -61,6 +61,43 @@ class ReaderStringTest(unittest.TestCase):
         self.assertEqual(second_token.value, "String number two")
         self.assertEqual(second_token.type, 'STRING')
 
+    def test_string_multiline(self):
+        self.reader.input('"""first\n"second"\n\nthird""" after')
+        token = self.reader.token()
+        after = self.reader.token()
+
+        self.assertEqual(token.value, 'first\n"second"\n\nthird')
+        self.assertEqual(token.type, 'STRING')
+        self.assertEqual(token.lineno, 1)
+        self.assertEqual(after.value, 'after')
+        self.assertEqual(after.lineno, 4)
+
+    def test_string_multiline_empty(self):
+        self.reader.input('"""""" x')
+        token = self.reader.token()
+
+        self.assertEqual(token.value, '')
+        self.assertEqual(token.type, 'STRING')
+        self.assertEqual(self.reader.token().value, 'x')
+
+    def test_string_multiline_line_starts(self):
+        self.reader.lineno = 1
+        self.reader.open_brackets = 0
+        self.reader.line_starts = []
+        self.reader.input('x """a\nb\n"""\ny')
+        values = [token.value for token in self.reader]
+
+        self.assertEqual(values, ['x', 'a\nb\n', 'y'])
+        self.assertEqual(self.reader.line_starts, [7, 9, 13])
+        self.assertEqual(self.reader.lineno, 4)
+
+    def test_string_multiline_unterminated(self):
+        self.reader.input('"""never closed')
+        token = self.reader.token()
+
+        self.assertEqual(token.value, 'never')
+        self.assertEqual(token.type, 'SYMBOL')
+
 
 if __name__ == '__main__':
     unittest.main()
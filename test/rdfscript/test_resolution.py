@@ -0,0 +1,95 @@
+import unittest
+
+from rdfscript.core import (Name,
+                            Uri,
+                            Self,
+                            Value)
+from rdfscript.env import Env
+from rdfscript.resolution import ResolutionCache
+
+
+class ResolutionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.env = Env()
+        self.env.bind_prefix('p', Uri('http://eg/p/'))
+        self.env.bind_prefix('q', Uri('http://eg/q/'))
+        self.env.prefix = 'p'
+        self.resolutions = self.env.resolutions
+
+    def tearDown(self):
+        None
+
+    def test_hits_and_misses(self):
+
+        name = Name('q', 'role')
+
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/q/role'))
+        self.assertEqual(Name('q', 'role').evaluate(self.env),
+                         Uri('http://eg/q/role'))
+        self.assertEqual((self.resolutions.hits, self.resolutions.misses), (1, 1))
+
+    def test_assign_invalidates(self):
+
+        name = Name('x')
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/p/x'))
+
+        self.env.assign(Uri('http://eg/p/x'), Value(1))
+
+        self.assertEqual(name.evaluate(self.env), Value(1))
+        self.assertEqual(self.resolutions.hits, 0)
+
+    def test_bind_prefix_invalidates(self):
+
+        name = Name('r', 'x')
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/p/rx'))
+
+        self.env.bind_prefix('r', Uri('http://eg/r/'))
+
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/r/x'))
+
+    def test_default_prefix_in_key(self):
+
+        name = Name('x')
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/p/x'))
+
+        self.env.prefix = 'q'
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/q/x'))
+
+        self.env.prefix = 'p'
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/p/x'))
+        self.assertEqual(self.resolutions.hits, 1)
+
+    def test_self_in_key(self):
+
+        name = Name(Self(), 'x')
+
+        self.env.current_self = Uri('http://eg/a')
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/ax'))
+
+        self.env.current_self = Uri('http://eg/b')
+        self.assertEqual(name.evaluate(self.env), Uri('http://eg/bx'))
+
+        self.env.current_self = Uri('http://eg/a')
+        name.evaluate(self.env)
+        self.assertEqual(self.resolutions.hits, 1)
+
+    def test_names_not_kept(self):
+
+        self.env.current_self = Name(Self())
+
+        self.assertEqual(Name(Self(), 'x').evaluate(self.env), Name(Self(), 'x'))
+        self.assertEqual(len(self.resolutions), 0)
+
+    def test_max_size(self):
+
+        resolutions = ResolutionCache(max_size=2)
+        for n in range(5):
+            resolutions.resolve(Name('x%d' % n), self.env)
+
+        self.assertLessEqual(len(resolutions), 2)
+        self.assertEqual(resolutions.misses, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
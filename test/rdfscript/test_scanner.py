@@ -0,0 +1,162 @@
+import unittest
+import io
+import os
+import pathlib
+import tempfile
+
+from rdfscript.rdfscriptparser import (RDFScriptParser,
+                                       make_lexer)
+from rdfscript.scanner import (Scanner,
+                               open_source)
+
+
+def tokens(engine, text):
+    lexer = make_lexer(engine=engine)
+    lexer.input(text)
+    result = []
+    token = lexer.token()
+    while token is not None:
+        result.append((token.type, token.value, token.lineno, token.lexpos))
+        token = lexer.token()
+
+    return (result, list(lexer.line_starts), lexer.open_brackets)
+
+
+class ScannerEquivalenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        None
+
+    def assertSameTokens(self, text):
+        self.assertEqual(tokens('scanner', text), tokens('ply', text))
+
+    def test_example_files(self):
+
+        files = (sorted(pathlib.Path('examples').glob('**/*.rdfsh')) +
+                 sorted(pathlib.Path('test/test_files').glob('**/*.rdfsh')))
+        self.assertTrue(files)
+
+        for path in files:
+            with self.subTest(path=str(path)):
+                self.assertSameTokens(path.read_text())
+
+    def test_tricky_input(self):
+
+        snippets = ['is a',
+                    'is\n\n a isa is abc this',
+                    'x = "string" "unterminated\n"next"',
+                    '<http://a.b/#c> <unclosed <a\nb> <<x>',
+                    '  # comment\n   \n\n  x  #c\n#c',
+                    'start#end #start end#',
+                    '1 1.5 -2 -2.5 1.x - -x 12abc',
+                    '@prefix p = <http://eg/>\n@prefix p\nuse x @use y',
+                    'true false self from @extension E(a, b)',
+                    'a.b.c\t=\r\n{[]}:*,',
+                    "'quoted' \x0bvt  nbsp ٣digit",
+                    'x = """multi\nline\n\n"string"""" y\nz',
+                    '"""""" "" """unterminated\nx',
+                    '']
+
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertSameTokens(snippet)
+
+    def test_brackets(self):
+
+        self.assertSameTokens('t(a, b)(x = 1 y = e(z)())')
+
+
+class ScannerParserTest(unittest.TestCase):
+
+    def test_parse_with_scanner(self):
+
+        with open("examples/templates.rdfsh") as in_file:
+            text = in_file.read()
+
+        scanned = RDFScriptParser(filename='x', lexer='scanner')
+        plain = RDFScriptParser(filename='x')
+
+        self.assertIsInstance(scanned.scanner, Scanner)
+        self.assertEqual(scanned.parse(text), plain.parse(text))
+        self.assertEqual(list(scanned.parse_iter(text)), plain.parse(text))
+
+    def test_unknown_engine(self):
+
+        with self.assertRaises(ValueError):
+            make_lexer(engine='nonsense')
+
+
+class ScannerStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        None
+
+    def stream_tokens(self, text, chunk_size):
+        lexer = make_lexer(engine='scanner')
+        lexer.chunk_size = chunk_size
+        lexer.input_stream(io.StringIO(text))
+        result = [(t.type, t.value, t.lineno, t.lexpos) for t in lexer]
+
+        return (result, list(lexer.line_starts), lexer.open_brackets)
+
+    def test_chunk_boundaries(self):
+
+        files = (sorted(pathlib.Path('examples').glob('**/*.rdfsh')) +
+                 sorted(pathlib.Path('test/test_files').glob('**/*.rdfsh')))
+        texts = [path.read_text() for path in files]
+        texts += ['is\n\n a isa is abc i',
+                  'x = "string" "unterminated\n"next" "',
+                  '<http://a.b/#c> <unclosed <a\nb> <<x> <',
+                  '  # comment\n   \n\n  x  #c\n#c',
+                  '1 1.5 -2 -2.5 1.x - -x 12abc 3.',
+                  "'quoted' \x0bvt  nbsp ٣digit",
+                  'x = """multi\nline\n\n"string"""" y\nz ""',
+                  '"""""" "" """unterminated\nx """']
+
+        for text in texts:
+            for chunk_size in [1, 2, 3, 7, 64]:
+                with self.subTest(text=text[:20], chunk_size=chunk_size):
+                    self.assertEqual(self.stream_tokens(text, chunk_size),
+                                     tokens('ply', text))
+
+    def test_mapped_file(self):
+
+        path = 'examples/templates.rdfsh'
+        with open_source(path) as source:
+            parsed = RDFScriptParser(filename=path, lexer='scanner').parse(source)
+
+        with open(path) as in_file:
+            expected = RDFScriptParser(filename=path).parse(in_file.read())
+
+        self.assertEqual(parsed, expected)
+        self.assertEqual(parsed[-1].line, expected[-1].line)
+
+    def test_mapped_file_multibyte(self):
+
+        with tempfile.NamedTemporaryFile('w', suffix='.rdfsh', delete=False,
+                                         encoding='utf-8') as out:
+            out.write('x = "ééé"\ny = "中文"\n')
+
+        try:
+            with open_source(out.name) as source:
+                lexer = make_lexer(engine='scanner')
+                lexer.chunk_size = 1
+                lexer.input_stream(source)
+                values = [t.value for t in lexer]
+        finally:
+            os.remove(out.name)
+
+        self.assertEqual(values, ['x', '=', 'ééé',
+                                  'y', '=', '中文'])
+
+    def test_ply_reads_stream(self):
+
+        forms = RDFScriptParser().parse(io.StringIO('a b c'))
+
+        self.assertEqual(len(forms), 3)
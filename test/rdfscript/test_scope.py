@@ -0,0 +1,142 @@
+import unittest
+
+from rdfscript.scope import Scope
+
+
+class ScopeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scope = Scope()
+        self.scope['a'] = 1
+        self.scope.enter('lib')
+        self.scope['a'] = 2
+        self.scope['b'] = 3
+        self.scope.exit()
+
+    def tearDown(self):
+        None
+
+    def test_last_write_wins(self):
+
+        self.assertEqual(dict(self.scope), {'a': 2, 'b': 3})
+
+        self.scope['a'] = 4
+
+        self.assertEqual(self.scope['a'], 4)
+        self.assertEqual(self.scope.layer(None), {'a': 4})
+        self.assertEqual(self.scope.layer('lib'), {'a': 2, 'b': 3})
+
+    def test_unload_uncovers(self):
+
+        changed = self.scope.unload('lib')
+
+        self.assertEqual(sorted(changed), ['a', 'b'])
+        self.assertEqual(dict(self.scope), {'a': 1})
+        self.assertEqual(self.scope.modules, [])
+        with self.assertRaises(KeyError):
+            self.scope.unload('lib')
+
+    def test_reload_replaces_layer(self):
+
+        self.scope.enter('lib')
+        self.scope['c'] = 5
+        self.scope.exit()
+
+        self.assertEqual(dict(self.scope), {'a': 1, 'c': 5})
+        self.assertEqual(self.scope.modules, ['lib'])
+
+    def test_nested_modules(self):
+
+        self.scope.enter('outer')
+        self.scope.enter('inner')
+        self.scope['x'] = 1
+        self.assertEqual(self.scope.loading, 'inner')
+        self.scope.exit()
+        self.scope['y'] = 2
+        self.scope.exit()
+
+        self.assertEqual(self.scope.layer('inner'), {'x': 1})
+        self.assertEqual(self.scope.layer('outer'), {'y': 2})
+        self.assertIsNone(self.scope.loading)
+        with self.assertRaises(ValueError):
+            self.scope.exit()
+
+    def test_delete(self):
+
+        del self.scope['a']
+        self.assertEqual(self.scope['a'], 2)
+
+        with self.assertRaises(KeyError):
+            del self.scope['b']
+
+    def test_snapshot_restore(self):
+
+        token = self.scope.snapshot()
+        self.scope['a'] = 10
+        self.scope.unload('lib')
+        self.scope.enter('other')
+        self.scope['z'] = 11
+
+        changed = self.scope.restore(token)
+
+        self.assertEqual(changed, {'a', 'b', 'z'})
+        self.assertEqual(dict(self.scope), {'a': 2, 'b': 3})
+        self.assertEqual(self.scope.layer(None), {'a': 1})
+        self.assertEqual(self.scope.modules, ['lib'])
+        self.assertIsNone(self.scope.loading)
+
+        self.scope.unload('lib')
+        self.assertEqual(dict(self.scope), {'a': 1})
+
+    def test_nested_snapshots(self):
+
+        outer = self.scope.snapshot()
+        self.scope['c'] = 1
+        inner = self.scope.snapshot()
+        self.scope['d'] = 2
+
+        self.scope.restore(inner)
+        self.assertEqual(sorted(self.scope), ['a', 'b', 'c'])
+
+        self.scope.restore(outer)
+        self.assertEqual(sorted(self.scope), ['a', 'b'])
+        with self.assertRaises(ValueError):
+            self.scope.restore(inner)
+
+    def test_release(self):
+
+        token = self.scope.snapshot()
+        self.scope['c'] = 1
+        self.scope.release(token)
+
+        self.assertEqual(self.scope._journal, [])
+        self.assertEqual(self.scope['c'], 1)
+
+    def test_fork(self):
+
+        fork = self.scope.fork()
+        fork['a'] = 5
+        fork['c'] = 6
+        self.scope['d'] = 7
+
+        self.assertEqual(dict(fork), {'a': 5, 'b': 3, 'c': 6})
+        self.assertEqual(len(fork), 3)
+        self.assertEqual(fork.modules, [])
+        self.assertEqual(dict(self.scope), {'a': 2, 'b': 3, 'd': 7})
+
+        del fork['a']
+        self.assertEqual(fork['a'], 2)
+
+    def test_fork_of_fork(self):
+
+        fork = self.scope.fork()
+        fork['c'] = 6
+        grandchild = fork.fork()
+        fork['d'] = 7
+
+        self.assertEqual(dict(grandchild), {'a': 2, 'b': 3, 'c': 6})
+        self.assertNotIn('d', grandchild)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+from rdfscript.core import (Name,
+                            Uri,
+                            Value)
+from rdfscript.template import (Property,
+                                Expansion)
+from rdfscript.sharing import (SubtreeTable,
+                               shareable)
+from rdfscript.rdfscriptparser import RDFScriptParser
+from rdfscript.env import Env
+from rdfscript.error import (TemplateNotFound,
+                             UnexpectedType)
+
+
+class SharingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = RDFScriptParser(filename='sharing', share_subtrees=True)
+
+    def tearDown(self):
+        None
+
+    def test_share(self):
+
+        table = SubtreeTable()
+        first = table.share(Name('x', 'y'))
+        second = table.share(Name('x', 'y'))
+
+        self.assertIs(first, second)
+        self.assertIn(first, table)
+        self.assertNotIn(Name('x', 'y'), table)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.occurrences, 2)
+
+    def test_shareable(self):
+
+        self.assertTrue(shareable(Name('x')))
+        self.assertTrue(shareable(Value(1)))
+        self.assertTrue(shareable(Property(Name('x'), Uri('y'))))
+        self.assertFalse(shareable(Property(Name('x'),
+                                            Expansion(None, Name('t'), [], []))))
+
+        with self.assertRaises(TypeError):
+            SubtreeTable().share(Expansion(None, Name('t'), [], []))
+
+    def test_parse_shares_properties(self):
+
+        forms = self.parser.parse('a is a T()(sbol.role = sbol.cdRole.SgRNA)\n' +
+                                  'b is a T()(sbol.role = sbol.cdRole.SgRNA)')
+
+        (first, second) = [form.body[0] for form in forms]
+        self.assertIs(first, second)
+        self.assertEqual(forms[0].template, forms[1].template)
+        self.assertEqual([form.template.line for form in forms], [1, 2])
+        self.assertIsNot(forms[0], forms[1])
+
+        self.assertIsNone(first.location)
+
+    def test_parse_same_forms(self):
+
+        script = ('@prefix p = <http://eg/>\n' +
+                  '@prefix p\n' +
+                  'T(a)(x = a y = "1" z = <http://eg/z>)\n' +
+                  'e is a T(1)(p.role = p.Promoter)\n' +
+                  'f is a T(1)(p.role = p.Promoter)')
+
+        shared = self.parser.parse(script)
+        unshared = RDFScriptParser(filename='sharing').parse(script)
+
+        self.assertEqual(shared, unshared)
+
+    def test_error_location(self):
+
+        env = Env()
+        forms = self.parser.parse('a = 1\n' +
+                                  'e is a Missing()\n' +
+                                  'f is a Missing()')
+
+        with self.assertRaises(TemplateNotFound) as raised:
+            forms[2].as_triples(env)
+
+        self.assertEqual(raised.exception.location.line, 3)
+
+    def test_template_name_location(self):
+
+        env = Env()
+        forms = self.parser.parse('e is a q.w()\n' +
+                                  '<http://eg/a> is a q.w()')
+
+        with self.assertRaises(TemplateNotFound) as raised:
+            forms[1].as_triples(env)
+
+        self.assertEqual(raised.exception.location.line, 2)
+        self.assertEqual(raised.exception.location.col_on_line, 19)
+
+    def test_parameter_location(self):
+
+        script = 'a.b = 1\nx = a.b\n\nT(a.b)(<http://p> = a.b)'
+
+        with self.assertRaises(UnexpectedType) as raised:
+            self.parser.parse(script)
+
+        self.assertEqual(raised.exception.location.line, 4)
+        self.assertEqual(raised.exception.location.col_on_line, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
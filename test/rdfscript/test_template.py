@@ -718,6 +718,12 @@ class TemplateClassTest(unittest.TestCase):
 
         self.assertEqual(name, Name(Uri('self'), 'name'))
 
+    def test_replace_self_without_self(self):
+
+        name = Name('x', 'name')
+
+        self.assertIs(replace_self_in_name(name, Uri('self')), name)
+
     def test_as_triples_multiple_inheritance(self):
 
         forms = self.parser.parse('s()(a=123)' +